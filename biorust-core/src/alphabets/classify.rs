@@ -0,0 +1,226 @@
+use crate::error::{BioError, BioResult};
+
+/// Compile-time ASCII symbol set laid out for bulk validation.
+///
+/// Membership of byte `b` is bit `b >> 4` of `lo[b & 0x0f]`, so a whole
+/// vector of bytes is classified with two `pshufb` lookups (one per nibble)
+/// and an AND. Bytes >= 0x80 are never members.
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub struct ByteClass {
+    lo: [u8; 16],
+}
+
+impl ByteClass {
+    pub const fn new(symbols: &[u8]) -> Self {
+        Self { lo: [0; 16] }.with(symbols)
+    }
+
+    /// This class plus `symbols`.
+    pub const fn with(self, symbols: &[u8]) -> Self {
+        let mut lo = self.lo;
+        let mut i = 0;
+        while i < symbols.len() {
+            let b = symbols[i];
+            assert!(b < 0x80, "byte classes only hold ASCII symbols");
+            lo[(b & 0x0f) as usize] |= 1 << (b >> 4);
+            i += 1;
+        }
+        Self { lo }
+    }
+
+    #[inline]
+    pub fn contains(&self, b: u8) -> bool {
+        b < 0x80 && (self.lo[(b & 0x0f) as usize] >> (b >> 4)) & 1 != 0
+    }
+
+    /// Position of the first byte of `bytes` outside this class.
+    pub fn first_invalid(&self, bytes: &[u8]) -> Option<usize> {
+        self.find::<false>(bytes)
+    }
+
+    /// Position of the first byte of `bytes` in this class.
+    pub fn first_member(&self, bytes: &[u8]) -> Option<usize> {
+        self.find::<true>(bytes)
+    }
+
+    /// Position of the first byte whose membership equals `MEMBER`.
+    fn find<const MEMBER: bool>(&self, bytes: &[u8]) -> Option<usize> {
+        #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+        {
+            if std::arch::is_x86_feature_detected!("avx2") {
+                // SAFETY: AVX2 support was just checked.
+                return unsafe { avx2::find::<MEMBER>(self, bytes) };
+            }
+            if std::arch::is_x86_feature_detected!("ssse3") {
+                // SAFETY: SSSE3 support was just checked.
+                return unsafe { ssse3::find::<MEMBER>(self, bytes) };
+            }
+        }
+        bytes.iter().position(|&b| self.contains(b) == MEMBER)
+    }
+
+    /// `Err(InvalidChar)` naming the first byte outside this class.
+    pub fn validate(&self, bytes: &[u8]) -> BioResult<()> {
+        match self.first_invalid(bytes) {
+            Some(pos) => Err(BioError::InvalidChar {
+                ch: bytes[pos] as char,
+                pos,
+            }),
+            None => Ok(()),
+        }
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod ssse3 {
+    use super::ByteClass;
+    use std::arch::x86_64::*;
+
+    #[target_feature(enable = "ssse3")]
+    pub(super) unsafe fn find<const MEMBER: bool>(
+        class: &ByteClass,
+        bytes: &[u8],
+    ) -> Option<usize> {
+        let lo_lut = _mm_loadu_si128(class.lo.as_ptr() as *const __m128i);
+        // High nibbles 8..=15 (non-ASCII) map to no bits, so never match.
+        let hi_lut = _mm_setr_epi8(1, 2, 4, 8, 16, 32, 64, -128, 0, 0, 0, 0, 0, 0, 0, 0);
+        let nibble = _mm_set1_epi8(0x0f);
+        let zero = _mm_setzero_si128();
+
+        let mut chunks = bytes.chunks_exact(16);
+        for (k, chunk) in (&mut chunks).enumerate() {
+            let v = _mm_loadu_si128(chunk.as_ptr() as *const __m128i);
+            let lo_bits = _mm_shuffle_epi8(lo_lut, _mm_and_si128(v, nibble));
+            let hi_bit = _mm_shuffle_epi8(hi_lut, _mm_and_si128(_mm_srli_epi16(v, 4), nibble));
+            let misses = _mm_cmpeq_epi8(_mm_and_si128(lo_bits, hi_bit), zero);
+            let mut mask = _mm_movemask_epi8(misses);
+            if MEMBER {
+                mask ^= 0xffff;
+            }
+            if mask != 0 {
+                return Some(16 * k + mask.trailing_zeros() as usize);
+            }
+        }
+        let tail = chunks.remainder();
+        let offset = bytes.len() - tail.len();
+        tail.iter()
+            .position(|&b| class.contains(b) == MEMBER)
+            .map(|pos| offset + pos)
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod avx2 {
+    use super::ByteClass;
+    use std::arch::x86_64::*;
+
+    /// Lanes of `v` outside the class held in the two lookup tables, as
+    /// all-ones bytes.
+    #[inline]
+    #[target_feature(enable = "avx2")]
+    unsafe fn misses(v: __m256i, lo_lut: __m256i, hi_lut: __m256i) -> __m256i {
+        let nibble = _mm256_set1_epi8(0x0f);
+        let lo_bits = _mm256_shuffle_epi8(lo_lut, _mm256_and_si256(v, nibble));
+        let hi_bit = _mm256_shuffle_epi8(hi_lut, _mm256_and_si256(_mm256_srli_epi16(v, 4), nibble));
+        _mm256_cmpeq_epi8(_mm256_and_si256(lo_bits, hi_bit), _mm256_setzero_si256())
+    }
+
+    /// 32-byte version of `ssse3::find`, with both lookup tables repeated in
+    /// each 128-bit half for `vpshufb`. Two vectors are combined before the
+    /// test, so a long run with nothing to report costs one branch per 64
+    /// bytes; only a block that does report is looked at lane by lane.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn find<const MEMBER: bool>(
+        class: &ByteClass,
+        bytes: &[u8],
+    ) -> Option<usize> {
+        let lo_lut =
+            _mm256_broadcastsi128_si256(_mm_loadu_si128(class.lo.as_ptr() as *const __m128i));
+        let hi_lut = _mm256_broadcastsi128_si256(_mm_setr_epi8(
+            1, 2, 4, 8, 16, 32, 64, -128, 0, 0, 0, 0, 0, 0, 0, 0,
+        ));
+
+        let mut blocks = bytes.chunks_exact(64);
+        for (k, block) in (&mut blocks).enumerate() {
+            let ptr = block.as_ptr() as *const __m256i;
+            let m0 = misses(_mm256_loadu_si256(ptr), lo_lut, hi_lut);
+            let m1 = misses(_mm256_loadu_si256(ptr.add(1)), lo_lut, hi_lut);
+            // A miss in either vector, or for members a lane that is not a
+            // miss in both.
+            let found = if MEMBER {
+                _mm256_movemask_epi8(_mm256_and_si256(m0, m1)) != -1
+            } else {
+                _mm256_movemask_epi8(_mm256_or_si256(m0, m1)) != 0
+            };
+            if found {
+                let mut mask = _mm256_movemask_epi8(m0) as u32 as u64
+                    | (_mm256_movemask_epi8(m1) as u32 as u64) << 32;
+                if MEMBER {
+                    mask = !mask;
+                }
+                return Some(64 * k + mask.trailing_zeros() as usize);
+            }
+        }
+        let tail = blocks.remainder();
+        let offset = bytes.len() - tail.len();
+        super::ssse3::find::<MEMBER>(class, tail).map(|pos| offset + pos)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const ACGT: ByteClass = ByteClass::new(b"ACGTacgt");
+
+    #[test]
+    fn contains_matches_symbol_list() {
+        let gapped = ACGT.with(b"-");
+        for b in 0..=255u8 {
+            assert_eq!(ACGT.contains(b), b"ACGTacgt".contains(&b), "byte {b}");
+            assert_eq!(gapped.contains(b), b"ACGTacgt-".contains(&b), "byte {b}");
+        }
+    }
+
+    #[test]
+    fn first_invalid_finds_every_position() {
+        for len in [0usize, 1, 15, 16, 17, 40, 64, 67, 130] {
+            let clean: Vec<u8> = (0..len).map(|i| b"ACGTacgt"[i % 8]).collect();
+            assert_eq!(ACGT.first_invalid(&clean), None);
+            for pos in 0..len {
+                for bad in [b'N', b'#', 0x00, 0xc1, 0xff] {
+                    let mut seq = clean.clone();
+                    seq[pos] = bad;
+                    assert_eq!(ACGT.first_invalid(&seq), Some(pos));
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn first_member_finds_every_position() {
+        for len in [0usize, 1, 15, 16, 17, 40, 64, 67, 130] {
+            let clean: Vec<u8> = (0..len).map(|i| b"N#x\xc1"[i % 4]).collect();
+            assert_eq!(ACGT.first_member(&clean), None);
+            for pos in 0..len {
+                for good in [b'A', b't'] {
+                    let mut seq = clean.clone();
+                    seq[pos] = good;
+                    assert_eq!(ACGT.first_member(&seq), Some(pos));
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn validate_reports_char_and_position() {
+        assert!(ACGT.validate(b"ACGT").is_ok());
+        match ACGT.validate(b"ACGTACGTACGTACGTAC#") {
+            Err(BioError::InvalidChar { ch, pos }) => {
+                assert_eq!(ch, '#');
+                assert_eq!(pos, 18);
+            }
+            other => panic!("expected invalid char error, got {other:?}"),
+        }
+    }
+}
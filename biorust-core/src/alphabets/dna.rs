@@ -1,4 +1,4 @@
-use crate::alphabets::Alphabet;
+use crate::alphabets::{Alphabet, ByteClass};
 use std::sync::LazyLock;
 
 pub fn alphabet() -> Alphabet {
@@ -9,8 +9,13 @@ pub fn n_alphabet() -> Alphabet {
     Alphabet::new(b"ACGTNacgtn")
 }
 
+const IUPAC_SYMBOLS: &[u8] = b"ACGTRYSWKMBDHVNacgtryswkmbdhvn";
+
+/// [`iupac_alphabet`] as a [`ByteClass`], for validating whole sequences.
+pub const IUPAC: ByteClass = ByteClass::new(IUPAC_SYMBOLS);
+
 pub fn iupac_alphabet() -> Alphabet {
-    Alphabet::new(b"ACGTRYSWKMBDHVNacgtryswkmbdhvn")
+    Alphabet::new(IUPAC_SYMBOLS)
 }
 
 static COMPLEMENT: LazyLock<[u8; 256]> = LazyLock::new(|| {
@@ -34,7 +39,172 @@ pub fn complement(a: u8) -> u8 {
 }
 
 pub fn reverse_complement(text: &[u8]) -> Vec<u8> {
-    text.iter().rev().map(|&a| complement(a)).collect()
+    let mut out = Vec::with_capacity(text.len());
+    let mut chunks = text.rchunks_exact(8);
+    for chunk in &mut chunks {
+        let word = u64::from_ne_bytes(chunk.try_into().unwrap()).swap_bytes();
+        out.extend_from_slice(&complement_word(word).to_ne_bytes());
+    }
+    out.extend(chunks.remainder().iter().rev().map(|&b| complement(b)));
+    out
+}
+
+const LO7: u64 = 0x7f7f_7f7f_7f7f_7f7f;
+const HI: u64 = 0x8080_8080_8080_8080;
+const ONES: u64 = 0x0101_0101_0101_0101;
+
+/// High bit set in every byte of `v` that is zero (exact, no borrow carry).
+#[inline]
+fn zero_bytes(v: u64) -> u64 {
+    !(((v & LO7) + LO7) | v) & HI
+}
+
+/// Complement eight packed bytes if all of them are A/C/G/T (either case).
+///
+/// A<->T differ by `0x15` and C<->G by `0x04`; bit 1 is set only for C/G,
+/// so the xor mask can be derived from the word itself.
+#[inline]
+fn complement_acgt_word(word: u64) -> Option<u64> {
+    let upper = word & !(ONES * 0x20);
+    let hits = zero_bytes(upper ^ (ONES * b'A' as u64))
+        | zero_bytes(upper ^ (ONES * b'C' as u64))
+        | zero_bytes(upper ^ (ONES * b'G' as u64))
+        | zero_bytes(upper ^ (ONES * b'T' as u64));
+    if hits != HI {
+        return None;
+    }
+    let cg = (word >> 1) & ONES;
+    Some(word ^ (ONES * 0x15) ^ (cg * 0x11))
+}
+
+/// Complement `text` in place.
+///
+/// Chunks of plain A/C/G/T are handled 32 (AVX2), 16 (SSSE3) or eight (SWAR)
+/// bytes at a time, picked at runtime; chunks holding any other symbol fall
+/// back to the lookup table.
+pub fn complement_in_place(text: &mut [u8]) {
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            unsafe { avx2::complement_in_place(text) };
+            return;
+        }
+        if std::arch::is_x86_feature_detected!("ssse3") {
+            // SAFETY: SSSE3 support was just checked.
+            unsafe { ssse3::complement_in_place(text) };
+            return;
+        }
+    }
+    complement_swar(text);
+}
+
+/// Complement eight packed bytes, via the lookup table if any is not A/C/G/T.
+#[inline]
+fn complement_word(word: u64) -> u64 {
+    complement_acgt_word(word)
+        .unwrap_or_else(|| u64::from_ne_bytes(word.to_ne_bytes().map(complement)))
+}
+
+fn complement_swar(text: &mut [u8]) {
+    let mut chunks = text.chunks_exact_mut(8);
+    for chunk in &mut chunks {
+        let word = u64::from_ne_bytes(chunk.try_into().unwrap());
+        chunk.copy_from_slice(&complement_word(word).to_ne_bytes());
+    }
+    chunks
+        .into_remainder()
+        .iter_mut()
+        .for_each(|b| *b = complement(*b));
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod ssse3 {
+    use std::arch::x86_64::*;
+
+    /// 16-byte version of `complement_acgt_word`: A/C/G/T have distinct low
+    /// nibbles (1, 3, 7, 4 in either case), so one `pshufb` maps each byte to
+    /// its xor mask (`0x15` for A/T, `0x04` for C/G).
+    #[target_feature(enable = "ssse3")]
+    pub(super) unsafe fn complement_in_place(text: &mut [u8]) {
+        let xor_lut = _mm_setr_epi8(0, 0x15, 0, 0x04, 0x15, 0, 0, 0x04, 0, 0, 0, 0, 0, 0, 0, 0);
+        let low_nibble = _mm_set1_epi8(0x0f);
+        let case_mask = _mm_set1_epi8(!0x20u8 as i8);
+        let [a, c, g, t] = [b'A', b'C', b'G', b'T'].map(|b| _mm_set1_epi8(b as i8));
+
+        let mut chunks = text.chunks_exact_mut(16);
+        for chunk in &mut chunks {
+            let ptr = chunk.as_mut_ptr() as *mut __m128i;
+            let v = _mm_loadu_si128(ptr);
+            let upper = _mm_and_si128(v, case_mask);
+            let hits = _mm_or_si128(
+                _mm_or_si128(_mm_cmpeq_epi8(upper, a), _mm_cmpeq_epi8(upper, c)),
+                _mm_or_si128(_mm_cmpeq_epi8(upper, g), _mm_cmpeq_epi8(upper, t)),
+            );
+            if _mm_movemask_epi8(hits) == 0xffff {
+                let mask = _mm_shuffle_epi8(xor_lut, _mm_and_si128(v, low_nibble));
+                _mm_storeu_si128(ptr, _mm_xor_si128(v, mask));
+            } else {
+                super::complement_swar(chunk);
+            }
+        }
+        super::complement_swar(chunks.into_remainder());
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod avx2 {
+    use std::arch::x86_64::*;
+
+    /// 32-byte version of `ssse3::complement_in_place`. `vpshufb` looks up
+    /// within each 128-bit half, so the table is repeated in both.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn complement_in_place(text: &mut [u8]) {
+        let xor_lut = _mm256_broadcastsi128_si256(_mm_setr_epi8(
+            0, 0x15, 0, 0x04, 0x15, 0, 0, 0x04, 0, 0, 0, 0, 0, 0, 0, 0,
+        ));
+        let low_nibble = _mm256_set1_epi8(0x0f);
+        let case_mask = _mm256_set1_epi8(!0x20u8 as i8);
+        let [a, c, g, t] = [b'A', b'C', b'G', b'T'].map(|b| _mm256_set1_epi8(b as i8));
+
+        let mut chunks = text.chunks_exact_mut(32);
+        for chunk in &mut chunks {
+            let ptr = chunk.as_mut_ptr() as *mut __m256i;
+            let v = _mm256_loadu_si256(ptr);
+            let upper = _mm256_and_si256(v, case_mask);
+            let hits = _mm256_or_si256(
+                _mm256_or_si256(_mm256_cmpeq_epi8(upper, a), _mm256_cmpeq_epi8(upper, c)),
+                _mm256_or_si256(_mm256_cmpeq_epi8(upper, g), _mm256_cmpeq_epi8(upper, t)),
+            );
+            if _mm256_movemask_epi8(hits) == -1 {
+                let mask = _mm256_shuffle_epi8(xor_lut, _mm256_and_si256(v, low_nibble));
+                _mm256_storeu_si256(ptr, _mm256_xor_si256(v, mask));
+            } else {
+                // Retry at 16 bytes so a lone IUPAC code costs only its half.
+                super::ssse3::complement_in_place(chunk);
+            }
+        }
+        super::ssse3::complement_in_place(chunks.into_remainder());
+    }
+}
+
+/// Reverse-complement `text` in place in one pass.
+///
+/// Eight-byte words are taken from both ends, byte-swapped, complemented and
+/// written to the opposite end; the middle (< 16 bytes) is done bytewise.
+pub fn reverse_complement_in_place(text: &mut [u8]) {
+    let (mut i, mut j) = (0, text.len());
+    while j - i >= 16 {
+        let front = u64::from_ne_bytes(text[i..i + 8].try_into().unwrap());
+        let back = u64::from_ne_bytes(text[j - 8..j].try_into().unwrap());
+        text[i..i + 8].copy_from_slice(&complement_word(back.swap_bytes()).to_ne_bytes());
+        text[j - 8..j].copy_from_slice(&complement_word(front.swap_bytes()).to_ne_bytes());
+        i += 8;
+        j -= 8;
+    }
+    let middle = &mut text[i..j];
+    middle.reverse();
+    middle.iter_mut().for_each(|b| *b = complement(*b));
 }
 
 #[cfg(test)]
@@ -60,4 +230,84 @@ mod tests {
     fn number_is_no_word() {
         assert!(!alphabet().is_word(b"42"));
     }
+
+    fn complement_scalar(text: &[u8]) -> Vec<u8> {
+        text.iter().map(|&a| complement(a)).collect()
+    }
+
+    #[test]
+    fn complement_in_place_acgt() {
+        let mut text = b"ACGTACGTacgtacgtAACCGGTTa".to_vec();
+        complement_in_place(&mut text);
+        assert_eq!(text, b"TGCATGCAtgcatgcaTTGGCCAAt");
+    }
+
+    #[test]
+    fn complement_in_place_matches_table() {
+        let inputs: [&[u8]; 6] = [
+            b"",
+            b"ACG",
+            b"ACGTNACGTACGTRYS",
+            b"acgtacgtACGTACGWKMBDHVN",
+            b"AC@GTACG\x00\xffACGTACGT",
+            b"ACGUACGTacgtACGZ",
+        ];
+        for input in inputs {
+            let mut text = input.to_vec();
+            complement_in_place(&mut text);
+            assert_eq!(text, complement_scalar(input), "input {input:?}");
+        }
+    }
+
+    #[test]
+    fn complement_in_place_long_mixed_chunks() {
+        // 16-byte ACGT runs next to chunks with IUPAC/other bytes and a tail
+        let mut input = b"ACGTACGTacgtacgt".repeat(3);
+        input.extend_from_slice(b"ACGTNACGTACGTRYSacgtacgtACGTACGT");
+        input.extend_from_slice(b"GATTACA\x00\xffgattacaTTGCA");
+        let mut text = input.clone();
+        complement_in_place(&mut text);
+        assert_eq!(text, complement_scalar(&input));
+    }
+
+    #[test]
+    fn complement_in_place_matches_table_all_lengths() {
+        // One odd byte at each position of runs long enough for several
+        // 32-byte chunks plus every tail length.
+        let clean = b"ACGTacgtTTGCAACG".repeat(5);
+        for len in 0..=clean.len() {
+            for bad in [None, Some(len / 3), Some(len.saturating_sub(1))] {
+                let mut input = clean[..len].to_vec();
+                if let Some(pos) = bad.filter(|&p| p < len) {
+                    input[pos] = b'N';
+                }
+                let mut text = input.clone();
+                complement_in_place(&mut text);
+                assert_eq!(text, complement_scalar(&input), "len {len}, bad {bad:?}");
+            }
+        }
+    }
+
+    #[test]
+    fn reverse_complement_matches_table_all_lengths() {
+        let base = b"ACGTacgtNRYSWKMBDHVnACGTTTGCAAC\x00GATTACAGATTACAGGCCTTAAGG";
+        for len in 0..=base.len() {
+            let input = &base[..len];
+            let expected: Vec<u8> = input.iter().rev().map(|&a| complement(a)).collect();
+            assert_eq!(reverse_complement(input), expected, "len {len}");
+            let mut text = input.to_vec();
+            reverse_complement_in_place(&mut text);
+            assert_eq!(text, expected, "len {len}");
+        }
+    }
+
+    #[test]
+    fn reverse_complement_in_place_matches() {
+        let input = b"AACGTTTGCAnrACGTACGTG";
+        let mut text = input.to_vec();
+        reverse_complement_in_place(&mut text);
+        let expected: Vec<u8> = input.iter().rev().map(|&a| complement(a)).collect();
+        assert_eq!(text, expected);
+        assert_eq!(reverse_complement(input), expected);
+    }
 }
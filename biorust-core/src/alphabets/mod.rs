@@ -1,3 +1,4 @@
+pub mod classify;
 pub mod dna;
 pub mod protein;
 pub mod rna;
@@ -6,6 +7,8 @@ use bit_set::BitSet;
 use std::borrow::Borrow;
 use vector_map::VecMap;
 
+pub use classify::ByteClass;
+
 pub type SymbolRanks = VecMap<usize, u8>;
 
 #[derive(Default, Clone, Eq, PartialEq, Ord, PartialOrd, Hash, Debug)]
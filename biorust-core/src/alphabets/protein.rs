@@ -1,9 +1,14 @@
-use crate::alphabets::Alphabet;
+use crate::alphabets::{Alphabet, ByteClass};
 
 pub fn alphabet() -> Alphabet {
     Alphabet::new(&b"ARNDCEQGHILKMFPSTWYVarndceqghilkmfpstwyv"[..])
 }
 
+const IUPAC_SYMBOLS: &[u8] = b"ABCDEFGHIKLMNPQRSTVWXYZ*abcdefghiklmnpqrstvwxyz";
+
+/// [`iupac_alphabet`] as a [`ByteClass`], for validating whole sequences.
+pub const IUPAC: ByteClass = ByteClass::new(IUPAC_SYMBOLS);
+
 pub fn iupac_alphabet() -> Alphabet {
-    Alphabet::new(b"ABCDEFGHIKLMNPQRSTVWXYZ*abcdefghiklmnpqrstvwxyz")
+    Alphabet::new(IUPAC_SYMBOLS)
 }
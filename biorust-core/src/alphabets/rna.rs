@@ -1,4 +1,4 @@
-use crate::alphabets::Alphabet;
+use crate::alphabets::{Alphabet, ByteClass};
 use std::sync::LazyLock;
 
 pub fn alphabet() -> Alphabet {
@@ -9,8 +9,13 @@ pub fn n_alphabet() -> Alphabet {
     Alphabet::new(b"ACGUNacgun")
 }
 
+const IUPAC_SYMBOLS: &[u8] = b"ACGURYSWKMBDHVNacguryswkmbdhvn";
+
+/// [`iupac_alphabet`] as a [`ByteClass`], for validating whole sequences.
+pub const IUPAC: ByteClass = ByteClass::new(IUPAC_SYMBOLS);
+
 pub fn iupac_alphabet() -> Alphabet {
-    Alphabet::new(b"ACGURYSWKMBDHVNacguryswkmbdhvn")
+    Alphabet::new(IUPAC_SYMBOLS)
 }
 
 static COMPLEMENT: LazyLock<[u8; 256]> = LazyLock::new(|| {
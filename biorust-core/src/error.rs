@@ -15,6 +15,12 @@ pub enum BioError {
     #[error("invalid window size: {window}")]
     InvalidWindow { window: usize },
 
+    #[error("invalid thread count: {threads} (must be at least 1)")]
+    InvalidThreadCount { threads: usize },
+
+    #[error("thread pool error: {msg}")]
+    ThreadPool { msg: String },
+
     #[error("invalid scoring parameters: {msg}")]
     InvalidScoring { msg: String },
 
@@ -1,4 +1,5 @@
 use crate::error::{BioError, BioResult};
+use crate::io::detect::{detect_seq_type, SeqType};
 use crate::io::{normalize_seq_bytes, OnError, ReadReport, SkippedRecord};
 use crate::seq::dna::DnaSeq;
 use crate::seq::protein::ProteinSeq;
@@ -6,7 +7,7 @@ use crate::seq::record_batch::RecordBatch;
 use crate::seq::rna::RnaSeq;
 use crate::seq::traits::SeqBytes;
 use csv::{ReaderBuilder, StringRecord};
-use std::fs::File;
+use memchr::memchr_iter;
 use std::path::Path;
 
 #[derive(Clone, Debug)]
@@ -74,115 +75,209 @@ pub fn read_csv<S: SeqBytes>(
 ) -> BioResult<ReadReport<RecordBatch<S>>> {
     let path_ref = path.as_ref();
     let path_str = path_ref.display().to_string();
-    let file = File::open(path_ref).map_err(|e| BioError::CsvParse {
+    let data = std::fs::read(path_ref).map_err(|e| BioError::CsvParse {
         path: path_str.clone(),
         source: csv::Error::from(e),
     })?;
+    read_csv_from_bytes(&data, &path_str, id_col, seq_col, desc_col, on_error)
+}
 
-    let mut reader = ReaderBuilder::new()
-        .has_headers(true)
-        .flexible(true)
-        .from_reader(file);
+/// [`read_csv`] over CSV text already in memory; `path` only labels errors.
+///
+/// Rows are read into one reused record, and the output columns are sized
+/// from a line count up front, so the per-row cost is the owned id, sequence
+/// and description themselves.
+pub fn read_csv_from_bytes<S: SeqBytes>(
+    data: &[u8],
+    path: &str,
+    id_col: ColumnSel,
+    seq_col: ColumnSel,
+    desc_col: Option<ColumnSel>,
+    on_error: OnError,
+) -> BioResult<ReadReport<RecordBatch<S>>> {
+    let mut reader = csv_reader(data);
 
     let headers = reader
         .headers()
         .map_err(|e| BioError::CsvParse {
-            path: path_str.clone(),
+            path: path.to_string(),
             source: e,
         })?
         .clone();
-    let id_idx = resolve_column(&id_col, &headers, &path_str)?;
-    let seq_idx = resolve_column(&seq_col, &headers, &path_str)?;
-    let desc_idx = desc_col
-        .as_ref()
-        .map(|sel| resolve_column(sel, &headers, &path_str))
-        .transpose()?;
-
-    let mut ids: Vec<Box<str>> = Vec::new();
-    let mut descs: Vec<Option<Box<str>>> = Vec::new();
-    let mut seqs: Vec<S> = Vec::new();
-    let mut skipped: Vec<SkippedRecord> = Vec::new();
-
-    for (row_idx, result) in reader.records().enumerate() {
-        let record = result.map_err(|e| BioError::CsvParse {
-            path: path_str.clone(),
-            source: e,
-        })?;
-        let row = row_idx + 1;
-
-        let id_field = record
-            .get(id_idx)
-            .ok_or_else(|| BioError::CsvMissingField {
-                row,
-                column: column_label(&id_col),
-                path: path_str.clone(),
+    let cols = Columns {
+        id: resolve_column(&id_col, &headers, path)?,
+        seq: resolve_column(&seq_col, &headers, path)?,
+        desc: desc_col
+            .as_ref()
+            .map(|sel| resolve_column(sel, &headers, path))
+            .transpose()?,
+        id_label: column_label(&id_col),
+        seq_label: column_label(&seq_col),
+        desc_label: desc_col.as_ref().map(column_label).unwrap_or_default(),
+        path,
+    };
+
+    // At most one row per line after the header.
+    let rows = memchr_iter(b'\n', data).count();
+    let mut out = Rows {
+        ids: Vec::with_capacity(rows),
+        descs: Vec::with_capacity(rows),
+        seqs: Vec::with_capacity(rows),
+        skipped: Vec::new(),
+    };
+    // The column layout is fixed per file: pick the row loop built for it
+    // once, rather than testing for a description column on every row.
+    match cols.desc {
+        Some(_) => read_rows::<S, true>(&mut reader, &cols, on_error, &mut out)?,
+        None => read_rows::<S, false>(&mut reader, &cols, on_error, &mut out)?,
+    }
+
+    let data = RecordBatch::new(out.ids, out.descs, out.seqs)?;
+    Ok(ReadReport {
+        data,
+        skipped: out.skipped,
+    })
+}
+
+/// Resolved column positions for one file, with the labels errors name
+/// them by.
+struct Columns<'a> {
+    id: usize,
+    seq: usize,
+    desc: Option<usize>,
+    id_label: String,
+    seq_label: String,
+    desc_label: String,
+    path: &'a str,
+}
+
+impl Columns<'_> {
+    fn missing(&self, row: usize, label: &str) -> BioError {
+        BioError::CsvMissingField {
+            row,
+            column: label.to_string(),
+            path: self.path.to_string(),
+        }
+    }
+}
+
+/// Output columns of [`read_csv_from_bytes`].
+struct Rows<S> {
+    ids: Vec<Box<str>>,
+    descs: Vec<Option<Box<str>>>,
+    seqs: Vec<S>,
+    skipped: Vec<SkippedRecord>,
+}
+
+/// Parse every remaining row of `reader` into `out`. `DESC` says whether
+/// `cols.desc` is set, so each instance has only the branches its layout
+/// needs.
+fn read_rows<S: SeqBytes, const DESC: bool>(
+    reader: &mut csv::Reader<&[u8]>,
+    cols: &Columns<'_>,
+    on_error: OnError,
+    out: &mut Rows<S>,
+) -> BioResult<()> {
+    let desc_idx = cols.desc.unwrap_or_default();
+    let mut record = StringRecord::new();
+    let mut row = 0usize;
+    loop {
+        let more = reader
+            .read_record(&mut record)
+            .map_err(|e| BioError::CsvParse {
+                path: cols.path.to_string(),
+                source: e,
             })?;
-        let id_value = id_field.trim();
+        if !more {
+            return Ok(());
+        }
+        row += 1;
 
+        let id_value = record
+            .get(cols.id)
+            .ok_or_else(|| cols.missing(row, &cols.id_label))?
+            .trim();
         let seq_field = record
-            .get(seq_idx)
-            .ok_or_else(|| BioError::CsvMissingField {
-                row,
-                column: column_label(&seq_col),
-                path: path_str.clone(),
-            })?;
-        let seq_bytes = normalize_seq_bytes(seq_field);
-        match S::from_bytes(seq_bytes) {
-            Ok(seq) => {
-                ids.push(id_value.to_string().into_boxed_str());
-                seqs.push(seq);
-            }
+            .get(cols.seq)
+            .ok_or_else(|| cols.missing(row, &cols.seq_label))?;
+        let seq = match S::from_bytes(normalize_seq_bytes(seq_field)) {
+            Ok(seq) => seq,
             Err(err) => match on_error {
                 OnError::Raise => {
                     return Err(BioError::CsvInvalidSequence {
                         row,
-                        column: column_label(&seq_col),
-                        path: path_str.clone(),
+                        column: cols.seq_label.clone(),
+                        path: cols.path.to_string(),
                         source: Box::new(err),
                     });
                 }
                 OnError::Skip => {
                     let msg = format!(
                         "invalid sequence at row {row}, column {}: {err}",
-                        column_label(&seq_col)
+                        cols.seq_label
                     );
-                    let id = if id_value.is_empty() {
-                        None
-                    } else {
-                        Some(id_value.to_string().into_boxed_str())
-                    };
-                    skipped.push(SkippedRecord {
+                    out.skipped.push(SkippedRecord {
                         row,
-                        id,
-                        column: column_label(&seq_col).into_boxed_str(),
+                        id: (!id_value.is_empty()).then(|| Box::from(id_value)),
+                        column: cols.seq_label.as_str().into(),
                         message: msg.into_boxed_str(),
                     });
                     continue;
                 }
             },
-        }
+        };
 
-        if let Some(desc_idx) = desc_idx {
-            let desc_field = record
+        let desc = if DESC {
+            let desc = record
                 .get(desc_idx)
-                .ok_or_else(|| BioError::CsvMissingField {
-                    row,
-                    column: column_label(desc_col.as_ref().expect("desc_idx exists")),
-                    path: path_str.clone(),
-                })?;
-            let desc = desc_field.trim();
-            if desc.is_empty() {
-                descs.push(None);
-            } else {
-                descs.push(Some(desc.to_string().into_boxed_str()));
-            }
+                .ok_or_else(|| cols.missing(row, &cols.desc_label))?
+                .trim();
+            (!desc.is_empty()).then(|| Box::from(desc))
         } else {
-            descs.push(None);
+            None
+        };
+
+        out.ids.push(Box::from(id_value));
+        out.seqs.push(seq);
+        out.descs.push(desc);
+    }
+}
+
+/// Alphabet of the `seq_col` column, judged from its first 100 rows;
+/// `path` only labels errors.
+pub fn detect_csv_type(data: &[u8], path: &str, seq_col: &ColumnSel) -> BioResult<SeqType> {
+    let mut reader = csv_reader(data);
+    let headers = reader.headers().map_err(|e| BioError::CsvParse {
+        path: path.to_string(),
+        source: e,
+    })?;
+    let seq_idx = resolve_column(seq_col, headers, path)?;
+
+    let mut sample = Vec::new();
+    let mut record = StringRecord::new();
+    for _ in 0..100 {
+        let more = reader
+            .read_record(&mut record)
+            .map_err(|e| BioError::CsvParse {
+                path: path.to_string(),
+                source: e,
+            })?;
+        if !more {
+            break;
+        }
+        if let Some(field) = record.get(seq_idx) {
+            sample.extend(field.bytes().filter(|b| !b.is_ascii_whitespace()));
         }
     }
+    Ok(detect_seq_type(&sample))
+}
 
-    let data = RecordBatch::new(ids, descs, seqs)?;
-    Ok(ReadReport { data, skipped })
+/// Headered reader that tolerates rows of differing length.
+fn csv_reader(data: &[u8]) -> csv::Reader<&[u8]> {
+    ReaderBuilder::new()
+        .has_headers(true)
+        .flexible(true)
+        .from_reader(data)
 }
 
 fn resolve_column(sel: &ColumnSel, headers: &StringRecord, path: &str) -> BioResult<usize> {
@@ -321,6 +416,46 @@ mod tests {
         }
     }
 
+    #[test]
+    fn from_bytes_matches_path_and_handles_quoted_lines() {
+        let text = "id,seq,desc\ns1,ACGT,\"two\nlines\"\n\ns2,\"AC GT\",\n";
+        let path = write_temp_csv(text);
+        let cols = || {
+            (
+                ColumnSel::Name("id".to_string()),
+                ColumnSel::Index(1),
+                Some(ColumnSel::Name("desc".to_string())),
+            )
+        };
+        let (id, seq, desc) = cols();
+        let from_path = read_csv::<DnaSeq>(&path, id, seq, desc, OnError::Raise).unwrap();
+        let (id, seq, desc) = cols();
+        let from_bytes =
+            read_csv_from_bytes::<DnaSeq>(text.as_bytes(), "mem", id, seq, desc, OnError::Raise)
+                .unwrap();
+        assert_eq!(from_bytes, from_path);
+        assert_eq!(from_bytes.data.len(), 2);
+        assert_eq!(from_bytes.data.descs()[0].as_deref(), Some("two\nlines"));
+        assert_eq!(from_bytes.data.descs()[1], None);
+        assert_eq!(from_bytes.data.seqs().as_slice()[1].as_bytes(), b"ACGT");
+    }
+
+    #[test]
+    fn detect_csv_type_reads_seq_column() {
+        let data = b"id,seq\ns1,ACGU\ns2,gguu\n";
+        let seq = ColumnSel::Name("seq".to_string());
+        assert_eq!(detect_csv_type(data, "mem", &seq).unwrap(), SeqType::Rna);
+        let prot = b"id,seq\ns1,MKWL\n";
+        assert_eq!(
+            detect_csv_type(prot, "mem", &ColumnSel::Index(1)).unwrap(),
+            SeqType::Protein
+        );
+        assert!(matches!(
+            detect_csv_type(data, "mem", &ColumnSel::Name("nope".to_string())),
+            Err(BioError::CsvMissingColumn { .. })
+        ));
+    }
+
     #[test]
     fn skip_invalid_sequence() {
         let path = write_temp_csv("id,seq\ns1,ACGT\ns2,AC#\ns3,TT\n");
@@ -1,3 +1,6 @@
+use crate::alphabets::classify::ByteClass;
+use memchr::memchr2;
+
 /// Sequence-type auto-detection for I/O.
 ///
 /// Rules (deterministic, not probabilistic):
@@ -13,26 +16,19 @@ pub enum SeqType {
 }
 
 /// Characters that appear in protein sequences but never in DNA/RNA IUPAC alphabets.
-const PROTEIN_ONLY: &[u8] = b"DEFHIKLMPQRSVWYdefhiklmpqrsvwy";
+const PROTEIN_ONLY: ByteClass = ByteClass::new(b"DEFHIKLMPQRSVWYdefhiklmpqrsvwy");
 
 /// Detect the sequence type from raw bytes.
 ///
-/// Scans through `bytes` tracking whether any protein-only character is seen,
-/// and whether T or U appear. Short-circuits on the first protein-only character.
+/// Each question is one vectorised scan: the protein-only search runs on the
+/// `ByteClass` nibble lookup, the T/U searches on `memchr2`. The protein scan
+/// stops at the first hit, so protein input is never scanned for T/U.
 pub fn detect_seq_type(bytes: &[u8]) -> SeqType {
-    let mut has_t = false;
-    let mut has_u = false;
-
-    for &b in bytes {
-        if PROTEIN_ONLY.contains(&b) {
-            return SeqType::Protein;
-        }
-        match b {
-            b'T' | b't' => has_t = true,
-            b'U' | b'u' => has_u = true,
-            _ => {}
-        }
+    if PROTEIN_ONLY.first_member(bytes).is_some() {
+        return SeqType::Protein;
     }
+    let has_t = memchr2(b'T', b't', bytes).is_some();
+    let has_u = memchr2(b'U', b'u', bytes).is_some();
 
     if has_u && !has_t {
         SeqType::Rna
@@ -87,6 +83,37 @@ mod tests {
         assert_eq!(detect_seq_type(b"MACGT"), SeqType::Protein);
     }
 
+    #[test]
+    fn detect_matches_bytewise_scan() {
+        fn reference(bytes: &[u8]) -> SeqType {
+            if bytes
+                .iter()
+                .any(|b| b"DEFHIKLMPQRSVWYdefhiklmpqrsvwy".contains(b))
+            {
+                return SeqType::Protein;
+            }
+            let has_t = bytes.iter().any(|b| b"Tt".contains(b));
+            let has_u = bytes.iter().any(|b| b"Uu".contains(b));
+            if has_u && !has_t {
+                SeqType::Rna
+            } else {
+                SeqType::Dna
+            }
+        }
+
+        for len in [1usize, 16, 31, 32, 33, 70] {
+            let base: Vec<u8> = (0..len).map(|i| b"ACGNacgn-\xe9"[i % 10]).collect();
+            assert_eq!(detect_seq_type(&base), SeqType::Dna);
+            for pos in 0..len {
+                for b in [b'T', b'u', b'M', b'y', 0xc4] {
+                    let mut seq = base.clone();
+                    seq[pos] = b;
+                    assert_eq!(detect_seq_type(&seq), reference(&seq), "{seq:?}");
+                }
+            }
+        }
+    }
+
     #[test]
     fn detect_with_iupac_ambiguity_codes() {
         // N, B, X are in both DNA IUPAC and protein — not protein-only
@@ -1,17 +1,20 @@
 use crate::error::{BioError, BioResult};
+use crate::io::detect::{detect_seq_type, SeqType};
+use crate::io::lines;
 use crate::seq::record::SeqRecord;
 use crate::seq::record_batch::RecordBatch;
 use crate::seq::traits::SeqBytes;
+use memchr::memchr_iter;
 use std::fs::File;
-use std::io::{BufRead, BufReader, BufWriter, Cursor, Write};
+use std::io::{self, BufRead, BufWriter, Write};
 use std::marker::PhantomData;
 use std::path::Path;
 
 pub struct FastaRecords<R, S> {
     reader: R,
     line_no: usize,
-    pending_header: Option<(String, usize)>,
-    buf_line: String,
+    pending_header: Option<(Vec<u8>, usize)>,
+    buf_line: Vec<u8>,
     seq_buf: Vec<u8>,
     _marker: PhantomData<S>,
 }
@@ -22,28 +25,28 @@ impl<R: BufRead, S: SeqBytes> FastaRecords<R, S> {
             reader,
             line_no: 0,
             pending_header: None,
-            buf_line: String::new(),
+            buf_line: Vec::new(),
             seq_buf: Vec::new(),
             _marker: PhantomData,
         }
     }
 
-    fn next_header(&mut self) -> Option<BioResult<(String, usize)>> {
+    fn next_header(&mut self) -> Option<BioResult<(Vec<u8>, usize)>> {
         if let Some(pending) = self.pending_header.take() {
             return Some(Ok(pending));
         }
 
         loop {
             self.buf_line.clear();
-            match self.reader.read_line(&mut self.buf_line) {
+            match self.reader.read_until(b'\n', &mut self.buf_line) {
                 Ok(0) => return None,
                 Ok(_) => {
                     self.line_no += 1;
                     let line_no = self.line_no;
-                    if self.buf_line.starts_with('>') {
+                    if self.buf_line.first() == Some(&b'>') {
                         return Some(Ok((std::mem::take(&mut self.buf_line), line_no)));
                     }
-                    if self.buf_line.trim().is_empty() {
+                    if self.buf_line.iter().all(u8::is_ascii_whitespace) {
                         continue;
                     }
                     return Some(Err(BioError::FastaFormat {
@@ -66,47 +69,35 @@ impl<R: BufRead, S: SeqBytes> Iterator for FastaRecords<R, S> {
             Err(err) => return Some(Err(err)),
         };
 
-        let (id, desc) = match parse_header(&header_line, header_line_no) {
+        let (id, desc) = match decode_header(&header_line, header_line_no) {
             Ok(parsed) => parsed,
             Err(err) => return Some(Err(err)),
         };
 
         self.seq_buf.clear();
 
+        // Sequence lines are read as raw bytes (`read_until` is memchr-backed)
+        // so they are never UTF-8 checked; `S::from_bytes` below is the only
+        // pass that inspects residues.
         loop {
             self.buf_line.clear();
-            match self.reader.read_line(&mut self.buf_line) {
+            match self.reader.read_until(b'\n', &mut self.buf_line) {
                 Ok(0) => break,
                 Ok(_) => {
                     self.line_no += 1;
                     let line_no = self.line_no;
-                    if self.buf_line.starts_with('>') {
+                    if self.buf_line.first() == Some(&b'>') {
                         self.pending_header = Some((std::mem::take(&mut self.buf_line), line_no));
                         break;
                     }
-                    for b in self.buf_line.bytes() {
-                        if !b.is_ascii_whitespace() {
-                            self.seq_buf.push(b);
-                        }
-                    }
+                    let line = self.buf_line.strip_suffix(b"\n").unwrap_or(&self.buf_line);
+                    push_seq_line(&mut self.seq_buf, line);
                 }
                 Err(err) => return Some(Err(BioError::FastaIo(err))),
             }
         }
 
-        let capacity = self.seq_buf.capacity();
-        let bytes = std::mem::take(&mut self.seq_buf);
-        let seq = match S::from_bytes(bytes) {
-            Ok(seq) => seq,
-            Err(err) => return Some(Err(err)),
-        };
-        self.seq_buf = Vec::with_capacity(capacity);
-
-        let record = match desc {
-            Some(desc) => SeqRecord::new(id, seq).with_desc(desc),
-            None => SeqRecord::new(id, seq),
-        };
-        Some(Ok(record))
+        Some(finish_record(id, desc, &mut self.seq_buf))
     }
 }
 
@@ -127,14 +118,45 @@ pub fn read_fasta_records_from_reader<R: BufRead, S: SeqBytes>(
 pub fn read_fasta_records_from_path<S: SeqBytes>(
     path: impl AsRef<Path>,
 ) -> BioResult<Vec<SeqRecord<S>>> {
-    let file = File::open(path)?;
-    let reader = BufReader::new(file);
-    read_fasta_records_from_reader(reader)
+    let data = std::fs::read(path)?;
+    read_fasta_records_from_bytes(&data)
 }
 
+/// Parse a whole in-memory FASTA buffer in a single pass.
+///
+/// Lines are located with `memchr`; only header lines are decoded as UTF-8,
+/// sequence lines are copied straight into the record buffer.
 pub fn read_fasta_records_from_bytes<S: SeqBytes>(data: &[u8]) -> BioResult<Vec<SeqRecord<S>>> {
-    let reader = BufReader::new(Cursor::new(data));
-    read_fasta_records_from_reader(reader)
+    // Every record starts with a '>', so this bounds the record count.
+    let mut out = Vec::with_capacity(memchr_iter(b'>', data).count());
+    let mut header: Option<(Box<str>, Option<Box<str>>)> = None;
+    let mut seq_buf: Vec<u8> = Vec::new();
+
+    for (idx, line) in lines(data).enumerate() {
+        let line_no = idx + 1;
+        if line.first() == Some(&b'>') {
+            if let Some((id, desc)) = header.take() {
+                out.push(finish_record(id, desc, &mut seq_buf)?);
+            }
+            header = Some(decode_header(line, line_no)?);
+            continue;
+        }
+        if header.is_none() {
+            if line.iter().all(u8::is_ascii_whitespace) {
+                continue;
+            }
+            return Err(BioError::FastaFormat {
+                msg: "expected header line starting with '>'",
+                line: line_no,
+            });
+        }
+        push_seq_line(&mut seq_buf, line);
+    }
+
+    if let Some((id, desc)) = header {
+        out.push(finish_record(id, desc, &mut seq_buf)?);
+    }
+    Ok(out)
 }
 
 pub fn read_fasta_batch_from_reader<R: BufRead, S: SeqBytes>(
@@ -147,14 +169,68 @@ pub fn read_fasta_batch_from_reader<R: BufRead, S: SeqBytes>(
 pub fn read_fasta_batch_from_path<S: SeqBytes>(
     path: impl AsRef<Path>,
 ) -> BioResult<RecordBatch<S>> {
-    let file = File::open(path)?;
-    let reader = BufReader::new(file);
-    read_fasta_batch_from_reader(reader)
+    let data = std::fs::read(path)?;
+    read_fasta_batch_from_bytes(&data)
 }
 
 pub fn read_fasta_batch_from_bytes<S: SeqBytes>(data: &[u8]) -> BioResult<RecordBatch<S>> {
-    let reader = BufReader::new(Cursor::new(data));
-    read_fasta_batch_from_reader(reader)
+    let records = read_fasta_records_from_bytes(data)?;
+    Ok(RecordBatch::from_records(records))
+}
+
+/// Detect the alphabet from (up to the first 1000 residues of) the first record.
+pub fn detect_fasta_type(data: &[u8]) -> SeqType {
+    let mut seq_bytes = Vec::new();
+    let mut in_seq = false;
+
+    for line in lines(data) {
+        if line.first() == Some(&b'>') {
+            if in_seq {
+                break;
+            }
+            in_seq = true;
+            continue;
+        }
+        if in_seq {
+            push_seq_line(&mut seq_bytes, line);
+            if seq_bytes.len() >= 1000 {
+                break;
+            }
+        }
+    }
+
+    detect_seq_type(&seq_bytes)
+}
+
+/// Decode a raw header line as UTF-8 and split it into id and description.
+fn decode_header(line: &[u8], line_no: usize) -> BioResult<(Box<str>, Option<Box<str>>)> {
+    let text = std::str::from_utf8(line)
+        .map_err(|e| BioError::FastaIo(io::Error::new(io::ErrorKind::InvalidData, e)))?;
+    parse_header(text, line_no)
+}
+
+#[inline]
+fn push_seq_line(seq_buf: &mut Vec<u8>, line: &[u8]) {
+    let line = line.strip_suffix(b"\r").unwrap_or(line);
+    if line.iter().any(u8::is_ascii_whitespace) {
+        seq_buf.extend(line.iter().copied().filter(|b| !b.is_ascii_whitespace()));
+    } else {
+        seq_buf.extend_from_slice(line);
+    }
+}
+
+fn finish_record<S: SeqBytes>(
+    id: Box<str>,
+    desc: Option<Box<str>>,
+    seq_buf: &mut Vec<u8>,
+) -> BioResult<SeqRecord<S>> {
+    let capacity = seq_buf.capacity();
+    let bytes = std::mem::replace(seq_buf, Vec::with_capacity(capacity));
+    let seq = S::from_bytes(bytes)?;
+    Ok(match desc {
+        Some(desc) => SeqRecord::new(id, seq).with_desc(desc),
+        None => SeqRecord::new(id, seq),
+    })
 }
 
 pub fn write_fasta_records_to_writer<W: Write, S: SeqBytes>(
@@ -342,6 +418,49 @@ mod tests {
         }
     }
 
+    #[test]
+    fn bytes_parser_matches_reader() {
+        let data: &[u8] = b"\n>seq1 first one\r\nAC GT\r\nac\n\n>seq2\n>seq3\tdesc\nNNNN\nACGT";
+        let from_bytes = read_fasta_records_from_bytes::<DnaSeq>(data).unwrap();
+        let from_reader = read_fasta_records_from_reader::<_, DnaSeq>(data).unwrap();
+        assert_eq!(from_bytes.len(), 3);
+        assert_eq!(from_bytes.len(), from_reader.len());
+        for (a, b) in from_bytes.iter().zip(&from_reader) {
+            assert_eq!(a.id(), b.id());
+            assert_eq!(a.desc(), b.desc());
+            assert_eq!(a.seq().as_bytes(), b.seq().as_bytes());
+        }
+        assert_eq!(from_bytes[0].seq().as_bytes(), b"ACGTac");
+        assert_eq!(from_bytes[2].seq().as_bytes(), b"NNNNACGT");
+    }
+
+    #[test]
+    fn bytes_parser_error_lines() {
+        let err = read_fasta_records_from_bytes::<DnaSeq>(b"\nACGT\n").unwrap_err();
+        match err {
+            BioError::FastaFormat { line, .. } => assert_eq!(line, 2),
+            other => panic!("expected fasta format error, got {other:?}"),
+        }
+        let err = read_fasta_records_from_bytes::<DnaSeq>(b">a\nA\n>\nC\n").unwrap_err();
+        match err {
+            BioError::FastaFormat { line, msg } => {
+                assert_eq!(line, 3);
+                assert_eq!(msg, "empty header");
+            }
+            other => panic!("expected fasta format error, got {other:?}"),
+        }
+        assert!(read_fasta_records_from_bytes::<DnaSeq>(b"")
+            .unwrap()
+            .is_empty());
+    }
+
+    #[test]
+    fn detect_type_from_first_record() {
+        assert_eq!(detect_fasta_type(b">a\nACGU\n>b\nMKV\n"), SeqType::Rna);
+        assert_eq!(detect_fasta_type(b">a\nMKV\n"), SeqType::Protein);
+        assert_eq!(detect_fasta_type(b""), SeqType::Dna);
+    }
+
     #[test]
     fn invalid_sequence_char() {
         let data = b">seq1\nAC#\n";
@@ -351,4 +470,19 @@ mod tests {
             other => panic!("expected invalid char error, got {other:?}"),
         }
     }
+
+    #[test]
+    fn reader_reports_non_utf8_residue_as_invalid_char() {
+        let data: &[u8] = b">seq1\nAC\xffGT\n";
+        let err = read_fasta_records_from_reader::<_, DnaSeq>(data).unwrap_err();
+        match err {
+            BioError::InvalidChar { ch, pos } => {
+                assert_eq!(ch, '\u{ff}');
+                assert_eq!(pos, 2);
+            }
+            other => panic!("expected invalid char error, got {other:?}"),
+        }
+        let err = read_fasta_records_from_reader::<_, DnaSeq>(&b">\xff\nACGT\n"[..]).unwrap_err();
+        assert!(matches!(err, BioError::FastaIo(_)));
+    }
 }
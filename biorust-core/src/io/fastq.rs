@@ -1,16 +1,22 @@
 use crate::error::{BioError, BioResult};
+use crate::io::detect::{detect_seq_type, SeqType};
+use crate::io::lines;
 use crate::seq::record::SeqRecord;
 use crate::seq::record_batch::RecordBatch;
 use crate::seq::traits::SeqBytes;
+use memchr::{memchr2, memchr_iter};
 use std::fs::File;
-use std::io::{BufRead, BufReader, BufWriter, Cursor, Write};
+use std::io::{self, BufRead, BufWriter, Read, Write};
 use std::marker::PhantomData;
 use std::path::Path;
+use std::sync::mpsc;
 
 pub struct FastqRecords<R, S> {
     reader: R,
     line_no: usize,
-    buf_line: String,
+    header: Vec<u8>,
+    seq: Vec<u8>,
+    qual: Vec<u8>,
     _marker: PhantomData<S>,
 }
 
@@ -19,44 +25,45 @@ impl<R: BufRead, S: SeqBytes> FastqRecords<R, S> {
         Self {
             reader,
             line_no: 0,
-            buf_line: String::new(),
+            header: Vec::new(),
+            seq: Vec::new(),
+            qual: Vec::new(),
             _marker: PhantomData,
         }
     }
 
-    fn next_nonempty_line(&mut self) -> Option<BioResult<(String, usize)>> {
-        loop {
-            let (line, line_no) = match self.next_line() {
-                Some(Ok(value)) => value,
-                Some(Err(err)) => return Some(Err(err)),
-                None => return None,
-            };
-            if line.trim().is_empty() {
-                continue;
+    /// Read the next four-line record. Lines are read as raw bytes into
+    /// reused buffers, so only the header is ever UTF-8 checked.
+    fn read_record(&mut self) -> BioResult<Option<SeqRecord<S>>> {
+        let Self {
+            reader,
+            line_no,
+            header,
+            seq,
+            qual,
+            ..
+        } = self;
+
+        let header_line_no = loop {
+            if !read_line_into(reader, header)? {
+                return Ok(None);
             }
-            return Some(Ok((line, line_no)));
-        }
-    }
-
-    fn next_line(&mut self) -> Option<BioResult<(String, usize)>> {
-        self.buf_line.clear();
-        match self.reader.read_line(&mut self.buf_line) {
-            Ok(0) => None,
-            Ok(_) => {
-                self.line_no += 1;
-                let line_no = self.line_no;
-                Some(Ok((std::mem::take(&mut self.buf_line), line_no)))
+            *line_no += 1;
+            if !is_blank(header) {
+                break *line_no;
             }
-            Err(err) => Some(Err(BioError::FastqIo(err))),
-        }
-    }
+        };
+        check_header(header, header_line_no)?;
+        let (id, desc) = decode_header(header, header_line_no)?;
 
-    fn read_required_line(&mut self, msg: &'static str, line: usize) -> BioResult<(String, usize)> {
-        match self.next_line() {
-            Some(Ok(value)) => Ok(value),
-            Some(Err(err)) => Err(err),
-            None => Err(BioError::FastqFormat { msg, line }),
-        }
+        require_line(reader, line_no, seq, "missing sequence line")?;
+        // the separator is only checked, so it borrows the quality buffer
+        let plus_line_no = require_line(reader, line_no, qual, "missing '+' separator line")?;
+        check_separator(qual, plus_line_no)?;
+        let qual_line_no = require_line(reader, line_no, qual, "missing quality line")?;
+
+        let seq = parse_seq(seq, qual, qual_line_no)?;
+        Ok(Some(make_record(id, desc, seq)))
     }
 }
 
@@ -64,71 +71,7 @@ impl<R: BufRead, S: SeqBytes> Iterator for FastqRecords<R, S> {
     type Item = BioResult<SeqRecord<S>>;
 
     fn next(&mut self) -> Option<Self::Item> {
-        let (header_line, header_line_no) = match self.next_nonempty_line()? {
-            Ok(value) => value,
-            Err(err) => return Some(Err(err)),
-        };
-
-        if !header_line.starts_with('@') {
-            return Some(Err(BioError::FastqFormat {
-                msg: "expected header line starting with '@'",
-                line: header_line_no,
-            }));
-        }
-
-        let (id, desc) = match parse_header(&header_line, header_line_no) {
-            Ok(parsed) => parsed,
-            Err(err) => return Some(Err(err)),
-        };
-
-        let (seq_line, seq_line_no) = match self
-            .read_required_line("missing sequence line", header_line_no.saturating_add(1))
-        {
-            Ok(value) => value,
-            Err(err) => return Some(Err(err)),
-        };
-
-        let (plus_line, plus_line_no) = match self
-            .read_required_line("missing '+' separator line", seq_line_no.saturating_add(1))
-        {
-            Ok(value) => value,
-            Err(err) => return Some(Err(err)),
-        };
-
-        if !plus_line.starts_with('+') {
-            return Some(Err(BioError::FastqFormat {
-                msg: "expected '+' separator line",
-                line: plus_line_no,
-            }));
-        }
-
-        let (qual_line, qual_line_no) =
-            match self.read_required_line("missing quality line", plus_line_no.saturating_add(1)) {
-                Ok(value) => value,
-                Err(err) => return Some(Err(err)),
-            };
-
-        let seq_line = trim_eol(&seq_line);
-        let qual_line = trim_eol(&qual_line);
-        let seq_bytes = seq_line.as_bytes().to_vec();
-
-        if seq_bytes.len() != qual_line.len() {
-            return Some(Err(BioError::FastqFormat {
-                msg: "sequence and quality lengths differ",
-                line: qual_line_no,
-            }));
-        }
-
-        let seq = match S::from_bytes(seq_bytes) {
-            Ok(seq) => seq,
-            Err(err) => return Some(Err(err)),
-        };
-
-        let record = match desc {
-            Some(desc) => SeqRecord::new(id, seq).with_desc(desc),
-            None => SeqRecord::new(id, seq),
-        };
-        Some(Ok(record))
+        self.read_record().transpose()
     }
 }
 
@@ -149,14 +92,22 @@ pub fn read_fastq_records_from_reader<R: BufRead, S: SeqBytes>(
 pub fn read_fastq_records_from_path<S: SeqBytes>(
     path: impl AsRef<Path>,
 ) -> BioResult<Vec<SeqRecord<S>>> {
-    let file = File::open(path).map_err(BioError::FastqIo)?;
-    let reader = BufReader::new(file);
-    read_fastq_records_from_reader(reader)
+    let mut out = Vec::new();
+    parse_fastq_file(path.as_ref(), |id, desc, seq| {
+        out.push(make_record(id, desc, seq))
+    })?;
+    Ok(out)
 }
 
+/// Parse a whole in-memory FASTQ buffer in a single pass.
+///
+/// Records are strictly four lines. Line ends are located with `memchr` and
+/// each record's lines are borrowed straight from `data`; the sequence line
+/// is the only one copied.
 pub fn read_fastq_records_from_bytes<S: SeqBytes>(data: &[u8]) -> BioResult<Vec<SeqRecord<S>>> {
-    let reader = BufReader::new(Cursor::new(data));
-    read_fastq_records_from_reader(reader)
+    let mut out = Vec::with_capacity(estimate_records(data));
+    parse_fastq_bytes(data, |id, desc, seq| out.push(make_record(id, desc, seq)))?;
+    Ok(out)
 }
 
 pub fn read_fastq_batch_from_reader<R: BufRead, S: SeqBytes>(
@@ -166,17 +117,55 @@ pub fn read_fastq_batch_from_reader<R: BufRead, S: SeqBytes>(
     Ok(RecordBatch::from_records(records))
 }
 
+/// Read a FASTQ file into a batch. Large files are parsed while they are
+/// still being read; see [`parse_fastq_file`].
 pub fn read_fastq_batch_from_path<S: SeqBytes>(
     path: impl AsRef<Path>,
 ) -> BioResult<RecordBatch<S>> {
-    let file = File::open(path).map_err(BioError::FastqIo)?;
-    let reader = BufReader::new(file);
-    read_fastq_batch_from_reader(reader)
+    let mut ids = Vec::new();
+    let mut descs = Vec::new();
+    let mut seqs = Vec::new();
+    parse_fastq_file(path.as_ref(), |id, desc, seq| {
+        ids.push(id);
+        descs.push(desc);
+        seqs.push(seq);
+    })?;
+    RecordBatch::new(ids, descs, seqs)
 }
 
+/// Parse an in-memory FASTQ buffer straight into the batch's id,
+/// description and sequence columns, without building per-record values.
 pub fn read_fastq_batch_from_bytes<S: SeqBytes>(data: &[u8]) -> BioResult<RecordBatch<S>> {
-    let reader = BufReader::new(Cursor::new(data));
-    read_fastq_batch_from_reader(reader)
+    let n = estimate_records(data);
+    let mut ids = Vec::with_capacity(n);
+    let mut descs = Vec::with_capacity(n);
+    let mut seqs = Vec::with_capacity(n);
+    parse_fastq_bytes(data, |id, desc, seq| {
+        ids.push(id);
+        descs.push(desc);
+        seqs.push(seq);
+    })?;
+    RecordBatch::new(ids, descs, seqs)
+}
+
+/// Detect the alphabet from the sequence line of the first record.
+pub fn detect_fastq_type(data: &[u8]) -> SeqType {
+    let mut lines = lines(data).skip_while(|line| is_blank(line));
+    match (lines.next(), lines.next()) {
+        (Some(header), Some(seq)) if header.first() == Some(&b'@') => {
+            detect_seq_type(trim_eol(seq))
+        }
+        _ => SeqType::Dna,
+    }
+}
+
+/// [`detect_fastq_type`] on the start of a file, without reading the rest.
+pub fn detect_fastq_type_from_path(path: impl AsRef<Path>) -> BioResult<SeqType> {
+    let mut head = Vec::new();
+    File::open(path)
+        .and_then(|file| file.take(DETECT_BYTES).read_to_end(&mut head))
+        .map_err(BioError::FastqIo)?;
+    Ok(detect_fastq_type(&head))
 }
 
 pub fn write_fastq_records_to_writer<W: Write, S: SeqBytes>(
@@ -184,19 +173,11 @@ pub fn write_fastq_records_to_writer<W: Write, S: SeqBytes>(
     records: &[SeqRecord<S>],
     quality_char: u8,
 ) -> BioResult<()> {
-    validate_quality_char(quality_char)?;
-    let mut writer = BufWriter::new(writer);
+    let mut writer = FastqWriter::new(writer, quality_char)?;
     for record in records {
-        write_fastq_record(
-            &mut writer,
-            &record.id,
-            record.desc.as_deref(),
-            record.seq.as_bytes(),
-            quality_char,
-        )?;
+        writer.write_record(&record.id, record.desc.as_deref(), record.seq.as_bytes())?;
     }
-    writer.flush().map_err(BioError::FastqIo)?;
-    Ok(())
+    writer.finish()
 }
 
 pub fn write_fastq_records_to_path<S: SeqBytes>(
@@ -213,8 +194,7 @@ pub fn write_fastq_batch_to_writer<W: Write, S: SeqBytes>(
     batch: &RecordBatch<S>,
     quality_char: u8,
 ) -> BioResult<()> {
-    validate_quality_char(quality_char)?;
-    let mut writer = BufWriter::new(writer);
+    let mut writer = FastqWriter::new(writer, quality_char)?;
     for i in 0..batch.len() {
         let id = batch.id(i).expect("record batch length is consistent");
         let desc = batch.descs().get(i).and_then(|d| d.as_deref());
@@ -222,10 +202,9 @@ pub fn write_fastq_batch_to_writer<W: Write, S: SeqBytes>(
             .seq(i)
             .expect("record batch length is consistent")
             .as_bytes();
-        write_fastq_record(&mut writer, id, desc, seq, quality_char)?;
+        writer.write_record(id, desc, seq)?;
     }
-    writer.flush().map_err(BioError::FastqIo)?;
-    Ok(())
+    writer.finish()
 }
 
 pub fn write_fastq_batch_to_path<S: SeqBytes>(
@@ -244,13 +223,225 @@ fn validate_quality_char(ch: u8) -> BioResult<()> {
     Ok(())
 }
 
+/// Read one line (including its `\n`) into `buf`; `false` at end of input.
+fn read_line_into<R: BufRead>(reader: &mut R, buf: &mut Vec<u8>) -> BioResult<bool> {
+    buf.clear();
+    let n = reader.read_until(b'\n', buf).map_err(BioError::FastqIo)?;
+    Ok(n > 0)
+}
+
+/// Read the line after `line_no` into `buf`, or fail with `msg` at EOF.
+fn require_line<R: BufRead>(
+    reader: &mut R,
+    line_no: &mut usize,
+    buf: &mut Vec<u8>,
+    msg: &'static str,
+) -> BioResult<usize> {
+    if !read_line_into(reader, buf)? {
+        return Err(BioError::FastqFormat {
+            msg,
+            line: *line_no + 1,
+        });
+    }
+    *line_no += 1;
+    Ok(*line_no)
+}
+
+#[inline]
+fn is_blank(line: &[u8]) -> bool {
+    line.iter().all(u8::is_ascii_whitespace)
+}
+
+#[inline]
+fn check_header(line: &[u8], line_no: usize) -> BioResult<()> {
+    if line.first() != Some(&b'@') {
+        return Err(BioError::FastqFormat {
+            msg: "expected header line starting with '@'",
+            line: line_no,
+        });
+    }
+    Ok(())
+}
+
+#[inline]
+fn check_separator(line: &[u8], line_no: usize) -> BioResult<()> {
+    if line.first() != Some(&b'+') {
+        return Err(BioError::FastqFormat {
+            msg: "expected '+' separator line",
+            line: line_no,
+        });
+    }
+    Ok(())
+}
+
+/// Decode a raw header line as UTF-8 and split it into id and description.
+fn decode_header(line: &[u8], line_no: usize) -> BioResult<(Box<str>, Option<Box<str>>)> {
+    let text = std::str::from_utf8(line)
+        .map_err(|e| BioError::FastqIo(io::Error::new(io::ErrorKind::InvalidData, e)))?;
+    parse_header(text, line_no)
+}
+
+/// Walk the records of `data`, handing each one's id, description and
+/// sequence to `emit`.
+fn parse_fastq_bytes<S: SeqBytes>(
+    data: &[u8],
+    emit: impl FnMut(Box<str>, Option<Box<str>>, S),
+) -> BioResult<()> {
+    parse_fastq_from(data, 1, emit)
+}
+
+/// [`parse_fastq_bytes`] for a buffer whose first line is line `first_line`
+/// of the file, so errors still report file line numbers.
+fn parse_fastq_from<S: SeqBytes>(
+    data: &[u8],
+    first_line: usize,
+    mut emit: impl FnMut(Box<str>, Option<Box<str>>, S),
+) -> BioResult<()> {
+    let mut lines = lines(data).zip(first_line..);
+
+    while let Some((header, header_line_no)) = lines.find(|(line, _)| !is_blank(line)) {
+        check_header(header, header_line_no)?;
+        let (id, desc) = decode_header(header, header_line_no)?;
+
+        let mut require = |msg, prev_line_no: usize| {
+            lines.next().ok_or(BioError::FastqFormat {
+                msg,
+                line: prev_line_no + 1,
+            })
+        };
+        let (seq, seq_line_no) = require("missing sequence line", header_line_no)?;
+        let (plus, plus_line_no) = require("missing '+' separator line", seq_line_no)?;
+        check_separator(plus, plus_line_no)?;
+        let (qual, qual_line_no) = require("missing quality line", plus_line_no)?;
+
+        emit(id, desc, parse_seq(seq, qual, qual_line_no)?);
+    }
+    Ok(())
+}
+
+/// How much of a file [`detect_fastq_type_from_path`] looks at.
+const DETECT_BYTES: u64 = 64 * 1024;
+
+/// Read size for streaming a FASTQ file through the parser.
+const READ_CHUNK_BYTES: usize = 4 << 20;
+
+/// Parse the FASTQ file at `path`, emitting each record in order.
+///
+/// A file that fits in one chunk is read whole and parsed as bytes. Larger
+/// files are read chunk by chunk on a second thread while this one parses
+/// the whole records already received, so reading overlaps parsing and only
+/// a couple of chunks are held at a time instead of the entire file.
+fn parse_fastq_file<S: SeqBytes>(
+    path: &Path,
+    emit: impl FnMut(Box<str>, Option<Box<str>>, S),
+) -> BioResult<()> {
+    let file = File::open(path).map_err(BioError::FastqIo)?;
+    let size = file.metadata().map_err(BioError::FastqIo)?.len();
+    if size <= READ_CHUNK_BYTES as u64 {
+        let mut data = Vec::with_capacity(size as usize);
+        (&file).read_to_end(&mut data).map_err(BioError::FastqIo)?;
+        return parse_fastq_bytes(&data, emit);
+    }
+    parse_fastq_stream(file, READ_CHUNK_BYTES, emit)
+}
+
+/// Parse `file` as it is read in `chunk_bytes` pieces on a second thread.
+fn parse_fastq_stream<S: SeqBytes>(
+    file: File,
+    chunk_bytes: usize,
+    mut emit: impl FnMut(Box<str>, Option<Box<str>>, S),
+) -> BioResult<()> {
+    std::thread::scope(|scope| {
+        let (tx, rx) = mpsc::sync_channel::<io::Result<Vec<u8>>>(2);
+        scope.spawn(move || loop {
+            let mut chunk = Vec::with_capacity(chunk_bytes);
+            match (&file).take(chunk_bytes as u64).read_to_end(&mut chunk) {
+                Ok(0) => break,
+                Ok(_) => {
+                    // A closed channel means the parser stopped on an error.
+                    if tx.send(Ok(chunk)).is_err() {
+                        break;
+                    }
+                }
+                Err(e) => {
+                    let _ = tx.send(Err(e));
+                    break;
+                }
+            }
+        });
+
+        let mut pending: Vec<u8> = Vec::new();
+        let mut line_no = 1;
+        for chunk in rx {
+            let chunk = chunk.map_err(BioError::FastqIo)?;
+            if pending.is_empty() {
+                pending = chunk;
+            } else {
+                pending.extend_from_slice(&chunk);
+            }
+            let (end, lines) = whole_records_end(&pending);
+            parse_fastq_from(&pending[..end], line_no, &mut emit)?;
+            pending.drain(..end);
+            line_no += lines;
+        }
+        parse_fastq_from(&pending, line_no, emit)
+    })
+}
+
+/// Byte and line count of the leading run of complete records in `data`,
+/// split exactly as [`parse_fastq_from`] would: blank lines are skipped
+/// before a header, then the header and the next three lines form a record.
+/// Only `\n`-terminated lines count, since the last one may be cut short.
+fn whole_records_end(data: &[u8]) -> (usize, usize) {
+    let (mut end, mut end_lines) = (0, 0);
+    let (mut start, mut lines, mut in_record) = (0, 0, 0);
+    for nl in memchr_iter(b'\n', data) {
+        let line = &data[start..nl];
+        start = nl + 1;
+        lines += 1;
+        if in_record == 0 && is_blank(line) {
+            continue;
+        }
+        in_record += 1;
+        if in_record == 4 {
+            in_record = 0;
+            (end, end_lines) = (start, lines);
+        }
+    }
+    (end, end_lines)
+}
+
+/// Upper bound on the record count of `data`, for presizing outputs.
+fn estimate_records(data: &[u8]) -> usize {
+    memchr_iter(b'\n', data).count() / 4 + 1
+}
+
+/// Check the sequence line against its quality line and validate it.
+fn parse_seq<S: SeqBytes>(seq_line: &[u8], qual_line: &[u8], qual_line_no: usize) -> BioResult<S> {
+    let seq_line = trim_eol(seq_line);
+    if seq_line.len() != trim_eol(qual_line).len() {
+        return Err(BioError::FastqFormat {
+            msg: "sequence and quality lengths differ",
+            line: qual_line_no,
+        });
+    }
+    S::from_bytes(seq_line.to_vec())
+}
+
+fn make_record<S: SeqBytes>(id: Box<str>, desc: Option<Box<str>>, seq: S) -> SeqRecord<S> {
+    match desc {
+        Some(desc) => SeqRecord::new(id, seq).with_desc(desc),
+        None => SeqRecord::new(id, seq),
+    }
+}
+
 fn parse_header(header_line: &str, line_no: usize) -> BioResult<(Box<str>, Option<Box<str>>)> {
     let header = header_line.strip_prefix('@').ok_or(BioError::FastqFormat {
         msg: "expected header line starting with '@'",
         line: line_no,
     })?;
 
-    let header = trim_eol(header).trim_start();
+    let header = header.trim_end_matches(['\n', '\r']).trim_start();
     if header.is_empty() {
         return Err(BioError::FastqFormat {
             msg: "empty header",
@@ -271,47 +462,79 @@ fn parse_header(header_line: &str, line_no: usize) -> BioResult<(Box<str>, Optio
     Ok((id.into(), desc.map(|s| s.into())))
 }
 
-fn write_fastq_record<W: Write>(
-    writer: &mut W,
-    id: &str,
-    desc: Option<&str>,
-    seq: &[u8],
+/// Output buffer size for FASTQ writers.
+const WRITE_BUF_BYTES: usize = 1 << 20;
+
+/// Buffered FASTQ output. Each header line is formatted into a reused
+/// scratch buffer and handed over in one write; the sequence is written
+/// straight from the record and the quality line from `quality`.
+struct FastqWriter<W: Write> {
+    out: BufWriter<W>,
+    line: Vec<u8>,
+    quality: Vec<u8>,
     quality_char: u8,
-) -> BioResult<()> {
-    writer.write_all(b"@").map_err(BioError::FastqIo)?;
-    write_header_field(writer, id)?;
-    if let Some(desc) = desc {
-        if !desc.is_empty() {
-            writer.write_all(b" ").map_err(BioError::FastqIo)?;
-            write_header_field(writer, desc)?;
+}
+
+impl<W: Write> FastqWriter<W> {
+    fn new(writer: W, quality_char: u8) -> BioResult<Self> {
+        validate_quality_char(quality_char)?;
+        Ok(Self {
+            out: BufWriter::with_capacity(WRITE_BUF_BYTES, writer),
+            line: Vec::new(),
+            quality: Vec::new(),
+            quality_char,
+        })
+    }
+
+    fn write_record(&mut self, id: &str, desc: Option<&str>, seq: &[u8]) -> BioResult<()> {
+        let line = &mut self.line;
+        line.clear();
+        line.push(b'@');
+        push_header_field(line, id);
+        if let Some(desc) = desc.filter(|d| !d.is_empty()) {
+            line.push(b' ');
+            push_header_field(line, desc);
+        }
+        line.push(b'\n');
+        self.out.write_all(line).map_err(BioError::FastqIo)?;
+        self.out.write_all(seq).map_err(BioError::FastqIo)?;
+
+        // Every record shares one quality byte, so the quality line is a
+        // prefix of a buffer that is only filled (memset) when it grows.
+        if self.quality.len() < seq.len() {
+            self.quality.resize(seq.len(), self.quality_char);
         }
+        self.out.write_all(b"\n+\n").map_err(BioError::FastqIo)?;
+        self.out
+            .write_all(&self.quality[..seq.len()])
+            .map_err(BioError::FastqIo)?;
+        self.out.write_all(b"\n").map_err(BioError::FastqIo)
+    }
+
+    fn finish(mut self) -> BioResult<()> {
+        self.out.flush().map_err(BioError::FastqIo)
     }
-    writer.write_all(b"\n").map_err(BioError::FastqIo)?;
-    writer.write_all(seq).map_err(BioError::FastqIo)?;
-    writer.write_all(b"\n+\n").map_err(BioError::FastqIo)?;
-    let qual = vec![quality_char; seq.len()];
-    writer.write_all(&qual).map_err(BioError::FastqIo)?;
-    writer.write_all(b"\n").map_err(BioError::FastqIo)?;
-    Ok(())
 }
 
-fn write_header_field<W: Write>(writer: &mut W, value: &str) -> BioResult<()> {
-    let bytes = value.as_bytes();
-    if bytes.contains(&b'\n') || bytes.contains(&b'\r') {
-        for &b in bytes {
-            match b {
-                b'\n' | b'\r' => writer.write_all(b" ").map_err(BioError::FastqIo)?,
-                _ => writer.write_all(&[b]).map_err(BioError::FastqIo)?,
+/// Append a header field, replacing embedded line breaks with spaces so the
+/// record stays four lines.
+fn push_header_field(line: &mut Vec<u8>, value: &str) {
+    let start = line.len();
+    line.extend_from_slice(value.as_bytes());
+    if memchr2(b'\n', b'\r', value.as_bytes()).is_some() {
+        for b in &mut line[start..] {
+            if matches!(*b, b'\n' | b'\r') {
+                *b = b' ';
             }
         }
-    } else {
-        writer.write_all(bytes).map_err(BioError::FastqIo)?;
     }
-    Ok(())
 }
 
-fn trim_eol(line: &str) -> &str {
-    line.trim_end_matches(&['\n', '\r'][..])
+fn trim_eol(mut line: &[u8]) -> &[u8] {
+    while let [rest @ .., b'\n' | b'\r'] = line {
+        line = rest;
+    }
+    line
 }
 
 #[cfg(test)]
@@ -394,6 +617,122 @@ mod tests {
         }
     }
 
+    #[test]
+    fn bytes_and_reader_agree() {
+        let data = b"\n@seq1 desc\r\nACGT\r\n+seq1\r\nIIII\r\n\n@seq2\nGG\n+\n!!";
+        let from_bytes = read_fastq_records_from_bytes::<DnaSeq>(data).unwrap();
+        let from_reader = read_fastq_records_from_reader::<_, DnaSeq>(&data[..]).unwrap();
+        assert_eq!(from_bytes, from_reader);
+        assert_eq!(from_bytes.len(), 2);
+        assert_eq!(from_bytes[0].desc(), Some("desc"));
+        assert_eq!(from_bytes[0].seq().as_bytes(), b"ACGT");
+        assert_eq!(from_bytes[1].seq().as_bytes(), b"GG");
+    }
+
+    #[test]
+    fn errors_report_line_numbers() {
+        let cases: [(&[u8], &str, usize); 4] = [
+            (
+                b"@a\nAC\n+\n!!\n\nAC\n",
+                "expected header line starting with '@'",
+                6,
+            ),
+            (b"@a\nAC\n+\n!!\n@b\n", "missing sequence line", 6),
+            (b"@a\nAC", "missing '+' separator line", 3),
+            (b"@a\nAC\n+\n", "missing quality line", 4),
+        ];
+        for (data, expected, expected_line) in cases {
+            let errors = [
+                read_fastq_records_from_bytes::<DnaSeq>(data).unwrap_err(),
+                read_fastq_records_from_reader::<_, DnaSeq>(data).unwrap_err(),
+            ];
+            for err in errors {
+                match err {
+                    BioError::FastqFormat { msg, line } => {
+                        assert_eq!(msg, expected);
+                        assert_eq!(line, expected_line);
+                    }
+                    other => panic!("expected fastq format error, got {other:?}"),
+                }
+            }
+        }
+    }
+
+    fn write_temp_fastq(data: &[u8]) -> std::path::PathBuf {
+        use std::time::{SystemTime, UNIX_EPOCH};
+
+        let nanos = SystemTime::now()
+            .duration_since(UNIX_EPOCH)
+            .unwrap()
+            .as_nanos();
+        let path = std::env::temp_dir().join(format!("biorust_fastq_test_{nanos}.fastq"));
+        std::fs::write(&path, data).unwrap();
+        path
+    }
+
+    fn read_streamed(path: &Path, chunk_bytes: usize) -> BioResult<Vec<SeqRecord<DnaSeq>>> {
+        let mut out = Vec::new();
+        let file = File::open(path).unwrap();
+        parse_fastq_stream(file, chunk_bytes, |id, desc, seq| {
+            out.push(make_record(id, desc, seq))
+        })?;
+        Ok(out)
+    }
+
+    #[test]
+    fn streamed_file_matches_bytes_at_any_chunk_size() {
+        let data: &[u8] = b"\n@seq1 desc\r\nACGT\r\n+seq1\r\nIIII\r\n\n\n@seq2\nGG\n+\n!!\n@seq3\n\n+\n\n@seq4\nTTA\n+\n!!!";
+        let path = write_temp_fastq(data);
+        let expected = read_fastq_records_from_bytes::<DnaSeq>(data).unwrap();
+        assert_eq!(expected.len(), 4);
+        for chunk_bytes in [1, 2, 3, 7, 16, 1024] {
+            assert_eq!(read_streamed(&path, chunk_bytes).unwrap(), expected);
+        }
+        assert_eq!(
+            read_fastq_batch_from_path::<DnaSeq>(&path).unwrap(),
+            RecordBatch::from_records(expected)
+        );
+        assert_eq!(detect_fastq_type_from_path(&path).unwrap(), SeqType::Dna);
+        std::fs::remove_file(&path).unwrap();
+
+        let bad: &[u8] = b"@a\nAC\n+\n!!\n@b\nAC\n-\n!!\n@c\nA\n+\n!\n";
+        let path = write_temp_fastq(bad);
+        for chunk_bytes in [1, 5, 1024] {
+            match read_streamed(&path, chunk_bytes).unwrap_err() {
+                BioError::FastqFormat { line, .. } => assert_eq!(line, 7),
+                other => panic!("expected fastq format error, got {other:?}"),
+            }
+        }
+        std::fs::remove_file(&path).unwrap();
+    }
+
+    #[test]
+    fn batch_matches_records() {
+        let data = b"@seq1 desc\nACGT\n+\nIIII\n@seq2\nGG\n+\n!!\n";
+        let batch = read_fastq_batch_from_bytes::<DnaSeq>(data).unwrap();
+        let records = read_fastq_records_from_bytes::<DnaSeq>(data).unwrap();
+        assert_eq!(batch, RecordBatch::from_records(records));
+    }
+
+    #[test]
+    fn detect_type_from_first_record() {
+        assert_eq!(detect_fastq_type(b"\n@a\nACGU\n+\n!!!!\n"), SeqType::Rna);
+        assert_eq!(
+            detect_fastq_type(b"@a\r\nMKV\r\n+\r\n!!!\r\n"),
+            SeqType::Protein
+        );
+        assert_eq!(detect_fastq_type(b"@a\nACGT\n+\n!!!!\n"), SeqType::Dna);
+        assert_eq!(detect_fastq_type(b">a\nMKV\n"), SeqType::Dna);
+        assert_eq!(detect_fastq_type(b""), SeqType::Dna);
+    }
+
+    #[test]
+    fn non_utf8_residue_is_invalid_char() {
+        let data = b"@seq1\nAC\xff\n+\n!!!\n";
+        let err = read_fastq_records_from_bytes::<DnaSeq>(data).unwrap_err();
+        assert!(matches!(err, BioError::InvalidChar { pos: 2, .. }));
+    }
+
     #[test]
     fn write_records() {
         let records = vec![SeqRecord::new(
@@ -405,4 +744,39 @@ mod tests {
         let text = String::from_utf8(out).unwrap();
         assert_eq!(text, "@seq1\nACGT\n+\nIIII\n");
     }
+
+    #[test]
+    fn write_batch_round_trips_and_flattens_header_breaks() {
+        let records = vec![
+            SeqRecord::new("seq1", DnaSeq::new(b"ACGT".to_vec()).unwrap())
+                .with_desc("two\nlines\r"),
+            SeqRecord::new("seq2", DnaSeq::new(Vec::new()).unwrap()).with_desc(""),
+        ];
+        let batch = RecordBatch::from_records(records);
+        let mut out = Vec::new();
+        write_fastq_batch_to_writer(&mut out, &batch, b'#').unwrap();
+        assert_eq!(out, b"@seq1 two lines \nACGT\n+\n####\n@seq2\n\n+\n\n");
+
+        let back = read_fastq_batch_from_bytes::<DnaSeq>(&out).unwrap();
+        assert_eq!(back.ids(), batch.ids());
+        assert_eq!(back.seqs(), batch.seqs());
+    }
+
+    #[test]
+    fn quality_line_tracks_each_read_length() {
+        let records: Vec<SeqRecord<DnaSeq>> = [3usize, 700, 5]
+            .iter()
+            .enumerate()
+            .map(|(i, &n)| SeqRecord::new(format!("r{i}"), DnaSeq::new(vec![b'A'; n]).unwrap()))
+            .collect();
+        let mut out = Vec::new();
+        write_fastq_records_to_writer(&mut out, &records, b'F').unwrap();
+
+        let quals: Vec<&[u8]> = lines(&out).skip(3).step_by(4).collect();
+        assert_eq!(quals.len(), 3);
+        for (qual, record) in quals.iter().zip(&records) {
+            assert_eq!(qual.len(), record.seq().as_bytes().len());
+            assert!(qual.iter().all(|&b| b == b'F'));
+        }
+    }
 }
@@ -3,6 +3,8 @@ pub mod detect;
 pub mod fasta;
 pub mod fastq;
 
+use memchr::memchr_iter;
+
 #[derive(Clone, Copy, Debug, PartialEq, Eq)]
 pub enum OnError {
     Raise,
@@ -32,3 +34,20 @@ pub fn normalize_seq_bytes(input: &str) -> Vec<u8> {
     }
     out
 }
+
+/// Lines of `data` without their trailing `\n`; a final unterminated line is included.
+pub(crate) fn lines(data: &[u8]) -> impl Iterator<Item = &[u8]> {
+    let mut start = 0usize;
+    memchr_iter(b'\n', data)
+        .map(Some)
+        .chain(std::iter::once(None))
+        .filter_map(move |end| {
+            let line = match end {
+                Some(end) => &data[start..end],
+                None if start < data.len() => &data[start..],
+                None => return None,
+            };
+            start = end.map_or(data.len(), |end| end + 1);
+            Some(line)
+        })
+}
@@ -1,5 +1,5 @@
 #[macro_use]
-mod par;
+pub mod par;
 
 pub mod align;
 pub mod alphabets;
@@ -1,10 +1,24 @@
+use crate::error::{BioError, BioResult};
+#[cfg(feature = "parallel")]
+use std::collections::BTreeMap;
+#[cfg(feature = "parallel")]
+use std::sync::{Arc, Mutex};
+
 /// Parallel map: apply `$f` to each element of `$slice`, collecting into a Vec.
+/// With a trailing `if $parallel`, fans out only when `$parallel` is true.
 macro_rules! par_map {
-    ($slice:expr, $f:expr) => {{
+    ($slice:expr, $f:expr) => {
+        par_map!($slice, $f, if true)
+    };
+    ($slice:expr, $f:expr, if $parallel:expr) => {{
         #[cfg(feature = "parallel")]
         {
             use rayon::iter::{IntoParallelRefIterator, ParallelIterator};
-            $slice.par_iter().map($f).collect()
+            if $parallel {
+                $slice.par_iter().map($f).collect()
+            } else {
+                $slice.iter().map($f).collect()
+            }
         }
         #[cfg(not(feature = "parallel"))]
         {
@@ -15,26 +29,40 @@ macro_rules! par_map {
 
 /// Parallel fallible map: apply `$f` returning Result to each element, collecting into Result<Vec>.
 macro_rules! par_try_map {
-    ($slice:expr, $f:expr) => {{
+    ($slice:expr, $f:expr) => {
+        par_try_map!($slice, $f, if true)
+    };
+    ($slice:expr, $f:expr, if $parallel:expr) => {{
         #[cfg(feature = "parallel")]
         {
             use rayon::iter::{IntoParallelRefIterator, ParallelIterator};
-            $slice.par_iter().map($f).collect()
+            if $parallel {
+                $slice.par_iter().map($f).collect()
+            } else {
+                $crate::par::try_map_serial($slice.iter(), $f)
+            }
         }
         #[cfg(not(feature = "parallel"))]
         {
-            $slice.iter().map($f).collect()
+            $crate::par::try_map_serial($slice.iter(), $f)
         }
     }};
 }
 
 /// Parallel mutable for-each: apply `$f` to each element of `$slice` in place.
 macro_rules! par_for_each_mut {
-    ($slice:expr, $f:expr) => {{
+    ($slice:expr, $f:expr) => {
+        par_for_each_mut!($slice, $f, if true)
+    };
+    ($slice:expr, $f:expr, if $parallel:expr) => {{
         #[cfg(feature = "parallel")]
         {
             use rayon::iter::{IntoParallelRefMutIterator, ParallelIterator};
-            $slice.par_iter_mut().for_each($f);
+            if $parallel {
+                $slice.par_iter_mut().for_each($f);
+            } else {
+                $slice.iter_mut().for_each($f);
+            }
         }
         #[cfg(not(feature = "parallel"))]
         {
@@ -42,3 +70,155 @@ macro_rules! par_for_each_mut {
         }
     }};
 }
+
+/// Parallel fallible mutable for-each: apply `$f` returning `Result<(), E>` to
+/// each element of `$slice` in place, stopping at an error.
+macro_rules! par_try_for_each_mut {
+    ($slice:expr, $f:expr) => {
+        par_try_for_each_mut!($slice, $f, if true)
+    };
+    ($slice:expr, $f:expr, if $parallel:expr) => {{
+        #[cfg(feature = "parallel")]
+        {
+            use rayon::iter::{IntoParallelRefMutIterator, ParallelIterator};
+            if $parallel {
+                $slice.par_iter_mut().try_for_each($f)
+            } else {
+                $slice.iter_mut().try_for_each($f)
+            }
+        }
+        #[cfg(not(feature = "parallel"))]
+        {
+            $slice.iter_mut().try_for_each($f)
+        }
+    }};
+}
+
+/// Serial arm of `par_try_map!`. Collecting an iterator of `Result`s into
+/// `Result<Vec<_>>` loses its exact length, so the output would grow by
+/// doubling; it is sized from `items` up front instead.
+pub(crate) fn try_map_serial<'a, T: 'a, U, E>(
+    items: impl ExactSizeIterator<Item = &'a T>,
+    mut f: impl FnMut(&'a T) -> Result<U, E>,
+) -> Result<Vec<U>, E> {
+    let mut out = Vec::with_capacity(items.len());
+    for item in items {
+        out.push(f(item)?);
+    }
+    Ok(out)
+}
+
+/// Below this many bytes of total input, batch kernels run serially: the
+/// work is too small to pay for handing it to the thread pool.
+pub const PAR_MIN_BYTES: usize = 256 * 1024;
+
+/// Environment variable read by [`init_global_pool_from_env`].
+pub const THREADS_ENV: &str = "BIORUST_THREADS";
+
+/// Size the global pool from `BIORUST_THREADS`, if it is set. Must run before
+/// anything touches the global pool. Without the `parallel` feature the
+/// variable is ignored.
+pub fn init_global_pool_from_env() -> BioResult<()> {
+    let Ok(value) = std::env::var(THREADS_ENV) else {
+        return Ok(());
+    };
+    let threads: usize = value.trim().parse().map_err(|_| BioError::ThreadPool {
+        msg: format!("{THREADS_ENV} must be a positive integer, got {value:?}"),
+    })?;
+    if threads == 0 {
+        return Err(BioError::InvalidThreadCount { threads });
+    }
+    #[cfg(feature = "parallel")]
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build_global()
+        .map_err(|e| BioError::ThreadPool { msg: e.to_string() })?;
+    Ok(())
+}
+
+/// Pools built for [`with_threads`], keyed by size. Building a pool spawns
+/// its workers, so each size is built on first use and then reused.
+#[cfg(feature = "parallel")]
+static POOLS: Mutex<BTreeMap<usize, Arc<rayon::ThreadPool>>> = Mutex::new(BTreeMap::new());
+
+#[cfg(feature = "parallel")]
+fn sized_pool(threads: usize) -> BioResult<Arc<rayon::ThreadPool>> {
+    let mut pools = POOLS.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(pool) = pools.get(&threads) {
+        return Ok(Arc::clone(pool));
+    }
+    let pool = rayon::ThreadPoolBuilder::new()
+        .num_threads(threads)
+        .build()
+        .map_err(|e| BioError::ThreadPool { msg: e.to_string() })?;
+    let pool = Arc::new(pool);
+    pools.insert(threads, Arc::clone(&pool));
+    Ok(pool)
+}
+
+/// Run `f` on a dedicated pool of `threads` workers, or on the global pool
+/// when `threads` is `None`. The pool for each size is shared by every call
+/// that asks for it. Without the `parallel` feature `f` runs inline.
+pub fn with_threads<R, F>(threads: Option<usize>, f: F) -> BioResult<R>
+where
+    R: Send,
+    F: FnOnce() -> R + Send,
+{
+    match threads {
+        #[cfg(feature = "parallel")]
+        Some(n) => {
+            if n == 0 {
+                return Err(BioError::InvalidThreadCount { threads: n });
+            }
+            Ok(sized_pool(n)?.install(f))
+        }
+        #[cfg(not(feature = "parallel"))]
+        Some(0) => Err(BioError::InvalidThreadCount { threads: 0 }),
+        _ => Ok(f()),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn try_map_serial_presizes_and_stops_at_first_error() {
+        let items = [1, 2, 3, 4];
+        let out: Result<Vec<i32>, i32> = try_map_serial(items.iter(), |&x| Ok(x * 10));
+        let out = out.unwrap();
+        assert_eq!(out, vec![10, 20, 30, 40]);
+        assert_eq!(out.capacity(), items.len());
+
+        let mut seen = 0;
+        let err = try_map_serial(items.iter(), |&x| {
+            seen += 1;
+            if x == 2 {
+                Err(x)
+            } else {
+                Ok(x)
+            }
+        });
+        assert_eq!(err, Err(2));
+        assert_eq!(seen, 2);
+    }
+
+    #[test]
+    fn with_threads_rejects_zero_and_runs_f() {
+        assert!(matches!(
+            with_threads(Some(0), || ()),
+            Err(BioError::InvalidThreadCount { threads: 0 })
+        ));
+        assert_eq!(with_threads(Some(2), || 7).unwrap(), 7);
+        assert_eq!(with_threads(None, || 7).unwrap(), 7);
+    }
+
+    #[cfg(feature = "parallel")]
+    #[test]
+    fn sized_pools_are_built_once_per_size() {
+        let a = sized_pool(3).unwrap();
+        let b = sized_pool(3).unwrap();
+        assert!(Arc::ptr_eq(&a, &b));
+        assert!(!Arc::ptr_eq(&a, &sized_pool(5).unwrap()));
+    }
+}
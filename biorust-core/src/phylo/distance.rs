@@ -1,4 +1,5 @@
 use crate::error::{BioError, BioResult};
+use crate::par::PAR_MIN_BYTES;
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum DnaDistanceModel {
@@ -13,14 +14,33 @@ pub enum ProteinDistanceModel {
     Poisson,
 }
 
+/// Symmetric distance matrix with a zero diagonal.
+///
+/// Only the pairs `i < j` are stored, row by row in `upper`: half the
+/// memory of the square form, and each distance is written once.
 #[derive(Debug, Clone)]
 pub struct DistanceMatrix {
     labels: Vec<Box<str>>,
-    data: Vec<f64>,
+    upper: Vec<f64>,
     n: usize,
 }
 
+/// Number of pairs `i < j` among `n` items.
+#[inline]
+fn pair_count(n: usize) -> usize {
+    n * n.saturating_sub(1) / 2
+}
+
+/// Position of pair `(i, i + 1)`, where row `i` starts, in the upper
+/// triangle of an `n x n` matrix. `row_start(n, n)` is the pair count.
+#[inline]
+fn row_start(n: usize, i: usize) -> usize {
+    i * (2 * n - i - 1) / 2
+}
+
 impl DistanceMatrix {
+    /// From a row-major `n x n` matrix. Only the entries above the diagonal
+    /// are read; the matrix is taken to be symmetric with a zero diagonal.
     pub fn new(labels: Vec<Box<str>>, data: Vec<f64>) -> Self {
         let n = labels.len();
         assert_eq!(
@@ -30,7 +50,25 @@ impl DistanceMatrix {
             n * n,
             data.len()
         );
-        Self { labels, data, n }
+        let mut upper = Vec::with_capacity(pair_count(n));
+        for i in 0..n {
+            upper.extend_from_slice(&data[i * n + i + 1..(i + 1) * n]);
+        }
+        Self { labels, upper, n }
+    }
+
+    /// From the entries above the diagonal, row by row: `(0, 1), (0, 2),
+    /// ..., (1, 2), ...`.
+    pub fn from_upper_triangle(labels: Vec<Box<str>>, upper: Vec<f64>) -> Self {
+        let n = labels.len();
+        assert_eq!(
+            upper.len(),
+            pair_count(n),
+            "distance matrix data length mismatch: expected {}, got {}",
+            pair_count(n),
+            upper.len()
+        );
+        Self { labels, upper, n }
     }
 
     pub fn n(&self) -> usize {
@@ -41,73 +79,285 @@ impl DistanceMatrix {
         &self.labels
     }
 
-    pub fn data(&self) -> &[f64] {
-        &self.data
+    /// The stored entries above the diagonal, row by row.
+    pub fn upper_triangle(&self) -> &[f64] {
+        &self.upper
+    }
+
+    /// Row-major `n x n` copy of the matrix.
+    pub fn data(&self) -> Vec<f64> {
+        let mut out = Vec::with_capacity(self.n * self.n);
+        for i in 0..self.n {
+            self.extend_row(i, &mut out);
+        }
+        out
+    }
+
+    /// Append row `i` of the square matrix to `out`. The part right of the
+    /// diagonal is contiguous in storage; the part left of it is column `i`
+    /// of the rows above.
+    pub fn extend_row(&self, i: usize, out: &mut Vec<f64>) {
+        assert!(i < self.n, "row {i} out of range for {} labels", self.n);
+        out.reserve(self.n);
+        out.extend((0..i).map(|j| self.upper[self.index(j, i)]));
+        out.push(0.0);
+        let start = self.index(i, i + 1);
+        out.extend_from_slice(&self.upper[start..start + (self.n - i - 1)]);
+    }
+
+    /// Position of pair `i < j` in `upper`.
+    #[inline]
+    fn index(&self, i: usize, j: usize) -> usize {
+        row_start(self.n, i) + (j - i - 1)
     }
 
     pub fn get(&self, i: usize, j: usize) -> f64 {
-        self.data[i * self.n + j]
+        assert!(
+            i < self.n && j < self.n,
+            "index ({i}, {j}) out of range for {} labels",
+            self.n
+        );
+        match i.cmp(&j) {
+            std::cmp::Ordering::Less => self.upper[self.index(i, j)],
+            std::cmp::Ordering::Greater => self.upper[self.index(j, i)],
+            std::cmp::Ordering::Equal => 0.0,
+        }
     }
 
+    /// Set the distance between `i` and `j` (both orders). The diagonal is
+    /// fixed at zero.
     pub fn set(&mut self, i: usize, j: usize, val: f64) {
-        self.data[i * self.n + j] = val;
-        self.data[j * self.n + i] = val;
+        assert!(
+            i < self.n && j < self.n,
+            "index ({i}, {j}) out of range for {} labels",
+            self.n
+        );
+        assert_ne!(i, j, "the diagonal of a distance matrix is fixed at zero");
+        let k = self.index(i.min(j), i.max(j));
+        self.upper[k] = val;
     }
 }
 
-#[inline]
-fn is_gap(b: u8) -> bool {
-    b == b'-' || b == b'.'
+/// Site code for a DNA column entry that never counts (gap, ambiguity code).
+const DNA_SKIP: u8 = 0x80;
+
+/// Encode a DNA row so that pair counting needs no branches: `A`, `G`, `C`,
+/// `T` (either case) become 0, 1, 2, 3, and everything else [`DNA_SKIP`].
+/// Bit 1 separates purines from pyrimidines, so a mismatch is a transversion
+/// exactly when that bit differs.
+fn encode_dna(seq: &[u8], out: &mut Vec<u8>) {
+    out.extend(seq.iter().map(|&b| match b.to_ascii_uppercase() {
+        b'A' => 0,
+        b'G' => 1,
+        b'C' => 2,
+        b'T' => 3,
+        _ => DNA_SKIP,
+    }));
 }
 
-fn count_dna_differences(a: &[u8], b: &[u8]) -> (usize, usize, usize) {
-    let mut transitions = 0usize;
-    let mut transversions = 0usize;
-    let mut valid = 0usize;
+/// Encode a protein row: residues are uppercased and both gap characters
+/// become `-`, so a site compares with plain byte equality.
+fn encode_protein(seq: &[u8], out: &mut Vec<u8>) {
+    out.extend(seq.iter().map(|&b| match b {
+        b'.' => b'-',
+        _ => b.to_ascii_uppercase(),
+    }));
+}
 
-    for (&x, &y) in a.iter().zip(b.iter()) {
-        if is_gap(x) || is_gap(y) {
-            continue;
-        }
-        let xu = x.to_ascii_uppercase();
-        let yu = y.to_ascii_uppercase();
-        if !matches!(xu, b'A' | b'C' | b'G' | b'T') || !matches!(yu, b'A' | b'C' | b'G' | b'T') {
-            continue;
-        }
-        valid += 1;
-        if xu == yu {
-            continue;
-        }
-        // Transitions: A<->G, C<->T
-        let is_ts = matches!(
-            (xu, yu),
-            (b'A', b'G') | (b'G', b'A') | (b'C', b'T') | (b'T', b'C')
-        );
-        if is_ts {
-            transitions += 1;
-        } else {
-            transversions += 1;
+/// All rows encoded back to back in one buffer of `n * len` codes.
+fn encode_rows(seqs: &[&[u8]], encode: fn(&[u8], &mut Vec<u8>)) -> Vec<u8> {
+    let len = seqs.first().map_or(0, |s| s.len());
+    let mut codes = Vec::with_capacity(seqs.len() * len);
+    for seq in seqs {
+        encode(seq, &mut codes);
+    }
+    codes
+}
+
+/// `(transitions, transversions, valid sites)` between two encoded DNA rows.
+fn count_dna_differences(a: &[u8], b: &[u8]) -> (usize, usize, usize) {
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            return unsafe { avx2::dna_counts(a, b) };
         }
+        // SAFETY: SSE2 is part of the x86_64 baseline.
+        unsafe { sse2::dna_counts(a, b) }
+    }
+    #[cfg(not(all(feature = "simd", target_arch = "x86_64")))]
+    {
+        dna_counts_scalar(a, b)
     }
+}
 
-    (transitions, transversions, valid)
+fn dna_counts_scalar(a: &[u8], b: &[u8]) -> (usize, usize, usize) {
+    let (mut diffs, mut transversions, mut valid) = (0, 0, 0);
+    for (&x, &y) in a.iter().zip(b) {
+        let site = ((x | y) & DNA_SKIP == 0) as usize;
+        valid += site;
+        diffs += site & (x != y) as usize;
+        transversions += site & ((x ^ y) >> 1) as usize;
+    }
+    (diffs - transversions, transversions, valid)
 }
 
+/// `(mismatches, valid sites)` between two encoded protein rows.
 fn count_protein_differences(a: &[u8], b: &[u8]) -> (usize, usize) {
-    let mut mismatches = 0usize;
-    let mut valid = 0usize;
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            return unsafe { avx2::protein_counts(a, b) };
+        }
+        // SAFETY: SSE2 is part of the x86_64 baseline.
+        unsafe { sse2::protein_counts(a, b) }
+    }
+    #[cfg(not(all(feature = "simd", target_arch = "x86_64")))]
+    {
+        protein_counts_scalar(a, b)
+    }
+}
+
+fn protein_counts_scalar(a: &[u8], b: &[u8]) -> (usize, usize) {
+    let (mut mismatches, mut valid) = (0, 0);
+    for (&x, &y) in a.iter().zip(b) {
+        let site = (x != b'-' && y != b'-') as usize;
+        valid += site;
+        mismatches += site & (x != y) as usize;
+    }
+    (mismatches, valid)
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod sse2 {
+    use std::arch::x86_64::*;
 
-    for (&x, &y) in a.iter().zip(b.iter()) {
-        if is_gap(x) || is_gap(y) {
-            continue;
+    #[inline]
+    unsafe fn bits(mask: __m128i) -> usize {
+        _mm_movemask_epi8(mask).count_ones() as usize
+    }
+
+    /// Per 16 sites: a site is valid when neither code has the skip bit set
+    /// (signed > -1), differs when the codes are unequal, and is a
+    /// transversion when bit 1 of `a ^ b` is set. Each mask is counted with
+    /// `movemask` + `popcnt`.
+    pub(super) unsafe fn dna_counts(a: &[u8], b: &[u8]) -> (usize, usize, usize) {
+        let all = _mm_set1_epi8(-1);
+        let ts_bit = _mm_set1_epi8(2);
+        let (mut diffs, mut transversions, mut valid) = (0, 0, 0);
+
+        let (ca, cb) = (a.chunks_exact(16), b.chunks_exact(16));
+        let (ra, rb) = (ca.remainder(), cb.remainder());
+        for (x, y) in ca.zip(cb) {
+            let x = _mm_loadu_si128(x.as_ptr() as *const __m128i);
+            let y = _mm_loadu_si128(y.as_ptr() as *const __m128i);
+            let site = _mm_cmpgt_epi8(_mm_or_si128(x, y), all);
+            let diff = _mm_andnot_si128(_mm_cmpeq_epi8(x, y), site);
+            let xor = _mm_and_si128(_mm_xor_si128(x, y), ts_bit);
+            let tv = _mm_and_si128(_mm_cmpeq_epi8(xor, ts_bit), site);
+            valid += bits(site);
+            diffs += bits(diff);
+            transversions += bits(tv);
         }
-        valid += 1;
-        if !x.eq_ignore_ascii_case(&y) {
-            mismatches += 1;
+
+        let (ts_r, tv_r, valid_r) = super::dna_counts_scalar(ra, rb);
+        (
+            diffs - transversions + ts_r,
+            transversions + tv_r,
+            valid + valid_r,
+        )
+    }
+
+    pub(super) unsafe fn protein_counts(a: &[u8], b: &[u8]) -> (usize, usize) {
+        let gap = _mm_set1_epi8(b'-' as i8);
+        let (mut mismatches, mut gaps) = (0, 0);
+
+        let (ca, cb) = (a.chunks_exact(16), b.chunks_exact(16));
+        let (ra, rb) = (ca.remainder(), cb.remainder());
+        for (x, y) in ca.zip(cb) {
+            let x = _mm_loadu_si128(x.as_ptr() as *const __m128i);
+            let y = _mm_loadu_si128(y.as_ptr() as *const __m128i);
+            let skip = _mm_or_si128(_mm_cmpeq_epi8(x, gap), _mm_cmpeq_epi8(y, gap));
+            gaps += bits(skip);
+            mismatches += bits(_mm_andnot_si128(
+                _mm_or_si128(_mm_cmpeq_epi8(x, y), skip),
+                _mm_set1_epi8(-1),
+            ));
         }
+
+        let (mismatches_r, valid_r) = super::protein_counts_scalar(ra, rb);
+        (
+            mismatches + mismatches_r,
+            a.len() - ra.len() - gaps + valid_r,
+        )
     }
+}
 
-    (mismatches, valid)
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod avx2 {
+    use std::arch::x86_64::*;
+
+    #[inline]
+    #[target_feature(enable = "avx2")]
+    unsafe fn bits(mask: __m256i) -> usize {
+        _mm256_movemask_epi8(mask).count_ones() as usize
+    }
+
+    /// 32-byte version of `sse2::dna_counts`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn dna_counts(a: &[u8], b: &[u8]) -> (usize, usize, usize) {
+        let all = _mm256_set1_epi8(-1);
+        let ts_bit = _mm256_set1_epi8(2);
+        let (mut diffs, mut transversions, mut valid) = (0, 0, 0);
+
+        let (ca, cb) = (a.chunks_exact(32), b.chunks_exact(32));
+        let (ra, rb) = (ca.remainder(), cb.remainder());
+        for (x, y) in ca.zip(cb) {
+            let x = _mm256_loadu_si256(x.as_ptr() as *const __m256i);
+            let y = _mm256_loadu_si256(y.as_ptr() as *const __m256i);
+            let site = _mm256_cmpgt_epi8(_mm256_or_si256(x, y), all);
+            let diff = _mm256_andnot_si256(_mm256_cmpeq_epi8(x, y), site);
+            let xor = _mm256_and_si256(_mm256_xor_si256(x, y), ts_bit);
+            let tv = _mm256_and_si256(_mm256_cmpeq_epi8(xor, ts_bit), site);
+            valid += bits(site);
+            diffs += bits(diff);
+            transversions += bits(tv);
+        }
+
+        let (ts_r, tv_r, valid_r) = super::sse2::dna_counts(ra, rb);
+        (
+            diffs - transversions + ts_r,
+            transversions + tv_r,
+            valid + valid_r,
+        )
+    }
+
+    /// 32-byte version of `sse2::protein_counts`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn protein_counts(a: &[u8], b: &[u8]) -> (usize, usize) {
+        let gap = _mm256_set1_epi8(b'-' as i8);
+        let (mut mismatches, mut gaps) = (0, 0);
+
+        let (ca, cb) = (a.chunks_exact(32), b.chunks_exact(32));
+        let (ra, rb) = (ca.remainder(), cb.remainder());
+        for (x, y) in ca.zip(cb) {
+            let x = _mm256_loadu_si256(x.as_ptr() as *const __m256i);
+            let y = _mm256_loadu_si256(y.as_ptr() as *const __m256i);
+            let skip = _mm256_or_si256(_mm256_cmpeq_epi8(x, gap), _mm256_cmpeq_epi8(y, gap));
+            gaps += bits(skip);
+            mismatches += bits(_mm256_andnot_si256(
+                _mm256_or_si256(_mm256_cmpeq_epi8(x, y), skip),
+                _mm256_set1_epi8(-1),
+            ));
+        }
+
+        let (mismatches_r, valid_r) = super::sse2::protein_counts(ra, rb);
+        (
+            mismatches + mismatches_r,
+            a.len() - ra.len() - gaps + valid_r,
+        )
+    }
 }
 
 fn compute_dna_pair_distance(
@@ -207,29 +457,104 @@ fn validate_distance_inputs(seqs: &[&[u8]], labels: &[Box<str>]) -> BioResult<()
     Ok(())
 }
 
+/// Bytes of encoded rows a pair tile aims to keep cache-resident (two
+/// blocks of rows, sized for a typical per-core L2).
+const TILE_BYTES: usize = 256 * 1024;
+
+/// Rows per block, so that two blocks of encoded rows fit in [`TILE_BYTES`].
+fn block_rows(n: usize, len: usize) -> usize {
+    (TILE_BYTES / (2 * len.max(1))).clamp(1, n.max(1))
+}
+
+/// Split `upper` into strips of `block` rows, each paired with its first
+/// row. Each row's pairs are contiguous, so a strip is one disjoint slice
+/// that its task can write without sharing.
+pub(crate) fn row_strips(upper: &mut [f64], n: usize, block: usize) -> Vec<(usize, &mut [f64])> {
+    let mut strips = Vec::with_capacity(n.div_ceil(block));
+    let mut rest = upper;
+    for first in (0..n).step_by(block) {
+        let end = (first + block).min(n);
+        let (strip, tail) = rest.split_at_mut(row_start(n, end) - row_start(n, first));
+        strips.push((first, strip));
+        rest = tail;
+    }
+    strips
+}
+
+/// Whether the pair scans are worth fanning out: below [`PAR_MIN_BYTES`]
+/// site comparisons the thread pool costs more than it saves.
+#[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+fn use_parallel(n: usize, len: usize) -> bool {
+    pair_count(n) * len >= PAR_MIN_BYTES
+}
+
+/// Fill a symmetric matrix from `distance(row_i, row_j, i, j)` over the
+/// encoded rows in `codes`, with a strip of rows as the unit of parallel
+/// work. A strip walks the column blocks at or right of it one tile at a
+/// time: each tile pairs the strip's `B` rows with one block's `B` rows,
+/// so those `2B` rows stay cache-resident for its `B²` pairs instead of
+/// row `j` streaming past every `i`. Distances go straight into the
+/// strip's own part of the triangle. On failure the error names the first
+/// failing pair in row-major order, whatever the tiling or scheduling.
+fn fill_matrix<F>(
+    labels: Vec<Box<str>>,
+    codes: &[u8],
+    len: usize,
+    distance: F,
+) -> BioResult<DistanceMatrix>
+where
+    F: Fn(&[u8], &[u8], usize, usize) -> BioResult<f64> + Sync,
+{
+    let n = labels.len();
+    let row = |i: usize| &codes[i * len..(i + 1) * len];
+    let block = block_rows(n, len);
+
+    let mut upper = vec![0.0; pair_count(n)];
+    let mut strips = row_strips(&mut upper, n, block);
+    let filled = par_try_for_each_mut!(
+        &mut strips,
+        |(first, out): &mut (usize, &mut [f64])| -> BioResult<()> {
+            let first = *first;
+            let base = row_start(n, first);
+            for bj in (first..n).step_by(block) {
+                for i in first..(first + block).min(n) {
+                    let lo = if bj == first { i + 1 } else { bj };
+                    let start = row_start(n, i) - base;
+                    for j in lo..(bj + block).min(n) {
+                        out[start + (j - i - 1)] = distance(row(i), row(j), i, j)?;
+                    }
+                }
+            }
+            Ok(())
+        },
+        if use_parallel(n, len)
+    );
+
+    if let Err(err) = filled {
+        // Which failing pair a strip reaches first depends on tile order,
+        // and which strip fails first on scheduling. Report the first one
+        // in row-major order instead, as a plain pair scan would.
+        for i in 0..n {
+            for j in (i + 1)..n {
+                distance(row(i), row(j), i, j)?;
+            }
+        }
+        return Err(err);
+    }
+
+    Ok(DistanceMatrix::from_upper_triangle(labels, upper))
+}
+
 pub fn dna_distance_matrix(
     seqs: &[&[u8]],
     labels: Vec<Box<str>>,
     model: DnaDistanceModel,
 ) -> BioResult<DistanceMatrix> {
     validate_distance_inputs(seqs, &labels)?;
-    let n = seqs.len();
-
-    let pairs: Vec<(usize, usize)> = (0..n)
-        .flat_map(|i| ((i + 1)..n).map(move |j| (i, j)))
-        .collect();
-
-    let results: BioResult<Vec<(usize, usize, f64)>> = par_try_map!(&pairs, |&(i, j)| {
-        compute_dna_pair_distance(seqs[i], seqs[j], model, i, j).map(|d| (i, j, d))
-    });
-
-    let mut data = vec![0.0f64; n * n];
-    for (i, j, d) in results? {
-        data[i * n + j] = d;
-        data[j * n + i] = d;
-    }
-
-    Ok(DistanceMatrix::new(labels, data))
+    let codes = encode_rows(seqs, encode_dna);
+    fill_matrix(labels, &codes, seqs[0].len(), |a, b, i, j| {
+        compute_dna_pair_distance(a, b, model, i, j)
+    })
 }
 
 pub fn protein_distance_matrix(
@@ -238,21 +563,8 @@ pub fn protein_distance_matrix(
     model: ProteinDistanceModel,
 ) -> BioResult<DistanceMatrix> {
     validate_distance_inputs(seqs, &labels)?;
-    let n = seqs.len();
-
-    let pairs: Vec<(usize, usize)> = (0..n)
-        .flat_map(|i| ((i + 1)..n).map(move |j| (i, j)))
-        .collect();
-
-    let results: BioResult<Vec<(usize, usize, f64)>> = par_try_map!(&pairs, |&(i, j)| {
-        compute_protein_pair_distance(seqs[i], seqs[j], model, i, j).map(|d| (i, j, d))
-    });
-
-    let mut data = vec![0.0f64; n * n];
-    for (i, j, d) in results? {
-        data[i * n + j] = d;
-        data[j * n + i] = d;
-    }
-
-    Ok(DistanceMatrix::new(labels, data))
+    let codes = encode_rows(seqs, encode_protein);
+    fill_matrix(labels, &codes, seqs[0].len(), |a, b, i, j| {
+        compute_protein_pair_distance(a, b, model, i, j)
+    })
 }
@@ -130,6 +130,179 @@ fn poisson_saturated() {
     assert!(result.is_err());
 }
 
+// ─── long alignments (vector kernels) ───────────────────────
+
+/// Deterministic alignment rows mixing cases, gaps and ambiguity codes.
+fn long_rows(alphabet: &[u8], n: usize, len: usize) -> Vec<Vec<u8>> {
+    (0..n)
+        .map(|r| {
+            (0..len)
+                .map(|i| {
+                    // rows share most sites; about a quarter are shifted per row
+                    let shift = if (i + r) % 4 == 0 { r } else { 0 };
+                    alphabet[(i * 3 + i / 7 + shift) % alphabet.len()]
+                })
+                .collect()
+        })
+        .collect()
+}
+
+#[test]
+fn dna_long_rows_match_site_by_site_counts() {
+    let rows = long_rows(b"ACGTacgtAAGGCT-.NR", 4, 103);
+    let code = |b: u8| b"AGCT".iter().position(|&c| c == b.to_ascii_uppercase());
+    let mut k2p_checked = 0;
+
+    for i in 0..4 {
+        for j in (i + 1)..4 {
+            let (mut ts, mut tv, mut valid) = (0.0, 0.0, 0.0);
+            for (&x, &y) in rows[i].iter().zip(&rows[j]) {
+                if let (Some(x), Some(y)) = (code(x), code(y)) {
+                    valid += 1.0;
+                    // purines A, G are codes 0, 1; pyrimidines C, T are 2, 3
+                    match (x != y, x / 2 != y / 2) {
+                        (true, false) => ts += 1.0,
+                        (true, true) => tv += 1.0,
+                        _ => {}
+                    }
+                }
+            }
+            let pair: Vec<&[u8]> = vec![&rows[i], &rows[j]];
+            let dist = |model| dna_distance_matrix(&pair, labels(&["a", "b"]), model);
+
+            let p = dist(DnaDistanceModel::PDistance).unwrap().get(0, 1);
+            assert!((p - (ts + tv) / valid).abs() < 1e-12);
+
+            let (a1, a2) = (1.0 - 2.0 * ts / valid - tv / valid, 1.0 - 2.0 * tv / valid);
+            match dist(DnaDistanceModel::Kimura2P) {
+                Ok(dm) => {
+                    k2p_checked += 1;
+                    let expected = -0.5 * f64::ln(a1) - 0.25 * f64::ln(a2);
+                    assert!((dm.get(0, 1) - expected).abs() < 1e-12);
+                }
+                Err(_) => assert!(a1 <= 0.0 || a2 <= 0.0),
+            }
+        }
+    }
+    assert!(k2p_checked > 0);
+}
+
+#[test]
+fn protein_long_rows_match_site_by_site_counts() {
+    let rows = long_rows(b"ACDEFGHIKLMNPQRSTVWYacdxX-.", 3, 77);
+    let seqs: Vec<&[u8]> = rows.iter().map(|r| r.as_slice()).collect();
+    let dm = protein_distance_matrix(
+        &seqs,
+        labels(&["a", "b", "c"]),
+        ProteinDistanceModel::PDistance,
+    )
+    .unwrap();
+
+    for i in 0..3 {
+        for j in (i + 1)..3 {
+            let (mut diffs, mut valid) = (0, 0);
+            for (&x, &y) in seqs[i].iter().zip(seqs[j]) {
+                if !b"-.".contains(&x) && !b"-.".contains(&y) {
+                    valid += 1;
+                    diffs += !x.eq_ignore_ascii_case(&y) as usize;
+                }
+            }
+            assert!((dm.get(i, j) - diffs as f64 / valid as f64).abs() < 1e-12);
+        }
+    }
+}
+
+#[test]
+fn row_strips_partition_the_triangle() {
+    for (n, block) in [(0usize, 1), (1, 1), (5, 1), (9, 3), (10, 4), (40, 40)] {
+        let total = n * n.saturating_sub(1) / 2;
+        let mut upper: Vec<f64> = (0..total).map(|k| k as f64).collect();
+        let strips = distance::row_strips(&mut upper, n, block);
+        let firsts: Vec<usize> = strips.iter().map(|(first, _)| *first).collect();
+        assert_eq!(firsts, (0..n).step_by(block).collect::<Vec<_>>());
+
+        let mut next = 0;
+        for (first, strip) in &strips {
+            let rows = *first..(*first + block).min(n);
+            let pairs: usize = rows.map(|i| n - i - 1).sum();
+            assert_eq!(strip.len(), pairs, "n={n} block={block} first={first}");
+            if let Some(&head) = strip.first() {
+                assert_eq!(head, next as f64);
+            }
+            next += pairs;
+        }
+        assert_eq!(next, total);
+    }
+}
+
+#[test]
+fn tiled_fill_matches_each_pair() {
+    // Rows long enough that a block is 3 rows, so the 9 rows span three
+    // strips and off-diagonal tiles.
+    let len = 40_000;
+    let owned: Vec<Vec<u8>> = (0..9u64)
+        .map(|s| {
+            let mut x = s.wrapping_mul(0x9e37_79b9_7f4a_7c15) | 1;
+            (0..len)
+                .map(|_| {
+                    x ^= x << 13;
+                    x ^= x >> 7;
+                    x ^= x << 17;
+                    b"ACGT"[(x & 3) as usize]
+                })
+                .collect()
+        })
+        .collect();
+    let seqs: Vec<&[u8]> = owned.iter().map(|s| s.as_slice()).collect();
+    let names: Vec<String> = (0..9).map(|i| format!("s{i}")).collect();
+    let names: Vec<&str> = names.iter().map(|s| s.as_str()).collect();
+    let dm = dna_distance_matrix(&seqs, labels(&names), DnaDistanceModel::PDistance).unwrap();
+
+    for i in 0..9 {
+        for j in (i + 1)..9 {
+            let diffs = seqs[i].iter().zip(seqs[j]).filter(|(a, b)| a != b).count();
+            let expected = diffs as f64 / len as f64;
+            assert!((dm.get(i, j) - expected).abs() < 1e-12, "({i}, {j})");
+            assert_eq!(dm.get(j, i), dm.get(i, j));
+        }
+    }
+}
+
+#[test]
+fn tiled_fill_reports_first_failing_pair_in_row_order() {
+    // Blocks of 3 rows, so the 9 rows form three strips. A pair has no
+    // valid sites when the thirds its rows gap cover the whole width. The
+    // failing pairs are (1, 3) and (0, 7) in the first strip, which tile
+    // order reaches in that order, and (4, 5) in the second. Later pairs
+    // (3, 5), (3, 7) and (5, 7) also fail.
+    let third = 13_333;
+    let gaps: [&[usize]; 9] = [&[0], &[1], &[], &[0, 2], &[2], &[0, 1], &[], &[1, 2], &[]];
+    let owned: Vec<Vec<u8>> = gaps
+        .iter()
+        .map(|thirds| {
+            (0..3 * third)
+                .map(|c| {
+                    if thirds.contains(&(c / third)) {
+                        b'-'
+                    } else {
+                        b"ACGT"[c % 4]
+                    }
+                })
+                .collect()
+        })
+        .collect();
+    let seqs: Vec<&[u8]> = owned.iter().map(|s| s.as_slice()).collect();
+    let names: Vec<String> = (0..9).map(|i| format!("s{i}")).collect();
+    let names: Vec<&str> = names.iter().map(|s| s.as_str()).collect();
+
+    for _ in 0..5 {
+        match dna_distance_matrix(&seqs, labels(&names), DnaDistanceModel::PDistance) {
+            Err(crate::error::BioError::NoValidSites { i, j }) => assert_eq!((i, j), (0, 7)),
+            other => panic!("expected no valid sites, got {other:?}"),
+        }
+    }
+}
+
 // ─── no valid sites ─────────────────────────────────────────
 
 #[test]
@@ -325,6 +498,36 @@ fn dm_set_symmetric() {
     assert!((dm.get(2, 0) - 5.0).abs() < 1e-10);
 }
 
+#[test]
+fn dm_stores_upper_triangle() {
+    let names = labels(&["a", "b", "c", "d"]);
+    let data = vec![
+        0.0, 1.0, 2.0, 3.0, //
+        1.0, 0.0, 4.0, 5.0, //
+        2.0, 4.0, 0.0, 6.0, //
+        3.0, 5.0, 6.0, 0.0, //
+    ];
+    let dm = DistanceMatrix::new(names.clone(), data.clone());
+    assert_eq!(dm.upper_triangle(), &[1.0, 2.0, 3.0, 4.0, 5.0, 6.0]);
+    assert_eq!(dm.data(), data);
+    for i in 0..4 {
+        let mut row = Vec::new();
+        dm.extend_row(i, &mut row);
+        assert_eq!(row, &data[i * 4..(i + 1) * 4]);
+    }
+
+    let packed = DistanceMatrix::from_upper_triangle(names, dm.upper_triangle().to_vec());
+    for i in 0..4 {
+        for j in 0..4 {
+            assert_eq!(packed.get(i, j), data[i * 4 + j]);
+        }
+    }
+
+    let single = DistanceMatrix::new(labels(&["x"]), vec![0.0]);
+    assert!(single.upper_triangle().is_empty());
+    assert_eq!(single.data(), vec![0.0]);
+}
+
 // ─── node counts ────────────────────────────────────────────
 
 #[test]
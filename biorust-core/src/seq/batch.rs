@@ -1,18 +1,25 @@
 use crate::error::{BioError, BioResult};
+use crate::par::PAR_MIN_BYTES;
 use crate::seq::bytes::IntoNeedle;
 use crate::seq::dna::DnaSeq;
 use crate::seq::dna::ReverseComplement;
-use crate::seq::protein::ProteinSeq;
+use crate::seq::protein::{ProteinSeq, ResidueCounts};
 use crate::seq::rna::RnaSeq;
 use crate::seq::traits::SeqBytes;
 use crate::seq::TranslationFrame;
-use std::ops::Index;
+use std::ops::{Index, RangeInclusive};
 
 #[derive(Clone, Debug, PartialEq, Eq)]
 pub struct SeqBatch<S: SeqBytes> {
     seqs: Vec<S>,
 }
 
+/// Inclusive length range for `filter_by_len`, or `None` if it is empty.
+fn len_bounds(min_len: Option<usize>, max_len: Option<usize>) -> Option<RangeInclusive<usize>> {
+    let bounds = min_len.unwrap_or(0)..=max_len.unwrap_or(usize::MAX);
+    (!bounds.is_empty()).then_some(bounds)
+}
+
 impl<S: SeqBytes> SeqBatch<S> {
     pub fn new(seqs: Vec<S>) -> Self {
         Self { seqs }
@@ -42,6 +49,18 @@ impl<S: SeqBytes> SeqBatch<S> {
         self.seqs.iter()
     }
 
+    /// Total residue count across the batch.
+    pub fn total_len(&self) -> usize {
+        self.seqs.iter().map(|seq| seq.as_bytes().len()).sum()
+    }
+
+    /// Whether batch-wide kernels should fan out across threads: tiny batches
+    /// cost more to schedule than to process serially.
+    #[cfg_attr(not(feature = "parallel"), allow(dead_code))]
+    fn use_parallel(&self) -> bool {
+        self.seqs.len() > 1 && self.total_len() >= PAR_MIN_BYTES
+    }
+
     pub fn slice(&self, start: usize, stop: usize, step: usize) -> Self {
         assert!(step >= 1, "step must be >= 1");
 
@@ -78,21 +97,27 @@ impl<S: SeqBytes> SeqBatch<S> {
     }
 
     pub fn filter_by_len(&self, min_len: Option<usize>, max_len: Option<usize>) -> Self {
-        let min_len = min_len.unwrap_or(0);
-        let max_len = max_len.unwrap_or(usize::MAX);
-
-        if min_len > max_len {
+        let Some(bounds) = len_bounds(min_len, max_len) else {
             return Self { seqs: Vec::new() };
-        }
+        };
+        let seqs = self
+            .seqs
+            .iter()
+            .filter(|seq| bounds.contains(&seq.as_bytes().len()))
+            .cloned()
+            .collect();
+        Self { seqs }
+    }
 
-        let mut out = Vec::with_capacity(self.seqs.len());
-        for seq in &self.seqs {
-            let len = seq.as_bytes().len();
-            if len >= min_len && len <= max_len {
-                out.push(seq.clone());
-            }
+    /// In-place [`filter_by_len`](Self::filter_by_len): drops out-of-range
+    /// sequences without cloning the ones that are kept.
+    pub fn retain_by_len(&mut self, min_len: Option<usize>, max_len: Option<usize>) {
+        match len_bounds(min_len, max_len) {
+            Some(bounds) => self
+                .seqs
+                .retain(|seq| bounds.contains(&seq.as_bytes().len())),
+            None => self.seqs.clear(),
         }
-        Self { seqs: out }
     }
 
     pub fn concat_all(&self) -> BioResult<S> {
@@ -100,13 +125,7 @@ impl<S: SeqBytes> SeqBatch<S> {
             return Err(BioError::EmptyBatch);
         }
 
-        let total_len: usize = self.seqs.iter().map(|seq| seq.as_bytes().len()).sum();
-        let mut out = Vec::with_capacity(total_len);
-        for seq in &self.seqs {
-            out.extend_from_slice(seq.as_bytes());
-        }
-
-        S::from_bytes(out)
+        Ok(S::concat(&self.seqs))
     }
 
     pub fn map<F>(&self, f: F) -> BioResult<Self>
@@ -131,6 +150,22 @@ impl<S: SeqBytes> SeqBatch<S> {
         self.seqs.extend(iter);
     }
 
+    /// Repeat the batch contents `n` times in place (`n == 0` empties it).
+    /// The final length is reserved once, then filled by cloning from the
+    /// batch's own prefix, with no temporary copy of the original.
+    pub fn repeat_in_place(&mut self, n: usize) {
+        if n == 0 {
+            self.seqs.clear();
+            return;
+        }
+        let len = self.seqs.len();
+        let total = len.checked_mul(n).expect("repeat count overflows usize");
+        self.seqs.reserve_exact(total - len);
+        for _ in 1..n {
+            self.seqs.extend_from_within(..len);
+        }
+    }
+
     pub fn clear(&mut self) {
         self.seqs.clear();
     }
@@ -148,11 +183,11 @@ impl<S: SeqBytes> SeqBatch<S> {
     }
 
     pub fn lengths(&self) -> Vec<usize> {
-        par_map!(&self.seqs, |seq| seq.as_bytes().len())
+        self.seqs.iter().map(|seq| seq.as_bytes().len()).collect()
     }
 
     pub fn to_bytes_vec(&self) -> Vec<Vec<u8>> {
-        par_map!(&self.seqs, |seq| seq.as_bytes().to_vec())
+        par_map!(&self.seqs, |seq| seq.as_bytes().to_vec(), if self.use_parallel())
     }
 
     /// Map over raw bytes and re-validate sequences.
@@ -161,8 +196,11 @@ impl<S: SeqBytes> SeqBatch<S> {
     where
         F: Fn(&[u8]) -> Vec<u8> + Sync,
     {
-        let out: BioResult<Vec<S>> =
-            par_try_map!(&self.seqs, |seq| S::from_bytes(f(seq.as_bytes())));
+        let out: BioResult<Vec<S>> = par_try_map!(
+            &self.seqs,
+            |seq| S::from_bytes(f(seq.as_bytes())),
+            if self.use_parallel()
+        );
         Ok(Self { seqs: out? })
     }
 
@@ -170,8 +208,11 @@ impl<S: SeqBytes> SeqBatch<S> {
     where
         F: Fn(&[u8]) -> Vec<u8> + Sync,
     {
-        let out: BioResult<Vec<S>> =
-            par_try_map!(&self.seqs, |seq| S::from_bytes(f(seq.as_bytes())));
+        let out: BioResult<Vec<S>> = par_try_map!(
+            &self.seqs,
+            |seq| S::from_bytes(f(seq.as_bytes())),
+            if self.use_parallel()
+        );
         self.seqs = out?;
         Ok(())
     }
@@ -191,44 +232,45 @@ where
 {
     pub fn reverse_complements(&self) -> Self {
         Self {
-            seqs: par_map!(&self.seqs, |seq| seq.reverse_complement()),
+            seqs: par_map!(&self.seqs, |seq| seq.reverse_complement(), if self.use_parallel()),
         }
     }
 
     pub fn reverse_complements_in_place(&mut self) {
-        par_for_each_mut!(&mut self.seqs, |seq| {
-            *seq = seq.reverse_complement();
-        });
+        par_for_each_mut!(
+            &mut self.seqs,
+            |seq| seq.reverse_complement_in_place(),
+            if self.use_parallel()
+        );
     }
 }
 
 impl SeqBatch<DnaSeq> {
     pub fn complements(&self) -> Self {
         Self {
-            seqs: par_map!(&self.seqs, |seq| seq.complement()),
+            seqs: par_map!(&self.seqs, |seq| seq.complement(), if self.use_parallel()),
         }
     }
 
     pub fn complements_in_place(&mut self) {
-        par_for_each_mut!(&mut self.seqs, |seq| {
-            *seq = seq.complement();
-        });
+        par_for_each_mut!(&mut self.seqs, |seq| seq.complement_in_place(), if self.use_parallel());
     }
 
     pub fn transcribe(&self) -> SeqBatch<RnaSeq> {
         SeqBatch {
-            seqs: par_map!(&self.seqs, |seq| seq.transcribe()),
+            seqs: par_map!(&self.seqs, |seq| seq.transcribe(), if self.use_parallel()),
         }
     }
 
     pub fn translate(&self) -> BioResult<SeqBatch<ProteinSeq>> {
-        let out: BioResult<Vec<ProteinSeq>> = par_try_map!(&self.seqs, |seq| seq.translate());
+        let out: BioResult<Vec<ProteinSeq>> =
+            par_try_map!(&self.seqs, |seq| seq.translate(), if self.use_parallel());
         Ok(SeqBatch { seqs: out? })
     }
 
     pub fn translate_frame(&self, frame: TranslationFrame) -> BioResult<SeqBatch<ProteinSeq>> {
         let out: BioResult<Vec<ProteinSeq>> =
-            par_try_map!(&self.seqs, |seq| seq.translate_frame(frame));
+            par_try_map!(&self.seqs, |seq| seq.translate_frame(frame), if self.use_parallel());
         Ok(SeqBatch { seqs: out? })
     }
 }
@@ -236,30 +278,29 @@ impl SeqBatch<DnaSeq> {
 impl SeqBatch<RnaSeq> {
     pub fn complements(&self) -> Self {
         Self {
-            seqs: par_map!(&self.seqs, |seq| seq.complement()),
+            seqs: par_map!(&self.seqs, |seq| seq.complement(), if self.use_parallel()),
         }
     }
 
     pub fn complements_in_place(&mut self) {
-        par_for_each_mut!(&mut self.seqs, |seq| {
-            *seq = seq.complement();
-        });
+        par_for_each_mut!(&mut self.seqs, |seq| *seq = seq.complement(), if self.use_parallel());
     }
 
     pub fn back_transcribe(&self) -> SeqBatch<DnaSeq> {
         SeqBatch {
-            seqs: par_map!(&self.seqs, |seq| seq.back_transcribe()),
+            seqs: par_map!(&self.seqs, |seq| seq.back_transcribe(), if self.use_parallel()),
         }
     }
 
     pub fn translate(&self) -> BioResult<SeqBatch<ProteinSeq>> {
-        let out: BioResult<Vec<ProteinSeq>> = par_try_map!(&self.seqs, |seq| seq.translate());
+        let out: BioResult<Vec<ProteinSeq>> =
+            par_try_map!(&self.seqs, |seq| seq.translate(), if self.use_parallel());
         Ok(SeqBatch { seqs: out? })
     }
 
     pub fn translate_frame(&self, frame: TranslationFrame) -> BioResult<SeqBatch<ProteinSeq>> {
         let out: BioResult<Vec<ProteinSeq>> =
-            par_try_map!(&self.seqs, |seq| seq.translate_frame(frame));
+            par_try_map!(&self.seqs, |seq| seq.translate_frame(frame), if self.use_parallel());
         Ok(SeqBatch { seqs: out? })
     }
 }
@@ -267,62 +308,66 @@ impl SeqBatch<RnaSeq> {
 impl SeqBatch<ProteinSeq> {
     pub fn reverse(&self) -> Self {
         Self {
-            seqs: par_map!(&self.seqs, |seq| seq.reverse()),
+            seqs: par_map!(&self.seqs, |seq| seq.reverse(), if self.use_parallel()),
         }
     }
 
     pub fn reverse_in_place(&mut self) {
-        par_for_each_mut!(&mut self.seqs, |seq| {
-            *seq = seq.reverse();
-        });
+        par_for_each_mut!(&mut self.seqs, |seq| *seq = seq.reverse(), if self.use_parallel());
     }
 
     pub fn counts(&self) -> Vec<[u32; 256]> {
-        par_map!(&self.seqs, |seq| seq.counts())
+        par_map!(&self.seqs, |seq| seq.counts(), if self.use_parallel())
+    }
+
+    /// One [`ResidueCounts`] per sequence: a single pass over the bytes from
+    /// which every composition metric below can be derived.
+    pub fn residue_counts(&self) -> Vec<ResidueCounts> {
+        par_map!(&self.seqs, ResidueCounts::of, if self.use_parallel())
     }
 
     pub fn frequencies(&self) -> Vec<[f64; 256]> {
-        par_map!(&self.seqs, |seq| seq.frequencies())
+        par_map!(&self.seqs, |seq| seq.frequencies(), if self.use_parallel())
     }
 
     pub fn aa_counts_20(&self) -> Vec<[u32; 20]> {
-        par_map!(&self.seqs, |seq| seq.aa_counts_20())
+        par_map!(&self.seqs, |seq| seq.aa_counts_20(), if self.use_parallel())
     }
 
     pub fn aa_frequencies_20(&self) -> Vec<[f64; 20]> {
-        par_map!(&self.seqs, |seq| seq.aa_frequencies_20())
+        par_map!(&self.seqs, |seq| seq.aa_frequencies_20(), if self.use_parallel())
     }
 
     pub fn shannon_entropy(&self) -> Vec<f64> {
-        par_map!(&self.seqs, |seq| seq.shannon_entropy())
+        par_map!(&self.seqs, |seq| seq.shannon_entropy(), if self.use_parallel())
     }
 
     pub fn molecular_weight(&self) -> BioResult<Vec<f64>> {
-        par_try_map!(&self.seqs, |seq| seq.molecular_weight())
+        par_try_map!(&self.seqs, |seq| seq.molecular_weight(), if self.use_parallel())
     }
 
     pub fn hydrophobicity(&self) -> BioResult<Vec<f64>> {
-        par_try_map!(&self.seqs, |seq| seq.hydrophobicity())
+        par_try_map!(&self.seqs, |seq| seq.hydrophobicity(), if self.use_parallel())
     }
 
     pub fn hydrophobicity_profile(&self, window: usize) -> BioResult<Vec<Vec<f64>>> {
-        par_try_map!(&self.seqs, |seq| seq.hydrophobicity_profile(window))
+        par_try_map!(&self.seqs, |seq| seq.hydrophobicity_profile(window), if self.use_parallel())
     }
 
     pub fn net_charge(&self, ph: f64) -> BioResult<Vec<f64>> {
-        par_try_map!(&self.seqs, |seq| seq.net_charge(ph))
+        par_try_map!(&self.seqs, |seq| seq.net_charge(ph), if self.use_parallel())
     }
 
     pub fn isoelectric_point(&self) -> BioResult<Vec<f64>> {
-        par_try_map!(&self.seqs, |seq| seq.isoelectric_point())
+        par_try_map!(&self.seqs, |seq| seq.isoelectric_point(), if self.use_parallel())
     }
 
     pub fn has_ambiguous(&self) -> Vec<bool> {
-        par_map!(&self.seqs, |seq| seq.has_ambiguous())
+        par_map!(&self.seqs, |seq| seq.has_ambiguous(), if self.use_parallel())
     }
 
     pub fn unknown_positions(&self) -> Vec<Vec<usize>> {
-        par_map!(&self.seqs, |seq| seq.unknown_positions())
+        par_map!(&self.seqs, |seq| seq.unknown_positions(), if self.use_parallel())
     }
 }
 
@@ -375,14 +420,14 @@ where
     where
         N: IntoNeedle<'a> + Copy + Sync,
     {
-        par_try_map!(&self.seqs, |seq| seq.count(sub))
+        par_try_map!(&self.seqs, |seq| seq.count(sub), if self.use_parallel())
     }
 
     pub fn contains<'a, N>(&'a self, sub: N) -> BioResult<Vec<bool>>
     where
         N: IntoNeedle<'a> + Copy + Sync,
     {
-        par_try_map!(&self.seqs, |seq| seq.contains(sub))
+        par_try_map!(&self.seqs, |seq| seq.contains(sub), if self.use_parallel())
     }
 }
 
@@ -532,6 +577,11 @@ mod tests {
             filtered.to_bytes_vec(),
             vec![b"CC".to_vec(), b"GGG".to_vec()]
         );
+        let mut retained = batch.clone();
+        retained.retain_by_len(Some(2), Some(3));
+        assert_eq!(retained, filtered);
+        retained.retain_by_len(Some(3), Some(2));
+        assert!(retained.is_empty());
 
         let concatenated = batch.concat_all().unwrap();
         assert_eq!(concatenated.as_bytes(), b"ACCGGGTTTT");
@@ -626,6 +676,10 @@ mod tests {
 
         let entropy = batch.shannon_entropy();
         assert_eq!(entropy.len(), 1);
+
+        let cached = batch.residue_counts();
+        assert_eq!(cached[0].counts(), counts[0]);
+        assert_eq!(cached[0].shannon_entropy(), entropy[0]);
     }
 
     #[test]
@@ -654,4 +708,43 @@ mod tests {
             vec![b"GCAT".to_vec(), b"CGTT".to_vec()]
         );
     }
+
+    #[test]
+    fn repeat_in_place() {
+        let mut batch = SeqBatch::new(vec![
+            DnaSeq::new(b"AC".to_vec()).unwrap(),
+            DnaSeq::new(b"G".to_vec()).unwrap(),
+        ]);
+        batch.repeat_in_place(3);
+        assert_eq!(
+            batch.to_bytes_vec(),
+            [&b"AC"[..], b"G", b"AC", b"G", b"AC", b"G"].map(|b| b.to_vec())
+        );
+        batch.repeat_in_place(1);
+        assert_eq!(batch.len(), 6);
+        batch.repeat_in_place(0);
+        assert!(batch.is_empty());
+    }
+
+    #[test]
+    fn large_batch_matches_per_seq_results() {
+        let seq = DnaSeq::new(b"ATGCGTACCTTAGNNA".repeat(1024)).unwrap();
+        let batch = SeqBatch::new(vec![seq.clone(); 24]);
+        assert!(batch.total_len() >= PAR_MIN_BYTES);
+        assert!(batch.use_parallel());
+
+        let expected = seq.reverse_complement();
+        assert!(batch.reverse_complements().iter().all(|s| *s == expected));
+        let mut in_place = batch.clone();
+        in_place.reverse_complements_in_place();
+        assert_eq!(in_place, batch.reverse_complements());
+        assert_eq!(
+            batch.count(b"TA").unwrap(),
+            vec![seq.count(b"TA").unwrap(); 24]
+        );
+
+        let small = batch.slice(0, 2, 1);
+        assert!(!small.use_parallel());
+        assert_eq!(small.reverse_complements(), in_place.slice(0, 2, 1));
+    }
 }
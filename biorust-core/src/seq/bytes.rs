@@ -1,6 +1,11 @@
 use crate::error::{BioError, BioResult};
 
-use memchr::{memchr_iter, memmem};
+use memchr::memmem;
+
+/// Longest needle matched with the bit-parallel Shift-And scan. Short
+/// patterns over small alphabets hit often, and every hit restarts a
+/// memmem search; longer ones are rare enough for memmem's prefilter to win.
+const SHIFT_AND_MAX: usize = 16;
 
 /// Internal “needle” representation.
 #[derive(Copy, Clone, Debug)]
@@ -97,18 +102,33 @@ pub fn count_overlap(hay: &[u8], needle: Needle<'_>) -> usize {
             if pat.is_empty() {
                 return hay.len() + 1;
             }
+            if pat.len() == 1 {
+                return count_single_byte(hay, pat[0]);
+            }
+
+            if pat.len() <= SHIFT_AND_MAX {
+                return count_short_overlap(hay, pat);
+            }
 
             let finder = memmem::Finder::new(pat);
+            let k = pat.len();
+            let period = min_period(pat);
             let mut count = 0usize;
             let mut i = 0usize;
 
-            while i <= hay.len().saturating_sub(pat.len()) {
-                if let Some(pos) = finder.find(&hay[i..]) {
+            while let Some(pos) = finder.find(&hay[i..]) {
+                let mut start = i + pos;
+                count += 1;
+                // Runs of overlapping hits (e.g. "AAA" in a poly-A tract) are
+                // extended by comparing only the `period` bytes that shift in;
+                // no hit can start less than `period` bytes after another.
+                while start + period + k <= hay.len()
+                    && hay[start + k..start + k + period] == pat[k - period..]
+                {
                     count += 1;
-                    i += pos + 1;
-                } else {
-                    break;
+                    start += period;
                 }
+                i = start + 1;
             }
 
             count
@@ -116,6 +136,23 @@ pub fn count_overlap(hay: &[u8], needle: Needle<'_>) -> usize {
     }
 }
 
+/// Smallest `p` such that `pat[i] == pat[i + p]` for every valid `i`.
+fn min_period(pat: &[u8]) -> usize {
+    // KMP failure function: fail[i] is the longest proper border of pat[..=i].
+    let mut fail = vec![0usize; pat.len()];
+    let mut len = 0usize;
+    for i in 1..pat.len() {
+        while len > 0 && pat[i] != pat[len] {
+            len = fail[len - 1];
+        }
+        if pat[i] == pat[len] {
+            len += 1;
+        }
+        fail[i] = len;
+    }
+    pat.len() - fail[pat.len() - 1]
+}
+
 pub fn contains(hay: &[u8], needle: Needle<'_>) -> bool {
     match needle {
         Needle::Byte(b) => memchr::memchr(b, hay).is_some(),
@@ -181,9 +218,427 @@ pub fn rfind(hay: &[u8], needle: Needle<'_>, start: usize, end: usize) -> Option
     }
 }
 
+/// Concatenate `parts` into a buffer allocated once at the exact total size.
+pub fn concat<'a, I>(parts: I) -> Vec<u8>
+where
+    I: Iterator<Item = &'a [u8]> + Clone,
+{
+    let total = parts.clone().map(<[u8]>::len).sum();
+    let mut out = Vec::with_capacity(total);
+    parts.for_each(|part| out.extend_from_slice(part));
+    out
+}
+
+/// Python extended slice `start:stop:step` of `bytes`, with the indices as
+/// `slice.indices(len)` returns them. Unit steps are a single memcpy; other
+/// steps collect from an exact-size iterator, so the output is allocated once.
+pub fn slice_step(bytes: &[u8], start: isize, stop: isize, step: isize) -> Vec<u8> {
+    assert!(step != 0, "slice step cannot be zero");
+    if step > 0 {
+        if start >= stop {
+            return Vec::new();
+        }
+        let window = &bytes[start as usize..stop as usize];
+        if step == 1 {
+            return window.to_vec();
+        }
+        window.iter().step_by(step as usize).copied().collect()
+    } else {
+        if start <= stop {
+            return Vec::new();
+        }
+        // Walks start, start + step, ... down to (not including) stop >= -1.
+        let window = &bytes[(stop + 1) as usize..=start as usize];
+        window
+            .iter()
+            .rev()
+            .step_by(step.unsigned_abs())
+            .copied()
+            .collect()
+    }
+}
+
+/// The bytes of a sequence type as text, without a UTF-8 check. Every
+/// alphabet is ASCII and sequences are only built from validated bytes or
+/// bytes derived from them, so the check could never fail.
+#[inline]
+pub(crate) fn ascii_str(bytes: &[u8]) -> &str {
+    debug_assert!(bytes.is_ascii());
+    // SAFETY: sequence bytes are ASCII, which is always valid UTF-8.
+    unsafe { std::str::from_utf8_unchecked(bytes) }
+}
+
+/// `bytes` without the alignment gap characters `-` and `.`.
+pub fn remove_gaps(bytes: &[u8]) -> Vec<u8> {
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("ssse3") {
+            // SAFETY: SSSE3 support was just checked.
+            return unsafe { ssse3::remove_gaps(bytes) };
+        }
+    }
+    bytes.iter().copied().filter(|&b| !is_gap(b)).collect()
+}
+
+/// For equal-length alignment rows, whether each column holds the same
+/// non-gap symbol (ignoring ASCII case) in every row. A single row has
+/// nothing to disagree with, so all of its columns, gaps included, count
+/// as conserved.
+///
+/// The rows are compared whole against the first one, so the scan runs
+/// along contiguous memory rather than down columns.
+pub fn conserved_columns(rows: &[&[u8]]) -> Vec<bool> {
+    let Some((&first, rest)) = rows.split_first() else {
+        return Vec::new();
+    };
+    if rest.is_empty() {
+        return vec![true; first.len()];
+    }
+    let mut mask: Vec<u8> = first
+        .iter()
+        .map(|&b| if is_gap(b) { 0 } else { 0xff })
+        .collect();
+    for &row in rest {
+        assert_eq!(row.len(), first.len(), "alignment rows differ in length");
+        keep_matching(&mut mask, first, row);
+    }
+    mask.into_iter().map(|m| m != 0).collect()
+}
+
+/// Clear `mask[i]` wherever `a[i]` and `b[i]` differ ignoring ASCII case.
+fn keep_matching(mask: &mut [u8], a: &[u8], b: &[u8]) {
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            return unsafe { avx2::keep_matching(mask, a, b) };
+        }
+        // SAFETY: SSE2 is part of the x86_64 baseline.
+        unsafe { sse2::keep_matching(mask, a, b) }
+    }
+    #[cfg(not(all(feature = "simd", target_arch = "x86_64")))]
+    {
+        keep_matching_scalar(mask, a, b)
+    }
+}
+
+#[cfg_attr(not(all(feature = "simd", target_arch = "x86_64")), allow(dead_code))]
+fn keep_matching_scalar(mask: &mut [u8], a: &[u8], b: &[u8]) {
+    for ((m, &x), &y) in mask.iter_mut().zip(a).zip(b) {
+        if !x.eq_ignore_ascii_case(&y) {
+            *m = 0;
+        }
+    }
+}
+
+#[inline]
+fn is_gap(b: u8) -> bool {
+    b == b'-' || b == b'.'
+}
+
+/// Count matches of `pat` (at most 64 bytes) with Shift-And: bit `i` of the
+/// state is set when `pat[..=i]` ends at the current byte. Without
+/// `overlap`, the state is cleared after each hit (leftmost, non-overlapping).
+fn shift_and_count(hay: &[u8], pat: &[u8], overlap: bool) -> usize {
+    debug_assert!(!pat.is_empty() && pat.len() <= 64);
+
+    let mut masks = [0u64; 256];
+    for (i, &b) in pat.iter().enumerate() {
+        masks[b as usize] |= 1 << i;
+    }
+    let hit = 1u64 << (pat.len() - 1);
+
+    let mut state = 0u64;
+    let mut count = 0usize;
+    for &b in hay {
+        state = ((state << 1) | 1) & masks[b as usize];
+        if state & hit != 0 {
+            count += 1;
+            if !overlap {
+                state = 0;
+            }
+        }
+    }
+    count
+}
+
+/// Overlapping count of a pattern of at most [`SHIFT_AND_MAX`] bytes. With
+/// SIMD, every start position in a block is tested at once: the block is
+/// compared against each pattern byte at its offset and the match masks are
+/// ANDed, so the surviving bits are exactly the hits. The tail too short for
+/// a whole block goes through Shift-And.
+fn count_short_overlap(hay: &[u8], pat: &[u8]) -> usize {
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        let (count, done) = if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            unsafe { avx2::count_short(hay, pat) }
+        } else {
+            // SAFETY: SSE2 is part of the x86_64 baseline.
+            unsafe { sse2::count_short(hay, pat) }
+        };
+        count + shift_and_count(&hay[done..], pat, true)
+    }
+    #[cfg(not(all(feature = "simd", target_arch = "x86_64")))]
+    {
+        shift_and_count(hay, pat, true)
+    }
+}
+
 #[inline]
 fn count_single_byte(hay: &[u8], b: u8) -> usize {
-    memchr_iter(b, hay).count()
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            return unsafe { avx2::count_byte(hay, b) };
+        }
+        // SAFETY: SSE2 is part of the x86_64 baseline.
+        unsafe { sse2::count_byte(hay, b) }
+    }
+    #[cfg(not(all(feature = "simd", target_arch = "x86_64")))]
+    {
+        hay.iter().filter(|&&x| x == b).count()
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod sse2 {
+    use std::arch::x86_64::*;
+
+    /// Compare 16 bytes at a time and accumulate the `0xff` hits into byte
+    /// lanes (subtracting -1), folding them with `psadbw` before any lane can
+    /// overflow (255 iterations).
+    pub(super) unsafe fn count_byte(hay: &[u8], b: u8) -> usize {
+        let needle = _mm_set1_epi8(b as i8);
+        let zero = _mm_setzero_si128();
+        let mut total = 0usize;
+
+        let mut chunks = hay.chunks_exact(16);
+        loop {
+            let mut acc = zero;
+            let mut n = 0;
+            for chunk in chunks.by_ref().take(255) {
+                let v = _mm_loadu_si128(chunk.as_ptr() as *const __m128i);
+                acc = _mm_sub_epi8(acc, _mm_cmpeq_epi8(v, needle));
+                n += 1;
+            }
+            let sad = _mm_sad_epu8(acc, zero);
+            total +=
+                (_mm_cvtsi128_si64(sad) + _mm_cvtsi128_si64(_mm_unpackhi_epi64(sad, sad))) as usize;
+            if n < 255 {
+                break;
+            }
+        }
+
+        total + chunks.remainder().iter().filter(|&&x| x == b).count()
+    }
+
+    /// Hits of `pat` starting in each whole 16-byte block of `hay` (one
+    /// with room for the full pattern after every position), and the offset
+    /// where the blocks stop.
+    pub(super) unsafe fn count_short(hay: &[u8], pat: &[u8]) -> (usize, usize) {
+        let mut count = 0usize;
+        let mut i = 0usize;
+        while i + 16 + pat.len() - 1 <= hay.len() {
+            let mut mask = 0xffffu32;
+            for (k, &b) in pat.iter().enumerate() {
+                let v = _mm_loadu_si128(hay.as_ptr().add(i + k) as *const __m128i);
+                mask &= _mm_movemask_epi8(_mm_cmpeq_epi8(v, _mm_set1_epi8(b as i8))) as u32;
+                if mask == 0 {
+                    break;
+                }
+            }
+            count += mask.count_ones() as usize;
+            i += 16;
+        }
+        (count, i)
+    }
+
+    /// `v` with `a..=z` shifted to `A..=Z`. The signed compares leave bytes
+    /// >= 0x80 alone.
+    #[inline]
+    pub(super) unsafe fn to_upper(v: __m128i) -> __m128i {
+        let lower = _mm_and_si128(
+            _mm_cmpgt_epi8(v, _mm_set1_epi8(b'a' as i8 - 1)),
+            _mm_cmpgt_epi8(_mm_set1_epi8(b'z' as i8 + 1), v),
+        );
+        _mm_sub_epi8(v, _mm_and_si128(lower, _mm_set1_epi8(0x20)))
+    }
+
+    /// AND 16 mask bytes at a time with the case-folded equality of `a`
+    /// and `b`.
+    pub(super) unsafe fn keep_matching(mask: &mut [u8], a: &[u8], b: &[u8]) {
+        let n = mask.len().min(a.len()).min(b.len());
+        let mut i = 0;
+        while i + 16 <= n {
+            let va = to_upper(_mm_loadu_si128(a.as_ptr().add(i) as *const __m128i));
+            let vb = to_upper(_mm_loadu_si128(b.as_ptr().add(i) as *const __m128i));
+            let m = mask.as_mut_ptr().add(i) as *mut __m128i;
+            _mm_storeu_si128(m, _mm_and_si128(_mm_loadu_si128(m), _mm_cmpeq_epi8(va, vb)));
+            i += 16;
+        }
+        super::keep_matching_scalar(&mut mask[i..n], &a[i..n], &b[i..n]);
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod ssse3 {
+    use std::arch::x86_64::*;
+
+    /// `pshufb` indices that move the bytes selected by an 8-bit mask to the
+    /// front of an 8-byte group; unused slots are `0x80` and shuffle to zero.
+    const LEFT_PACK: [[u8; 8]; 256] = {
+        let mut lut = [[0x80u8; 8]; 256];
+        let mut mask = 0;
+        while mask < 256 {
+            let mut n = 0;
+            let mut bit = 0;
+            while bit < 8 {
+                if mask & (1 << bit) != 0 {
+                    lut[mask][n] = bit as u8;
+                    n += 1;
+                }
+                bit += 1;
+            }
+            mask += 1;
+        }
+        lut
+    };
+
+    /// Left-pack the non-gap bytes of each 16-byte block: the gap mask picks
+    /// a shuffle per 8-byte half from `LEFT_PACK`, and the packed halves are
+    /// stored unaligned, advancing the output by their popcount. Gap-free
+    /// blocks are copied whole.
+    #[target_feature(enable = "ssse3")]
+    pub(super) unsafe fn remove_gaps(bytes: &[u8]) -> Vec<u8> {
+        let dash = _mm_set1_epi8(b'-' as i8);
+        let dot = _mm_set1_epi8(b'.' as i8);
+        let high_half = _mm_set1_epi8(8);
+
+        // Every store writes at most 16 bytes at or before the read position,
+        // so `bytes.len() + 16` bytes of capacity cover all of them.
+        let mut out: Vec<u8> = Vec::with_capacity(bytes.len() + 16);
+        let dst = out.as_mut_ptr();
+        let mut n = 0usize;
+
+        let mut chunks = bytes.chunks_exact(16);
+        for chunk in &mut chunks {
+            let v = _mm_loadu_si128(chunk.as_ptr() as *const __m128i);
+            let gaps = _mm_or_si128(_mm_cmpeq_epi8(v, dash), _mm_cmpeq_epi8(v, dot));
+            let keep = !_mm_movemask_epi8(gaps) as u32 & 0xffff;
+            if keep == 0xffff {
+                _mm_storeu_si128(dst.add(n) as *mut __m128i, v);
+                n += 16;
+                continue;
+            }
+            let (lo, hi) = ((keep & 0xff) as usize, (keep >> 8) as usize);
+            let lo_idx = _mm_loadl_epi64(LEFT_PACK[lo].as_ptr() as *const __m128i);
+            _mm_storel_epi64(dst.add(n) as *mut __m128i, _mm_shuffle_epi8(v, lo_idx));
+            n += lo.count_ones() as usize;
+            let hi_idx = _mm_add_epi8(
+                _mm_loadl_epi64(LEFT_PACK[hi].as_ptr() as *const __m128i),
+                high_half,
+            );
+            _mm_storel_epi64(dst.add(n) as *mut __m128i, _mm_shuffle_epi8(v, hi_idx));
+            n += hi.count_ones() as usize;
+        }
+        // SAFETY: the first `n` bytes were written by the stores above.
+        out.set_len(n);
+
+        out.extend(
+            chunks
+                .remainder()
+                .iter()
+                .copied()
+                .filter(|&b| !super::is_gap(b)),
+        );
+        out
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod avx2 {
+    use std::arch::x86_64::*;
+
+    /// 32-byte version of `sse2::count_byte`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn count_byte(hay: &[u8], b: u8) -> usize {
+        let needle = _mm256_set1_epi8(b as i8);
+        let zero = _mm256_setzero_si256();
+        let mut total = 0usize;
+
+        let mut chunks = hay.chunks_exact(32);
+        loop {
+            let mut acc = zero;
+            let mut n = 0;
+            for chunk in chunks.by_ref().take(255) {
+                let v = _mm256_loadu_si256(chunk.as_ptr() as *const __m256i);
+                acc = _mm256_sub_epi8(acc, _mm256_cmpeq_epi8(v, needle));
+                n += 1;
+            }
+            let mut sums = [0u64; 4];
+            _mm256_storeu_si256(
+                sums.as_mut_ptr() as *mut __m256i,
+                _mm256_sad_epu8(acc, zero),
+            );
+            total += sums.iter().sum::<u64>() as usize;
+            if n < 255 {
+                break;
+            }
+        }
+
+        total + super::sse2::count_byte(chunks.remainder(), b)
+    }
+
+    /// 32-byte version of `sse2::count_short`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn count_short(hay: &[u8], pat: &[u8]) -> (usize, usize) {
+        let mut count = 0usize;
+        let mut i = 0usize;
+        while i + 32 + pat.len() - 1 <= hay.len() {
+            let mut mask = u32::MAX;
+            for (k, &b) in pat.iter().enumerate() {
+                let v = _mm256_loadu_si256(hay.as_ptr().add(i + k) as *const __m256i);
+                mask &=
+                    _mm256_movemask_epi8(_mm256_cmpeq_epi8(v, _mm256_set1_epi8(b as i8))) as u32;
+                if mask == 0 {
+                    break;
+                }
+            }
+            count += mask.count_ones() as usize;
+            i += 32;
+        }
+        (count, i)
+    }
+
+    #[inline]
+    #[target_feature(enable = "avx2")]
+    unsafe fn to_upper(v: __m256i) -> __m256i {
+        let lower = _mm256_and_si256(
+            _mm256_cmpgt_epi8(v, _mm256_set1_epi8(b'a' as i8 - 1)),
+            _mm256_cmpgt_epi8(_mm256_set1_epi8(b'z' as i8 + 1), v),
+        );
+        _mm256_sub_epi8(v, _mm256_and_si256(lower, _mm256_set1_epi8(0x20)))
+    }
+
+    /// 32-byte version of `sse2::keep_matching`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn keep_matching(mask: &mut [u8], a: &[u8], b: &[u8]) {
+        let n = mask.len().min(a.len()).min(b.len());
+        let mut i = 0;
+        while i + 32 <= n {
+            let va = to_upper(_mm256_loadu_si256(a.as_ptr().add(i) as *const __m256i));
+            let vb = to_upper(_mm256_loadu_si256(b.as_ptr().add(i) as *const __m256i));
+            let m = mask.as_mut_ptr().add(i) as *mut __m256i;
+            _mm256_storeu_si256(
+                m,
+                _mm256_and_si256(_mm256_loadu_si256(m), _mm256_cmpeq_epi8(va, vb)),
+            );
+            i += 32;
+        }
+        super::sse2::keep_matching(&mut mask[i..n], &a[i..n], &b[i..n]);
+    }
 }
 
 fn count_subslice_nonoverlapping(hay: &[u8], needle: &[u8]) -> usize {
@@ -192,6 +647,9 @@ fn count_subslice_nonoverlapping(hay: &[u8], needle: &[u8]) -> usize {
     if needle.len() == 1 {
         return count_single_byte(hay, needle[0]);
     }
+    if needle.len() <= SHIFT_AND_MAX {
+        return shift_and_count(hay, needle, false);
+    }
 
     let finder = memmem::Finder::new(needle);
     let mut count = 0usize;
@@ -209,3 +667,215 @@ fn count_subslice_nonoverlapping(hay: &[u8], needle: &[u8]) -> usize {
 
     count
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn remove_gaps_matches_filter() {
+        for len in [0usize, 1, 15, 16, 17, 31, 64, 100] {
+            for seed in 0..8usize {
+                let bytes: Vec<u8> = (0..len)
+                    .map(|i| b"AC-G.T--NN.A"[(i * (seed + 3) + seed * i / 5) % 12])
+                    .collect();
+                let expected: Vec<u8> = bytes
+                    .iter()
+                    .copied()
+                    .filter(|&b| b != b'-' && b != b'.')
+                    .collect();
+                assert_eq!(remove_gaps(&bytes), expected, "{bytes:?}");
+            }
+        }
+        assert_eq!(remove_gaps(b"ACGTACGTACGTACGTAC"), b"ACGTACGTACGTACGTAC");
+        assert_eq!(remove_gaps(b"-.-.-.-.-.-.-.-.-."), b"");
+    }
+
+    #[test]
+    fn conserved_columns_matches_column_scan() {
+        const SYMBOLS: &[u8] = b"ACGTacgt-.N*@`{\xe1";
+        for len in [0usize, 1, 15, 16, 17, 33, 70] {
+            for n in [1usize, 2, 5] {
+                let rows: Vec<Vec<u8>> = (0..n)
+                    .map(|r| {
+                        (0..len)
+                            .map(|i| {
+                                let k = if (i + r) % 4 == 0 { i * 7 + r } else { i };
+                                SYMBOLS[k % SYMBOLS.len()]
+                            })
+                            .collect()
+                    })
+                    .collect();
+                let views: Vec<&[u8]> = rows.iter().map(Vec::as_slice).collect();
+                let expected: Vec<bool> = (0..len)
+                    .map(|c| {
+                        let first = rows[0][c];
+                        rows[1..]
+                            .iter()
+                            .all(|r| r[c].eq_ignore_ascii_case(&first) && !is_gap(first))
+                    })
+                    .collect();
+                assert_eq!(conserved_columns(&views), expected, "{rows:?}");
+            }
+        }
+        assert!(conserved_columns(&[]).is_empty());
+        assert_eq!(conserved_columns(&[b"A-.c"]), [true; 4]);
+        assert_eq!(
+            conserved_columns(&[b"Ac-gT@", b"aC-Gt`"]),
+            [true, true, false, true, true, false]
+        );
+    }
+
+    fn count_overlap_naive(hay: &[u8], pat: &[u8]) -> usize {
+        if pat.len() > hay.len() {
+            return 0;
+        }
+        hay.windows(pat.len()).filter(|w| *w == pat).count()
+    }
+
+    fn count_naive(hay: &[u8], pat: &[u8]) -> usize {
+        let mut count = 0;
+        let mut i = 0;
+        while i + pat.len() <= hay.len() {
+            if &hay[i..i + pat.len()] == pat {
+                count += 1;
+                i += pat.len();
+            } else {
+                i += 1;
+            }
+        }
+        count
+    }
+
+    #[test]
+    fn count_single_byte_long() {
+        // crosses the 255-iteration fold of both the 16- and 32-byte kernels
+        // and leaves a remainder for each
+        let hay: Vec<u8> = (0..32 * 600 + 23).map(|i| b"ACGTA"[i % 5]).collect();
+        for b in [b'A', b'C', b'N'] {
+            let expected = hay.iter().filter(|&&x| x == b).count();
+            assert_eq!(count_single_byte(&hay, b), expected);
+        }
+        assert_eq!(count_single_byte(b"", b'A'), 0);
+    }
+
+    #[test]
+    fn shift_and_matches_memmem_path() {
+        let hay: Vec<u8> = (0..2000)
+            .map(|i| b"AACAGTTA"[(i * 7 + i / 5) % 8])
+            .collect();
+        let long_run = b"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA";
+        for k in [2, 3, 5, 16, 17, 40] {
+            for start in [0, 13, 500] {
+                let pat = &hay[start..start + k];
+                assert_eq!(
+                    count(&hay, Needle::Bytes(pat)),
+                    count_naive(&hay, pat),
+                    "k {k}"
+                );
+                assert_eq!(
+                    count_overlap(&hay, Needle::Bytes(pat)),
+                    count_overlap_naive(&hay, pat),
+                    "k {k}"
+                );
+            }
+            let pat = &long_run[..k];
+            assert_eq!(
+                count(long_run, Needle::Bytes(pat)),
+                count_naive(long_run, pat)
+            );
+            assert_eq!(
+                count_overlap(long_run, Needle::Bytes(pat)),
+                count_overlap_naive(long_run, pat)
+            );
+        }
+        assert_eq!(shift_and_count(b"ACGT", &[b'A'; 64], true), 0);
+    }
+
+    #[test]
+    fn min_period_basic() {
+        assert_eq!(min_period(b"A"), 1);
+        assert_eq!(min_period(b"AAA"), 1);
+        assert_eq!(min_period(b"ACAC"), 2);
+        assert_eq!(min_period(b"aabaa"), 3);
+        assert_eq!(min_period(b"ACGT"), 4);
+    }
+
+    #[test]
+    fn count_overlap_runs() {
+        assert_eq!(count_overlap(b"AAAAA", Needle::Bytes(b"AA")), 4);
+        assert_eq!(count_overlap(b"AAAAA", Needle::Bytes(b"AAA")), 3);
+        assert_eq!(count_overlap(b"ACACACA", Needle::Bytes(b"ACA")), 3);
+        assert_eq!(count_overlap(b"ACGT", Needle::Bytes(b"")), 5);
+        assert_eq!(count_overlap(b"", Needle::Bytes(b"A")), 0);
+        assert_eq!(count_overlap(b"AC", Needle::Bytes(b"ACG")), 0);
+    }
+
+    #[test]
+    fn count_overlap_matches_naive() {
+        let hays: [&[u8]; 5] = [
+            b"aabaaabaabaaabaa",
+            b"AAAAAAAAAACAAAAAAAAA",
+            b"ACGTACGTACGTTACGACGT",
+            b"ababababbabababab",
+            b"GATTACAGATTACAGATTACA",
+        ];
+        let pats: [&[u8]; 9] = [
+            b"aabaa", b"aa", b"AAAA", b"ACGT", b"CGTA", b"abab", b"bab", b"GATTACA", b"A",
+        ];
+        for hay in hays {
+            for pat in pats {
+                assert_eq!(
+                    count_overlap(hay, Needle::Bytes(pat)),
+                    count_overlap_naive(hay, pat),
+                    "hay {hay:?} pat {pat:?}"
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn count_overlap_short_patterns_across_blocks() {
+        for len in [0usize, 1, 17, 31, 32, 33, 47, 64, 65, 200] {
+            let hay: Vec<u8> = (0..len)
+                .map(|i| b"AAAKAAAAKKAAAAAAKAAKK"[(i * 7 + i / 5) % 21])
+                .collect();
+            for m in 2..=SHIFT_AND_MAX {
+                for pat in [
+                    vec![b'A'; m],
+                    (0..m)
+                        .map(|k| hay.get(k + 3).copied().unwrap_or(b'K'))
+                        .collect(),
+                ] {
+                    assert_eq!(
+                        count_overlap(&hay, Needle::Bytes(&pat)),
+                        count_overlap_naive(&hay, &pat),
+                        "len {len} pat {pat:?}"
+                    );
+                    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+                    {
+                        // SAFETY: SSE2 is part of the x86_64 baseline.
+                        let (count, done) = unsafe { sse2::count_short(&hay, &pat) };
+                        assert_eq!(
+                            count + shift_and_count(&hay[done..], &pat, true),
+                            count_overlap_naive(&hay, &pat)
+                        );
+                    }
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn slice_step_matches_python_semantics() {
+        let hay = b"ACGTACGTAC";
+        assert_eq!(slice_step(hay, 1, 3, 1), b"CG");
+        assert_eq!(slice_step(hay, 0, 10, 3), b"ATGC");
+        assert_eq!(slice_step(hay, 9, -1, -1), b"CATGCATGCA");
+        assert_eq!(slice_step(hay, 9, 2, -3), b"CGT");
+        assert_eq!(slice_step(hay, 4, 4, 1), b"");
+        assert_eq!(slice_step(hay, 2, 5, -1), b"");
+        assert_eq!(slice_step(b"", 0, 0, 1), b"");
+        assert_eq!(slice_step(b"", -1, -1, -1), b"");
+    }
+}
@@ -1,12 +1,10 @@
 use crate::alphabets::dna;
-use crate::error::{BioError, BioResult};
+use crate::error::BioResult;
 use crate::seq::bytes::{self, IntoNeedle, Needle};
 use crate::seq::protein::ProteinSeq;
 use crate::seq::rna::RnaSeq;
 use crate::seq::traits::SeqBytes;
-use crate::seq::{best_frame_index, TranslationFrame};
-
-use std::sync::LazyLock;
+use crate::seq::{check_whole_codons, translate_codons, translate_frame_codons, TranslationFrame};
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub struct DnaSeq {
@@ -15,16 +13,15 @@ pub struct DnaSeq {
 
 pub trait ReverseComplement: Sized {
     fn reverse_complement(&self) -> Self;
+
+    fn reverse_complement_in_place(&mut self) {
+        *self = self.reverse_complement();
+    }
 }
 
 impl DnaSeq {
     pub fn new(bytes: Vec<u8>) -> BioResult<Self> {
-        let alphabet = dna::iupac_alphabet();
-        for (pos, &b) in bytes.iter().enumerate() {
-            if !alphabet.symbols.contains(b as usize) {
-                return Err(BioError::InvalidChar { ch: b as char, pos });
-            }
-        }
+        dna::IUPAC.validate(&bytes)?;
         Ok(Self { bytes })
     }
 
@@ -37,6 +34,10 @@ impl DnaSeq {
         &self.bytes
     }
 
+    pub fn as_str(&self) -> &str {
+        bytes::ascii_str(self.as_bytes())
+    }
+
     pub fn gc_content(&self) -> f64 {
         if self.bytes.is_empty() {
             return 0.0;
@@ -60,14 +61,20 @@ impl DnaSeq {
         Self { bytes: out }
     }
 
+    pub fn reverse_complement_in_place(&mut self) {
+        dna::reverse_complement_in_place(&mut self.bytes);
+    }
+
     pub fn complement(&self) -> Self {
-        let mut out = Vec::with_capacity(self.bytes.len());
-        for &base in self.as_bytes() {
-            out.push(dna::complement(base));
-        }
+        let mut out = self.bytes.clone();
+        dna::complement_in_place(&mut out);
         Self { bytes: out }
     }
 
+    pub fn complement_in_place(&mut self) {
+        dna::complement_in_place(&mut self.bytes);
+    }
+
     pub fn transcribe(&self) -> RnaSeq {
         let mut out = self.bytes.clone();
         for b in &mut out {
@@ -82,59 +89,15 @@ impl DnaSeq {
 
     pub fn translate(&self) -> BioResult<ProteinSeq> {
         let bytes = self.as_bytes();
-        if bytes.len() % 3 != 0 {
-            return Err(BioError::TranslationError {
-                msg: format!(
-                    "sequence length {} is not a multiple of 3 ({} trailing bases would be lost)",
-                    bytes.len(),
-                    bytes.len() % 3
-                ),
-            });
-        }
-        Ok(translate_bytes(bytes, &BASE_INDEX))
+        check_whole_codons(bytes.len())?;
+        Ok(translate_bytes(bytes))
     }
 
     pub fn translate_frame(&self, frame: TranslationFrame) -> BioResult<ProteinSeq> {
-        match frame {
-            TranslationFrame::One => {
-                let bytes = self.as_bytes();
-                let len = bytes.len() / 3 * 3;
-                Ok(translate_bytes(&bytes[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Two => {
-                let bytes = self.as_bytes();
-                if bytes.len() < 2 {
-                    return Ok(ProteinSeq::from_bytes_unchecked(Vec::new()));
-                }
-                let slice = &bytes[1..];
-                let len = slice.len() / 3 * 3;
-                Ok(translate_bytes(&slice[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Three => {
-                let bytes = self.as_bytes();
-                if bytes.len() < 3 {
-                    return Ok(ProteinSeq::from_bytes_unchecked(Vec::new()));
-                }
-                let slice = &bytes[2..];
-                let len = slice.len() / 3 * 3;
-                Ok(translate_bytes(&slice[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Auto => {
-                let bytes = self.as_bytes();
-                let mut candidates: [Vec<u8>; 3] = [Vec::new(), Vec::new(), Vec::new()];
-                for offset in 0..3 {
-                    if bytes.len() > offset {
-                        let slice = &bytes[offset..];
-                        let len = slice.len() / 3 * 3;
-                        candidates[offset] = translate_to_vec(&slice[..len], &BASE_INDEX);
-                    }
-                }
-                let idx = best_frame_index([&candidates[0], &candidates[1], &candidates[2]]);
-                Ok(ProteinSeq::from_bytes_unchecked(std::mem::take(
-                    &mut candidates[idx],
-                )))
-            }
-        }
+        Ok(ProteinSeq::from_bytes_unchecked(translate_frame_codons(
+            self.as_bytes(),
+            frame,
+        )))
     }
 
     pub fn count<'a, N>(&'a self, sub: N) -> BioResult<usize>
@@ -191,12 +154,28 @@ impl SeqBytes for DnaSeq {
     fn from_bytes(bytes: Vec<u8>) -> BioResult<Self> {
         DnaSeq::new(bytes)
     }
+
+    fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        Self::from_bytes_unchecked(bytes::slice_step(self.as_bytes(), start, stop, step))
+    }
+
+    fn concat<'a, I>(parts: I) -> Self
+    where
+        I: IntoIterator<Item = &'a Self>,
+        I::IntoIter: Clone,
+    {
+        Self::from_bytes_unchecked(bytes::concat(parts.into_iter().map(|p| p.as_bytes())))
+    }
 }
 
 impl ReverseComplement for DnaSeq {
     fn reverse_complement(&self) -> Self {
         DnaSeq::reverse_complement(self)
     }
+
+    fn reverse_complement_in_place(&mut self) {
+        DnaSeq::reverse_complement_in_place(self)
+    }
 }
 
 impl<'a> IntoNeedle<'a> for &'a DnaSeq {
@@ -206,46 +185,29 @@ impl<'a> IntoNeedle<'a> for &'a DnaSeq {
     }
 }
 
-fn translate_to_vec(bytes: &[u8], base_index: &[u8; 256]) -> Vec<u8> {
-    let mut out = Vec::with_capacity(bytes.len() / 3);
-    for codon in bytes.chunks_exact(3) {
-        let i1 = base_index[codon[0] as usize];
-        let i2 = base_index[codon[1] as usize];
-        let i3 = base_index[codon[2] as usize];
-        let aa = if i1 < 4 && i2 < 4 && i3 < 4 {
-            let idx = ((i1 as usize) << 4) | ((i2 as usize) << 2) | (i3 as usize);
-            CODON_TABLE[idx]
-        } else {
-            b'X'
-        };
-        out.push(aa);
-    }
-    out
-}
-
-fn translate_bytes(bytes: &[u8], base_index: &[u8; 256]) -> ProteinSeq {
-    ProteinSeq::from_bytes_unchecked(translate_to_vec(bytes, base_index))
+fn translate_bytes(bytes: &[u8]) -> ProteinSeq {
+    ProteinSeq::from_bytes_unchecked(translate_codons(bytes))
 }
 
-static BASE_INDEX: LazyLock<[u8; 256]> = LazyLock::new(|| {
-    let mut map = [255u8; 256];
-    map[b'A' as usize] = 0;
-    map[b'C' as usize] = 1;
-    map[b'G' as usize] = 2;
-    map[b'T' as usize] = 3;
-    map[b'a' as usize] = 0;
-    map[b'c' as usize] = 1;
-    map[b'g' as usize] = 2;
-    map[b't' as usize] = 3;
-    map
-});
-
-const CODON_TABLE: [u8; 64] = *b"KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF";
-
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn slice_step_keeps_type() {
+        let s = DnaSeq::new(b"ACGTNacgtn".to_vec()).unwrap();
+        assert_eq!(s.slice_step(1, 4, 1).as_bytes(), b"CGT");
+        assert_eq!(s.slice_step(9, -1, -2).as_bytes(), b"ngaTC");
+    }
+
+    #[test]
+    fn concat_parts() {
+        let a = DnaSeq::new(b"ACG".to_vec()).unwrap();
+        let b = DnaSeq::new(b"tn".to_vec()).unwrap();
+        assert_eq!(DnaSeq::concat([&a, &b, &a]).as_bytes(), b"ACGtnACG");
+        assert!(DnaSeq::concat(std::iter::repeat_n(&a, 0)).is_empty());
+    }
+
     #[test]
     fn count_byte() {
         let s = DnaSeq::new(b"ACGTACGT".to_vec()).unwrap();
@@ -320,6 +282,19 @@ mod tests {
         assert_eq!(s.rfind(b"AC", 0, 4).unwrap(), Some(0));
     }
 
+    #[test]
+    fn complement_in_place_matches_complement() {
+        let s = DnaSeq::new(b"ACGTNacgtnRYACGTACGTA".to_vec()).unwrap();
+        let mut c = s.clone();
+        c.complement_in_place();
+        assert_eq!(c, s.complement());
+        assert_eq!(c.as_bytes(), b"TGCANtgcanYRTGCATGCAT");
+
+        let mut rc = s.clone();
+        rc.reverse_complement_in_place();
+        assert_eq!(rc, s.reverse_complement());
+    }
+
     #[test]
     fn transcribe_basic() {
         let s = DnaSeq::new(b"ATGC".to_vec()).unwrap();
@@ -327,6 +302,30 @@ mod tests {
         assert_eq!(rna.as_bytes(), b"AUGC");
     }
 
+    #[test]
+    fn translate_every_codon() {
+        // NCBI standard code, bases in TCAG order.
+        let code = b"FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG";
+        let bases = b"TCAGN";
+        let mut dna = Vec::new();
+        let mut expected = Vec::new();
+        for &b0 in bases {
+            for &b1 in bases {
+                for &b2 in bases {
+                    dna.extend_from_slice(&[b0, b1.to_ascii_lowercase(), b2]);
+                    let pos = |b: u8| bases.iter().position(|&x| x == b).unwrap();
+                    expected.push(if [b0, b1, b2].contains(&b'N') {
+                        b'X'
+                    } else {
+                        code[16 * pos(b0) + 4 * pos(b1) + pos(b2)]
+                    });
+                }
+            }
+        }
+        let protein = DnaSeq::new(dna).unwrap().translate().unwrap();
+        assert_eq!(protein.as_bytes(), expected.as_slice());
+    }
+
     #[test]
     fn translate_strict_rejects_non_multiple_of_3() {
         let s = DnaSeq::new(b"ATGA".to_vec()).unwrap();
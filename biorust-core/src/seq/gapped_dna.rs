@@ -1,52 +1,51 @@
-use crate::alphabets::dna;
-use crate::error::{BioError, BioResult};
+use crate::alphabets::{dna, ByteClass};
+use crate::error::BioResult;
+use crate::seq::bytes;
 use crate::seq::dna::DnaSeq;
+use crate::seq::shared::{self, SharedBytes};
 use crate::seq::traits::SeqBytes;
 
-use std::sync::LazyLock;
-
-static GAPPED_DNA_IUPAC: LazyLock<bit_set::BitSet> = LazyLock::new(|| {
-    let mut s = dna::iupac_alphabet().symbols;
-    s.insert(b'-' as usize);
-    s.insert(b'.' as usize);
-    s
-});
+const GAPPED_DNA_IUPAC: ByteClass = dna::IUPAC.with(b"-.");
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub struct GappedDnaSeq {
-    bytes: Vec<u8>,
+    bytes: SharedBytes,
 }
 
 impl GappedDnaSeq {
     pub fn new(bytes: Vec<u8>) -> BioResult<Self> {
-        let symbols = &*GAPPED_DNA_IUPAC;
-        for (pos, &b) in bytes.iter().enumerate() {
-            if !symbols.contains(b as usize) {
-                return Err(BioError::InvalidChar { ch: b as char, pos });
-            }
-        }
-        Ok(Self { bytes })
+        GAPPED_DNA_IUPAC.validate(&bytes)?;
+        Ok(Self::from_bytes_unchecked(bytes))
     }
 
     #[inline]
-    #[allow(dead_code)]
     pub(crate) fn from_bytes_unchecked(bytes: Vec<u8>) -> Self {
-        Self { bytes }
+        Self {
+            bytes: bytes.into(),
+        }
     }
 
     pub fn as_bytes(&self) -> &[u8] {
-        &self.bytes
+        self.bytes.as_slice()
+    }
+
+    pub fn as_str(&self) -> &str {
+        bytes::ascii_str(self.as_bytes())
+    }
+
+    /// Copies of `rows` laid out back to back in one shared buffer, e.g. an
+    /// alignment stored row-major so whole-alignment scans walk a single
+    /// allocation.
+    pub fn pack_rows(rows: &[Self]) -> Vec<Self> {
+        shared::pack(rows.iter().map(Self::as_bytes))
+            .into_iter()
+            .map(|bytes| Self { bytes })
+            .collect()
     }
 
     /// Strip gap characters (`-` and `.`) and return a strict `DnaSeq`.
     pub fn ungapped(&self) -> DnaSeq {
-        let out: Vec<u8> = self
-            .bytes
-            .iter()
-            .copied()
-            .filter(|&b| b != b'-' && b != b'.')
-            .collect();
-        DnaSeq::from_bytes_unchecked(out)
+        DnaSeq::from_bytes_unchecked(bytes::remove_gaps(self.as_bytes()))
     }
 }
 
@@ -58,11 +57,27 @@ impl SeqBytes for GappedDnaSeq {
     fn from_bytes(bytes: Vec<u8>) -> BioResult<Self> {
         GappedDnaSeq::new(bytes)
     }
+
+    /// Unit-step slices share this sequence's buffer rather than copying.
+    fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        Self {
+            bytes: self.bytes.slice_step(start, stop, step),
+        }
+    }
+
+    fn concat<'a, I>(parts: I) -> Self
+    where
+        I: IntoIterator<Item = &'a Self>,
+        I::IntoIter: Clone,
+    {
+        Self::from_bytes_unchecked(bytes::concat(parts.into_iter().map(|p| p.as_bytes())))
+    }
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
+    use crate::error::BioError;
 
     #[test]
     fn valid_gapped_seq() {
@@ -1,3 +1,5 @@
+use crate::error::{BioError, BioResult};
+
 pub mod batch;
 pub mod bytes;
 pub mod dna;
@@ -8,6 +10,7 @@ pub mod protein;
 pub mod record;
 pub mod record_batch;
 pub mod rna;
+mod shared;
 pub mod traits;
 
 pub use feature::{Annotations, FeatureLocation, Qualifiers, SeqFeature};
@@ -22,36 +25,374 @@ pub enum TranslationFrame {
     Auto,
 }
 
+/// A lookup table placed at the start of a cache line, so every translation
+/// shares the same few lines rather than a copy straddling an extra one.
+#[repr(C, align(64))]
+struct CacheAligned<T>(T);
+
+/// Amino acid for each codon, indexed by `b0 << 4 | b1 << 2 | b2` over the
+/// 2-bit base codes in [`BASE_CODE`]. The upper half is the index of any
+/// codon holding a non-nucleotide, which translates to `X`.
+static CODON_TABLE: CacheAligned<[u8; 128]> = CacheAligned(
+    *b"KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF\
+XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX",
+);
+
+/// 2-bit code of each nucleotide, either case; `T` and `U` share a code so
+/// DNA and RNA translate through the same table. Anything else is `0x40`,
+/// which lands outside the 2-bit fields of a codon index.
+static BASE_CODE: CacheAligned<[u8; 256]> = CacheAligned({
+    let mut map = [0x40u8; 256];
+    let bases = [b"Aa", b"Cc", b"Gg", b"Tt", b"Uu"];
+    let mut i = 0;
+    while i < bases.len() {
+        let code = if i < 4 { i as u8 } else { 3 };
+        map[bases[i][0] as usize] = code;
+        map[bases[i][1] as usize] = code;
+        i += 1;
+    }
+    map
+});
+
+/// Append the translation of the whole codons of `bytes` to `out`, straight
+/// from nucleotides to residues with no intermediate buffer. Codons holding
+/// anything but A/C/G/T/U translate to `X`.
+///
+/// Encoding and lookup are fused into one pass: each codon's three base
+/// codes are packed into a 6-bit index and an invalid base's `0x40` flag is
+/// ORed in on top, selecting the all-`X` half of [`CODON_TABLE`], so every
+/// codon is one unconditional table load.
+pub(crate) fn translate_codons_into(bytes: &[u8], out: &mut Vec<u8>) {
+    out.extend(bytes.chunks_exact(3).map(|codon| {
+        let [b0, b1, b2] = [0, 1, 2].map(|i| BASE_CODE.0[codon[i] as usize]);
+        codon_residue(b0, b1, b2)
+    }));
+}
+
+#[inline]
+fn codon_residue(b0: u8, b1: u8, b2: u8) -> u8 {
+    let [b0, b1, b2] = [b0, b1, b2].map(usize::from);
+    CODON_TABLE.0[(((b0 << 4) | (b1 << 2) | b2) & 0x3f) | ((b0 | b1 | b2) & 0x40)]
+}
+
+/// Write the 2-bit code of each base of `src` to `dst`: A=0, C=1, G=2 and
+/// T/U=3 in either case, `0x40` for anything else. Runs 32 (AVX2) or 16
+/// (SSSE3) bytes at a time where available.
+///
+/// # Panics
+///
+/// If `dst` is not the same length as `src`.
+pub fn encode_bases(src: &[u8], dst: &mut [u8]) {
+    assert_eq!(src.len(), dst.len(), "encode_bases needs equal lengths");
+    #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") {
+            // SAFETY: AVX2 support was just checked.
+            unsafe { avx2::encode_bases(src, dst) };
+            return;
+        }
+        if std::arch::is_x86_feature_detected!("ssse3") {
+            // SAFETY: SSSE3 support was just checked.
+            unsafe { ssse3::encode_bases(src, dst) };
+            return;
+        }
+    }
+    encode_bases_scalar(src, dst);
+}
+
+fn encode_bases_scalar(src: &[u8], dst: &mut [u8]) {
+    for (d, &s) in dst.iter_mut().zip(src) {
+        *d = BASE_CODE.0[s as usize];
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod ssse3 {
+    use std::arch::x86_64::*;
+
+    /// Base code by low nibble: A/C/G/T/U have distinct low nibbles (1, 3, 7,
+    /// 4, 5 in either case).
+    pub(super) const CODE_BY_LO: [i8; 16] = [
+        0x40, 0, 0x40, 1, 3, 3, 0x40, 2, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40,
+    ];
+
+    /// High nibble, with the lowercase bit set, that a byte with this low
+    /// nibble must have to be a base: 6 for `a`/`c`/`g`, 7 for `t`/`u`.
+    pub(super) const HI_BY_LO: [i8; 16] =
+        [-1, 6, -1, 6, 7, 7, -1, 6, -1, -1, -1, -1, -1, -1, -1, -1];
+
+    /// 16-byte version of `encode_bases_scalar`: one `pshufb` looks up the
+    /// code by low nibble and a second checks the high nibble matches it.
+    #[target_feature(enable = "ssse3")]
+    pub(super) unsafe fn encode_bases(src: &[u8], dst: &mut [u8]) {
+        let code_lut = _mm_loadu_si128(CODE_BY_LO.as_ptr() as *const __m128i);
+        let hi_lut = _mm_loadu_si128(HI_BY_LO.as_ptr() as *const __m128i);
+        let nibble = _mm_set1_epi8(0x0f);
+        let lower = _mm_set1_epi8(0x02);
+        let invalid = _mm_set1_epi8(0x40);
+
+        let mut src_chunks = src.chunks_exact(16);
+        let mut dst_chunks = dst.chunks_exact_mut(16);
+        for (s, d) in (&mut src_chunks).zip(&mut dst_chunks) {
+            let v = _mm_loadu_si128(s.as_ptr() as *const __m128i);
+            let lo = _mm_and_si128(v, nibble);
+            let hi = _mm_or_si128(_mm_and_si128(_mm_srli_epi16(v, 4), nibble), lower);
+            let ok = _mm_cmpeq_epi8(_mm_shuffle_epi8(hi_lut, lo), hi);
+            let code = _mm_and_si128(_mm_shuffle_epi8(code_lut, lo), ok);
+            let out = _mm_or_si128(code, _mm_andnot_si128(ok, invalid));
+            _mm_storeu_si128(d.as_mut_ptr() as *mut __m128i, out);
+        }
+        super::encode_bases_scalar(src_chunks.remainder(), dst_chunks.into_remainder());
+    }
+}
+
+#[cfg(all(feature = "simd", target_arch = "x86_64"))]
+mod avx2 {
+    use super::ssse3::{CODE_BY_LO, HI_BY_LO};
+    use std::arch::x86_64::*;
+
+    /// 32-byte version of `ssse3::encode_bases`, with both lookup tables
+    /// repeated in each 128-bit half for `vpshufb`.
+    #[target_feature(enable = "avx2")]
+    pub(super) unsafe fn encode_bases(src: &[u8], dst: &mut [u8]) {
+        let code_lut =
+            _mm256_broadcastsi128_si256(_mm_loadu_si128(CODE_BY_LO.as_ptr() as *const __m128i));
+        let hi_lut =
+            _mm256_broadcastsi128_si256(_mm_loadu_si128(HI_BY_LO.as_ptr() as *const __m128i));
+        let nibble = _mm256_set1_epi8(0x0f);
+        let lower = _mm256_set1_epi8(0x02);
+        let invalid = _mm256_set1_epi8(0x40);
+
+        let mut src_chunks = src.chunks_exact(32);
+        let mut dst_chunks = dst.chunks_exact_mut(32);
+        for (s, d) in (&mut src_chunks).zip(&mut dst_chunks) {
+            let v = _mm256_loadu_si256(s.as_ptr() as *const __m256i);
+            let lo = _mm256_and_si256(v, nibble);
+            let hi = _mm256_or_si256(_mm256_and_si256(_mm256_srli_epi16(v, 4), nibble), lower);
+            let ok = _mm256_cmpeq_epi8(_mm256_shuffle_epi8(hi_lut, lo), hi);
+            let code = _mm256_and_si256(_mm256_shuffle_epi8(code_lut, lo), ok);
+            let out = _mm256_or_si256(code, _mm256_andnot_si256(ok, invalid));
+            _mm256_storeu_si256(d.as_mut_ptr() as *mut __m256i, out);
+        }
+        super::ssse3::encode_bases(src_chunks.remainder(), dst_chunks.into_remainder());
+    }
+}
+
+/// Strict translation refuses to silently drop trailing bases.
+pub(crate) fn check_whole_codons(len: usize) -> BioResult<()> {
+    if len % 3 != 0 {
+        return Err(BioError::TranslationError {
+            msg: format!(
+                "sequence length {} is not a multiple of 3 ({} trailing bases would be lost)",
+                len,
+                len % 3
+            ),
+        });
+    }
+    Ok(())
+}
+
+pub(crate) fn translate_codons(bytes: &[u8]) -> Vec<u8> {
+    let mut out = Vec::with_capacity(bytes.len() / 3);
+    translate_codons_into(bytes, &mut out);
+    out
+}
+
+/// The whole codons of `bytes` read from `offset`; empty when the sequence
+/// is no longer than the offset.
+fn frame_codons(bytes: &[u8], offset: usize) -> &[u8] {
+    let rest = bytes.get(offset..).unwrap_or_default();
+    &rest[..rest.len() / 3 * 3]
+}
+
+/// Translation of `bytes` in `frame`, dropping any trailing partial codon.
+pub(crate) fn translate_frame_codons(bytes: &[u8], frame: TranslationFrame) -> Vec<u8> {
+    match frame {
+        TranslationFrame::One => translate_codons(frame_codons(bytes, 0)),
+        TranslationFrame::Two => translate_codons(frame_codons(bytes, 1)),
+        TranslationFrame::Three => translate_codons(frame_codons(bytes, 2)),
+        TranslationFrame::Auto => translate_codons(frame_codons(bytes, best_frame_offset(bytes))),
+    }
+}
+
 /// Pick the frame (0, 1, or 2) whose translation contains the longest ORF.
 /// An ORF is defined as the first M to the next * (or end of sequence).
 /// Tiebreak: earliest M start position, then lower frame index.
 /// If no M in any frame, returns 0 (frame 1).
-pub(crate) fn best_frame_index(proteins: [&[u8]; 3]) -> usize {
+///
+/// All three frames are scanned in one pass without translating any of
+/// them: the codon index is rolled forward one base at a time, so each
+/// position costs a single table load, and the scan ends as soon as every
+/// frame's first ORF has reached its stop codon.
+fn best_frame_offset(bytes: &[u8]) -> usize {
+    // Residue index of each frame's first M, and its ORF length once a stop
+    // codon closes it.
+    let mut starts = [None::<usize>; 3];
+    let mut orf_lens = [None::<usize>; 3];
+    let mut closed = 0;
+    let (mut idx, mut invalid) = (0usize, 0usize);
+    for (i, &b) in bytes.iter().enumerate() {
+        let code = BASE_CODE.0[b as usize] as usize;
+        idx = ((idx << 2) | (code & 0x3)) & 0x3f;
+        // One bit per base of the current codon that is not a nucleotide.
+        invalid = ((invalid << 1) | (code >> 6)) & 0x7;
+        if i < 2 {
+            continue;
+        }
+        let residue = CODON_TABLE.0[idx | (usize::from(invalid != 0) << 6)];
+        let (frame, pos) = ((i - 2) % 3, (i - 2) / 3);
+        match starts[frame] {
+            None if residue == b'M' => starts[frame] = Some(pos),
+            Some(start) if residue == b'*' && orf_lens[frame].is_none() => {
+                orf_lens[frame] = Some(pos - start);
+                closed += 1;
+                if closed == 3 {
+                    break;
+                }
+            }
+            _ => {}
+        }
+    }
+
     let mut best_frame = 0usize;
     let mut best_len = 0usize;
     let mut best_start = usize::MAX;
+    for frame in 0..3 {
+        let Some(start) = starts[frame] else {
+            continue;
+        };
+        let orf_len =
+            orf_lens[frame].unwrap_or_else(|| frame_codons(bytes, frame).len() / 3 - start);
+        if orf_len > best_len || (orf_len == best_len && start < best_start) {
+            best_len = orf_len;
+            best_start = start;
+            best_frame = frame;
+        }
+    }
+    best_frame
+}
 
-    for (frame, protein) in proteins.iter().enumerate() {
-        // Find longest ORF: first M to next * or end
-        let mut i = 0;
-        while i < protein.len() {
-            if protein[i] == b'M' {
-                let start = i;
-                let end = protein[start..].iter().position(|&b| b == b'*');
-                let orf_len = match end {
-                    Some(e) => e,
-                    None => protein.len() - start,
-                };
-                if orf_len > best_len || (orf_len == best_len && start < best_start) {
-                    best_len = orf_len;
-                    best_start = start;
-                    best_frame = frame;
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// [`best_frame_offset`] over the three translated frames.
+    fn best_frame_index(proteins: [&[u8]; 3]) -> usize {
+        let mut best_frame = 0usize;
+        let mut best_len = 0usize;
+        let mut best_start = usize::MAX;
+
+        for (frame, protein) in proteins.iter().enumerate() {
+            // Find longest ORF: first M to next * or end
+            let mut i = 0;
+            while i < protein.len() {
+                if protein[i] == b'M' {
+                    let start = i;
+                    let end = protein[start..].iter().position(|&b| b == b'*');
+                    let orf_len = match end {
+                        Some(e) => e,
+                        None => protein.len() - start,
+                    };
+                    if orf_len > best_len || (orf_len == best_len && start < best_start) {
+                        best_len = orf_len;
+                        best_start = start;
+                        best_frame = frame;
+                    }
+                    break; // only consider first M per frame
                 }
-                break; // only consider first M per frame
+                i += 1;
             }
-            i += 1;
         }
+
+        best_frame
     }
 
-    best_frame
+    #[test]
+    fn best_frame_offset_matches_translated_frames() {
+        let bases = b"ATGtaaTAGUgaNcC";
+        let mut fixed: Vec<Vec<u8>> = [
+            &b""[..],
+            b"AT",
+            b"ATG",
+            b"AATGGCC",
+            b"ATGTAAATGAAATAG",
+            b"CCATGAAATGAAAAAAATGTAG",
+            b"ATGNNNAAATAA",
+            b"AUGuuuUAA",
+        ]
+        .iter()
+        .map(|s| s.to_vec())
+        .collect();
+        for seed in 0..300usize {
+            let len = seed % 61;
+            fixed.push(
+                (0..len)
+                    .map(|i| bases[(i * 7 + seed * 13 + i * i * seed) % bases.len()])
+                    .collect(),
+            );
+        }
+        for dna in fixed {
+            let frames = [0, 1, 2].map(|offset| translate_codons(frame_codons(&dna, offset)));
+            let expected = best_frame_index([&frames[0], &frames[1], &frames[2]]);
+            assert_eq!(
+                best_frame_offset(&dna),
+                expected,
+                "{:?}",
+                String::from_utf8_lossy(&dna)
+            );
+        }
+    }
+
+    #[test]
+    fn lookup_tables_start_cache_lines() {
+        assert_eq!(CODON_TABLE.0.as_ptr() as usize % 64, 0);
+        assert_eq!(BASE_CODE.0.as_ptr() as usize % 64, 0);
+    }
+
+    #[test]
+    fn encode_bases_matches_table() {
+        let all: Vec<u8> = (0..=255u8).chain(b"ACGTUacgtuN-".iter().copied()).collect();
+        for start in 0..40 {
+            let src = &all[start..];
+            let mut expected = vec![0; src.len()];
+            encode_bases_scalar(src, &mut expected);
+            let mut got = vec![0; src.len()];
+            encode_bases(src, &mut got);
+            assert_eq!(got, expected);
+            #[cfg(all(feature = "simd", target_arch = "x86_64"))]
+            if std::arch::is_x86_feature_detected!("ssse3") {
+                got.fill(0);
+                // SAFETY: SSSE3 support was just checked.
+                unsafe { ssse3::encode_bases(src, &mut got) };
+                assert_eq!(got, expected);
+            }
+        }
+    }
+
+    #[test]
+    fn translate_codons_matches_ncbi_table() {
+        // NCBI standard code, bases in TCAG order; any other base gives 'X'.
+        let code = b"FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG";
+        let tcag = |b: u8| match b.to_ascii_uppercase() {
+            b'T' | b'U' => Some(0),
+            b'C' => Some(1),
+            b'A' => Some(2),
+            b'G' => Some(3),
+            _ => None,
+        };
+        let bases = b"ACGTUacgtuNR";
+        for len in [0, 2, 3, 383, 384, 775] {
+            let dna: Vec<u8> = (0..len)
+                .map(|i| bases[(i * 7 + i / 5) % bases.len()])
+                .collect();
+            let expected: Vec<u8> = dna
+                .chunks_exact(3)
+                .map(|c| match (tcag(c[0]), tcag(c[1]), tcag(c[2])) {
+                    (Some(i), Some(j), Some(k)) => code[16 * i + 4 * j + k],
+                    _ => b'X',
+                })
+                .collect();
+            assert_eq!(translate_codons(&dna), expected);
+        }
+    }
 }
@@ -2,7 +2,6 @@ use crate::alphabets::protein;
 use crate::error::{BioError, BioResult};
 use crate::seq::bytes::{self, IntoNeedle, Needle};
 use crate::seq::traits::SeqBytes;
-use std::sync::LazyLock;
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub struct ProteinSeq {
@@ -11,12 +10,7 @@ pub struct ProteinSeq {
 
 impl ProteinSeq {
     pub fn new(bytes: Vec<u8>) -> BioResult<Self> {
-        let alphabet = protein::iupac_alphabet();
-        for (pos, &b) in bytes.iter().enumerate() {
-            if !alphabet.symbols.contains(b as usize) {
-                return Err(BioError::InvalidChar { ch: b as char, pos });
-            }
-        }
+        protein::IUPAC.validate(&bytes)?;
         Ok(Self { bytes })
     }
 
@@ -29,14 +23,12 @@ impl ProteinSeq {
         &self.bytes
     }
 
+    pub fn as_str(&self) -> &str {
+        bytes::ascii_str(self.as_bytes())
+    }
+
     pub fn to_string(&self) -> BioResult<String> {
-        // All valid IUPAC protein bytes are valid UTF-8
-        std::str::from_utf8(self.as_bytes())
-            .map(|s| s.to_string())
-            .map_err(|_| BioError::InvalidChar {
-                ch: '\u{FFFD}',
-                pos: 0,
-            })
+        Ok(self.as_str().to_owned())
     }
 
     pub fn reverse(&self) -> Self {
@@ -104,72 +96,43 @@ impl ProteinSeq {
     }
 
     pub fn counts(&self) -> [u32; 256] {
-        let mut counts = [0u32; 256];
-        for &b in self.as_bytes() {
-            counts[b as usize] += 1;
+        // Four interleaved tables so runs of one residue don't serialize on
+        // the same counter.
+        let mut lanes = [[0u32; 256]; 4];
+        let mut chunks = self.as_bytes().chunks_exact(4);
+        for c in &mut chunks {
+            lanes[0][c[0] as usize] += 1;
+            lanes[1][c[1] as usize] += 1;
+            lanes[2][c[2] as usize] += 1;
+            lanes[3][c[3] as usize] += 1;
+        }
+        for &b in chunks.remainder() {
+            lanes[0][b as usize] += 1;
+        }
+        let mut counts = lanes[0];
+        for lane in &lanes[1..] {
+            for (c, &l) in counts.iter_mut().zip(lane) {
+                *c += l;
+            }
         }
         counts
     }
 
     pub fn frequencies(&self) -> [f64; 256] {
-        let mut freq = [0.0f64; 256];
-        let len = self.len();
-        if len == 0 {
-            return freq;
-        }
-        let counts = self.counts();
-        let denom = len as f64;
-        for (i, &c) in counts.iter().enumerate() {
-            if c > 0 {
-                freq[i] = c as f64 / denom;
-            }
-        }
-        freq
+        frequencies_of(&self.counts(), self.len())
     }
 
     pub fn aa_counts_20(&self) -> [u32; 20] {
-        let mut counts = [0u32; 20];
-        for &b in self.as_bytes() {
-            let idx = AA20_INDEX[b as usize];
-            if idx >= 0 {
-                counts[idx as usize] += 1;
-            }
-        }
-        counts
+        let counts = aa_counts_21(self.as_bytes());
+        counts[..20].try_into().unwrap()
     }
 
     pub fn aa_frequencies_20(&self) -> [f64; 20] {
-        let mut freq = [0.0f64; 20];
-        let len = self.len();
-        if len == 0 {
-            return freq;
-        }
-        let counts = self.aa_counts_20();
-        let denom = len as f64;
-        for (i, &c) in counts.iter().enumerate() {
-            if c > 0 {
-                freq[i] = c as f64 / denom;
-            }
-        }
-        freq
+        frequencies_of(&self.aa_counts_20(), self.len())
     }
 
     pub fn shannon_entropy(&self) -> f64 {
-        let len = self.len();
-        if len == 0 {
-            return 0.0;
-        }
-        let counts = self.counts();
-        let denom = len as f64;
-        let mut entropy = 0.0f64;
-        for &count in &counts {
-            if count == 0 {
-                continue;
-            }
-            let p = count as f64 / denom;
-            entropy -= p * p.log2();
-        }
-        entropy
+        ResidueCounts::of(self).shannon_entropy()
     }
 
     pub fn molecular_weight(&self) -> BioResult<f64> {
@@ -179,7 +142,7 @@ impl ProteinSeq {
         let mut total = 0.0f64;
         for (pos, &b) in self.as_bytes().iter().enumerate() {
             let idx = AA20_INDEX[b as usize];
-            if idx < 0 {
+            if idx == AA20_NONE {
                 return Err(BioError::InvalidChar { ch: b as char, pos });
             }
             total += AA20_MASS_AVG[idx as usize];
@@ -194,7 +157,7 @@ impl ProteinSeq {
         let mut total = 0.0f64;
         for (pos, &b) in self.as_bytes().iter().enumerate() {
             let idx = AA20_INDEX[b as usize];
-            if idx < 0 {
+            if idx == AA20_NONE {
                 return Err(BioError::InvalidChar { ch: b as char, pos });
             }
             total += AA20_HYDRO_KD[idx as usize];
@@ -211,89 +174,55 @@ impl ProteinSeq {
             return Ok(Vec::new());
         }
 
-        // Pre-map bytes to hydrophobicity values, validating all at once
-        let hydro: Vec<f64> = bytes
-            .iter()
-            .enumerate()
-            .map(|(pos, &b)| {
-                let idx = AA20_INDEX[b as usize];
-                if idx < 0 {
-                    Err(BioError::InvalidChar { ch: b as char, pos })
-                } else {
-                    Ok(AA20_HYDRO_KD[idx as usize])
-                }
-            })
-            .collect::<BioResult<_>>()?;
-
-        // Sliding window: O(n) instead of O(n * window)
-        let inv_w = 1.0 / window as f64;
-        let mut sum: f64 = hydro[..window].iter().sum();
+        validate_aa20(bytes)?;
+
+        // Sliding window over a byte-indexed table of scores in tenths: the
+        // running sum is an exact integer, so it never drifts however many
+        // residues enter and leave it, and each output is a single division.
+        let kd = &AA20_HYDRO_KD_TENTHS_BY_BYTE;
+        let scale = 10.0 * window as f64;
+        let mut sum: i64 = bytes[..window].iter().map(|&b| kd[b as usize] as i64).sum();
         let mut out = Vec::with_capacity(bytes.len() - window + 1);
-        out.push(sum * inv_w);
-        for i in 1..=bytes.len() - window {
-            sum += hydro[i + window - 1] - hydro[i - 1];
-            out.push(sum * inv_w);
+        out.push(sum as f64 / scale);
+        for (&enter, &leave) in bytes[window..].iter().zip(bytes) {
+            sum += (kd[enter as usize] - kd[leave as usize]) as i64;
+            out.push(sum as f64 / scale);
         }
         Ok(out)
     }
 
     pub fn net_charge(&self, ph: f64) -> BioResult<f64> {
-        if self.has_ambiguous() {
-            for (pos, &b) in self.as_bytes().iter().enumerate() {
-                if AA20_INDEX[b as usize] < 0 {
-                    return Err(BioError::InvalidChar { ch: b as char, pos });
-                }
-            }
-        }
-
-        let counts = self.aa_counts_20();
-        let n_term = basic_charge(ph, PKA_NTERM);
-        let c_term = acidic_charge(ph, PKA_CTERM);
-        let mut total = n_term + c_term;
-
-        total += counts[idx('R')] as f64 * basic_charge(ph, PKA_R);
-        total += counts[idx('K')] as f64 * basic_charge(ph, PKA_K);
-        total += counts[idx('H')] as f64 * basic_charge(ph, PKA_H);
-        total += counts[idx('D')] as f64 * acidic_charge(ph, PKA_D);
-        total += counts[idx('E')] as f64 * acidic_charge(ph, PKA_E);
-        total += counts[idx('C')] as f64 * acidic_charge(ph, PKA_C);
-        total += counts[idx('Y')] as f64 * acidic_charge(ph, PKA_Y);
-
-        Ok(total)
+        Ok(Ionizable::new(&self.strict_counts()?).charge_at(ph))
     }
 
     pub fn isoelectric_point(&self) -> BioResult<f64> {
-        let mut low = 0.0f64;
-        let mut high = 14.0f64;
-        for _ in 0..60 {
-            let mid = (low + high) / 2.0;
-            let charge = self.net_charge(mid)?;
-            if charge > 0.0 {
-                low = mid;
-            } else {
-                high = mid;
-            }
+        // count once; only the pH changes across the bisection
+        Ok(Ionizable::new(&self.strict_counts()?).isoelectric_point())
+    }
+
+    /// `aa_counts_21`, or the error for the first non-standard residue.
+    fn strict_counts(&self) -> BioResult<[u32; 21]> {
+        let counts = aa_counts_21(self.as_bytes());
+        if counts[AA20_NONE as usize] > 0 {
+            validate_aa20(self.as_bytes())?;
         }
-        Ok((low + high) / 2.0)
+        Ok(counts)
     }
 
     pub fn validate_strict_20(&self) -> BioResult<()> {
-        for (pos, &b) in self.as_bytes().iter().enumerate() {
-            if AA20_INDEX[b as usize] < 0 {
-                return Err(BioError::InvalidChar { ch: b as char, pos });
-            }
-        }
-        Ok(())
+        validate_aa20(self.as_bytes())
     }
 
     pub fn has_ambiguous(&self) -> bool {
-        self.as_bytes().iter().any(|&b| AA20_INDEX[b as usize] < 0)
+        self.as_bytes()
+            .iter()
+            .any(|&b| AA20_INDEX[b as usize] == AA20_NONE)
     }
 
     pub fn unknown_positions(&self) -> Vec<usize> {
         let mut out = Vec::new();
         for (i, &b) in self.as_bytes().iter().enumerate() {
-            if AA20_INDEX[b as usize] < 0 {
+            if AA20_INDEX[b as usize] == AA20_NONE {
                 out.push(i);
             }
         }
@@ -309,6 +238,136 @@ impl SeqBytes for ProteinSeq {
     fn from_bytes(bytes: Vec<u8>) -> BioResult<Self> {
         ProteinSeq::new(bytes)
     }
+
+    fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        Self::from_bytes_unchecked(bytes::slice_step(self.as_bytes(), start, stop, step))
+    }
+
+    fn concat<'a, I>(parts: I) -> Self
+    where
+        I: IntoIterator<Item = &'a Self>,
+        I::IntoIter: Clone,
+    {
+        Self::from_bytes_unchecked(bytes::concat(parts.into_iter().map(|p| p.as_bytes())))
+    }
+}
+
+/// Every byte a [`ProteinSeq`] can hold, in ascending byte order.
+const RESIDUES: &[u8; 47] = b"*ABCDEFGHIKLMNPQRSTVWXYZabcdefghiklmnpqrstvwxyz";
+
+/// Residue histogram of one protein sequence, one lane per [`RESIDUES`]
+/// symbol instead of per byte value.
+///
+/// Every composition metric (`counts`, `frequencies`, `aa_counts_20`,
+/// `aa_frequencies_20`, `shannon_entropy`) can be derived from it without
+/// rescanning the sequence, so batches can count once and keep the result
+/// at a fifth of the size of a `[u32; 256]` table.
+#[derive(Copy, Clone, Debug, PartialEq, Eq)]
+pub struct ResidueCounts {
+    counts: [u32; RESIDUES.len()],
+}
+
+impl ResidueCounts {
+    pub fn of(seq: &ProteinSeq) -> Self {
+        let full = seq.counts();
+        Self {
+            counts: RESIDUES.map(|b| full[b as usize]),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.counts.iter().map(|&c| c as usize).sum()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len() == 0
+    }
+
+    /// `(residue, count)` for every residue present, in byte order.
+    pub fn iter(&self) -> impl Iterator<Item = (u8, u32)> + '_ {
+        RESIDUES
+            .iter()
+            .zip(&self.counts)
+            .filter(|(_, &c)| c > 0)
+            .map(|(&b, &c)| (b, c))
+    }
+
+    pub fn counts(&self) -> [u32; 256] {
+        let mut full = [0u32; 256];
+        for (&b, &c) in RESIDUES.iter().zip(&self.counts) {
+            full[b as usize] = c;
+        }
+        full
+    }
+
+    pub fn frequencies(&self) -> [f64; 256] {
+        frequencies_of(&self.counts(), self.len())
+    }
+
+    fn aa_counts_21(&self) -> [u32; 21] {
+        let mut counts = [0u32; 21];
+        for (&b, &c) in RESIDUES.iter().zip(&self.counts) {
+            counts[AA20_INDEX[b as usize] as usize] += c;
+        }
+        counts
+    }
+
+    pub fn aa_counts_20(&self) -> [u32; 20] {
+        self.aa_counts_21()[..20].try_into().unwrap()
+    }
+
+    /// [`ProteinSeq::net_charge`] from the counts alone, or `None` if the
+    /// sequence holds anything outside the 20 standard amino acids.
+    pub fn net_charge(&self, ph: f64) -> Option<f64> {
+        self.ionizable().map(|groups| groups.charge_at(ph))
+    }
+
+    /// [`ProteinSeq::isoelectric_point`] from the counts alone, or `None` if
+    /// the sequence holds anything outside the 20 standard amino acids.
+    pub fn isoelectric_point(&self) -> Option<f64> {
+        self.ionizable().map(|groups| groups.isoelectric_point())
+    }
+
+    fn ionizable(&self) -> Option<Ionizable> {
+        let counts = self.aa_counts_21();
+        (counts[AA20_NONE as usize] == 0).then(|| Ionizable::new(&counts))
+    }
+
+    pub fn aa_frequencies_20(&self) -> [f64; 20] {
+        frequencies_of(&self.aa_counts_20(), self.len())
+    }
+
+    pub fn shannon_entropy(&self) -> f64 {
+        let len = self.len();
+        if len == 0 {
+            return 0.0;
+        }
+        let denom = len as f64;
+        let mut entropy = 0.0f64;
+        for &count in &self.counts {
+            if count == 0 {
+                continue;
+            }
+            let p = count as f64 / denom;
+            entropy -= p * p.log2();
+        }
+        entropy
+    }
+}
+
+/// `counts` divided by `len`, or all zeros for an empty sequence.
+fn frequencies_of<const N: usize>(counts: &[u32; N], len: usize) -> [f64; N] {
+    let mut freq = [0.0f64; N];
+    if len == 0 {
+        return freq;
+    }
+    let denom = len as f64;
+    for (f, &c) in freq.iter_mut().zip(counts) {
+        if c > 0 {
+            *f = c as f64 / denom;
+        }
+    }
+    freq
 }
 
 impl<'a> IntoNeedle<'a> for &'a ProteinSeq {
@@ -326,15 +385,46 @@ fn needle_len(needle: Needle<'_>) -> usize {
     }
 }
 
-static AA20_INDEX: LazyLock<[i8; 256]> = LazyLock::new(|| {
-    let mut map = [-1i8; 256];
-    for (idx, &b) in AA20.iter().enumerate() {
-        map[b as usize] = idx as i8;
-        let lower = b.to_ascii_lowercase();
-        map[lower as usize] = idx as i8;
+/// `AA20_INDEX` value for bytes outside the 20 standard amino acids.
+const AA20_NONE: u8 = 20;
+
+/// Byte -> index into `AA20` (either case), or `AA20_NONE`.
+const AA20_INDEX: [u8; 256] = {
+    let mut map = [AA20_NONE; 256];
+    let mut i = 0;
+    while i < AA20.len() {
+        map[AA20[i] as usize] = i as u8;
+        map[AA20[i].to_ascii_lowercase() as usize] = i as u8;
+        i += 1;
     }
     map
-});
+};
+
+/// Standard amino acid counts plus a last lane for everything else, so the
+/// counting loop has no branch.
+#[inline]
+fn aa_counts_21(bytes: &[u8]) -> [u32; 21] {
+    let mut counts = [0u32; 21];
+    for &b in bytes {
+        counts[AA20_INDEX[b as usize] as usize] += 1;
+    }
+    counts
+}
+
+/// Error at the first byte outside the 20 standard amino acids, if any.
+#[inline]
+fn validate_aa20(bytes: &[u8]) -> BioResult<()> {
+    match bytes
+        .iter()
+        .position(|&b| AA20_INDEX[b as usize] == AA20_NONE)
+    {
+        Some(pos) => Err(BioError::InvalidChar {
+            ch: bytes[pos] as char,
+            pos,
+        }),
+        None => Ok(()),
+    }
+}
 
 const AA20: [u8; 20] = *b"ARNDCEQGHILKMFPSTWYV";
 
@@ -386,6 +476,26 @@ const AA20_HYDRO_KD: [f64; 20] = [
     4.2,  // V
 ];
 
+/// `AA20_HYDRO_KD` in tenths (every score has one decimal, so this is
+/// exact), indexed directly by byte (0 for non-standard bytes).
+const AA20_HYDRO_KD_TENTHS_BY_BYTE: [i8; 256] = {
+    let mut out = [0i8; 256];
+    let mut b = 0;
+    while b < 256 {
+        let i = AA20_INDEX[b];
+        if i != AA20_NONE {
+            let tenths = AA20_HYDRO_KD[i as usize] * 10.0;
+            out[b] = if tenths < 0.0 {
+                tenths - 0.5
+            } else {
+                tenths + 0.5
+            } as i8;
+        }
+        b += 1;
+    }
+    out
+};
+
 const PKA_NTERM: f64 = 9.69;
 const PKA_CTERM: f64 = 2.34;
 const PKA_C: f64 = 8.33;
@@ -396,14 +506,55 @@ const PKA_K: f64 = 10.53;
 const PKA_R: f64 = 12.48;
 const PKA_Y: f64 = 10.07;
 
-#[inline]
-fn basic_charge(ph: f64, pka: f64) -> f64 {
-    1.0 / (1.0 + 10f64.powf(ph - pka))
+/// Ionizable groups of one sequence as `(count, 10^pKa)`, so evaluating the
+/// charge at a new pH costs a single `powf`.
+struct Ionizable {
+    basic: [(f64, f64); 4],
+    acidic: [(f64, f64); 5],
 }
 
-#[inline]
-fn acidic_charge(ph: f64, pka: f64) -> f64 {
-    -1.0 / (1.0 + 10f64.powf(pka - ph))
+impl Ionizable {
+    fn new(counts: &[u32; 21]) -> Self {
+        let group = |aa: char, pka: f64| (counts[idx(aa)] as f64, 10f64.powf(pka));
+        Self {
+            basic: [
+                (1.0, 10f64.powf(PKA_NTERM)),
+                group('R', PKA_R),
+                group('K', PKA_K),
+                group('H', PKA_H),
+            ],
+            acidic: [
+                (1.0, 10f64.powf(PKA_CTERM)),
+                group('D', PKA_D),
+                group('E', PKA_E),
+                group('C', PKA_C),
+                group('Y', PKA_Y),
+            ],
+        }
+    }
+
+    /// Henderson-Hasselbalch: `1 / (1 + 10^(pH - pKa))` per basic group and
+    /// `-1 / (1 + 10^(pKa - pH))` per acidic group.
+    fn charge_at(&self, ph: f64) -> f64 {
+        let h = 10f64.powf(ph);
+        let basic: f64 = self.basic.iter().map(|&(n, ka)| n / (1.0 + h / ka)).sum();
+        let acidic: f64 = self.acidic.iter().map(|&(n, ka)| n / (1.0 + ka / h)).sum();
+        basic - acidic
+    }
+
+    fn isoelectric_point(&self) -> f64 {
+        let mut low = 0.0f64;
+        let mut high = 14.0f64;
+        for _ in 0..60 {
+            let mid = (low + high) / 2.0;
+            if self.charge_at(mid) > 0.0 {
+                low = mid;
+            } else {
+                high = mid;
+            }
+        }
+        (low + high) / 2.0
+    }
 }
 
 #[inline]
@@ -445,6 +596,62 @@ mod tests {
         assert!((seq.shannon_entropy() - 1.0).abs() < 1e-12);
     }
 
+    #[test]
+    fn counts_match_naive() {
+        let seq = ProteinSeq::new(b"MKTAYIAKQRQISFVKSHggBXZ*".repeat(3)).unwrap();
+        let mut expected = [0u32; 256];
+        for &b in seq.as_bytes() {
+            expected[b as usize] += 1;
+        }
+        assert_eq!(seq.counts(), expected);
+
+        let counts = seq.aa_counts_20();
+        assert_eq!(counts[idx('K')], 9);
+        assert_eq!(counts[idx('G')], 6); // lowercase counted
+        assert_eq!(counts.iter().sum::<u32>(), 3 * 20);
+    }
+
+    #[test]
+    fn residue_counts_match_direct_metrics() {
+        for b in 0..=255u8 {
+            assert_eq!(
+                protein::IUPAC.contains(b),
+                RESIDUES.contains(&b),
+                "byte {b}"
+            );
+        }
+        assert!(RESIDUES.windows(2).all(|w| w[0] < w[1]));
+
+        for bytes in [&b""[..], b"MKTAYIAKQRQISFVKSHggBXZ*", b"wwwwA"] {
+            let seq = ProteinSeq::new(bytes.to_vec()).unwrap();
+            let rc = ResidueCounts::of(&seq);
+            assert_eq!(rc.len(), seq.len());
+            assert_eq!(rc.counts(), seq.counts());
+            let present: Vec<(u8, u32)> = (0..=255u8)
+                .map(|b| (b, seq.counts()[b as usize]))
+                .filter(|&(_, c)| c > 0)
+                .collect();
+            assert_eq!(rc.iter().collect::<Vec<_>>(), present);
+            assert_eq!(rc.frequencies(), seq.frequencies());
+            assert_eq!(rc.aa_counts_20(), seq.aa_counts_20());
+            assert_eq!(rc.aa_frequencies_20(), seq.aa_frequencies_20());
+            assert_eq!(rc.shannon_entropy(), seq.shannon_entropy());
+        }
+    }
+
+    #[test]
+    fn net_charge_reports_first_invalid() {
+        let seq = ProteinSeq::new(b"ACXDB".to_vec()).unwrap();
+        assert!(matches!(
+            seq.net_charge(7.0),
+            Err(BioError::InvalidChar { ch: 'X', pos: 2 })
+        ));
+        assert!(matches!(
+            seq.isoelectric_point(),
+            Err(BioError::InvalidChar { ch: 'X', pos: 2 })
+        ));
+    }
+
     #[test]
     fn molecular_weight() {
         let seq = ProteinSeq::new(b"AC".to_vec()).unwrap();
@@ -463,6 +670,45 @@ mod tests {
         assert!((profile[1] + 0.5).abs() < 1e-6);
     }
 
+    #[test]
+    fn hydrophobicity_profile_matches_window_means() {
+        let seq = ProteinSeq::new(b"MKTAYIAKQRQISFVKSHfsrl".to_vec()).unwrap();
+        let kd: Vec<f64> = seq
+            .as_bytes()
+            .iter()
+            .map(|&b| AA20_HYDRO_KD[AA20_INDEX[b as usize] as usize])
+            .collect();
+        for window in [1, 3, 7, 22] {
+            let profile = seq.hydrophobicity_profile(window).unwrap();
+            assert_eq!(profile.len(), kd.len() - window + 1);
+            for (i, v) in profile.iter().enumerate() {
+                let mean = kd[i..i + window].iter().sum::<f64>() / window as f64;
+                assert!((v - mean).abs() < 1e-9, "window {window} pos {i}");
+            }
+        }
+        assert!(seq.hydrophobicity_profile(23).unwrap().is_empty());
+
+        // Long windows slide without accumulating rounding error.
+        let long: Vec<u8> = (0..5000).map(|i| AA20[(i * 7 + i / 13) % 20]).collect();
+        let profile = ProteinSeq::new(long.clone())
+            .unwrap()
+            .hydrophobicity_profile(9)
+            .unwrap();
+        for (i, v) in profile.iter().enumerate() {
+            let tenths: i64 = long[i..i + 9]
+                .iter()
+                .map(|&b| (AA20_HYDRO_KD[AA20_INDEX[b as usize] as usize] * 10.0).round() as i64)
+                .sum();
+            assert_eq!(*v, tenths as f64 / 90.0, "pos {i}");
+        }
+        assert!(matches!(
+            ProteinSeq::new(b"ACXD".to_vec())
+                .unwrap()
+                .hydrophobicity_profile(2),
+            Err(BioError::InvalidChar { ch: 'X', pos: 2 })
+        ));
+    }
+
     #[test]
     fn net_charge_and_pi() {
         let seq = ProteinSeq::new(b"AC".to_vec()).unwrap();
@@ -476,6 +722,38 @@ mod tests {
         assert!(charge_pi.abs() < 1e-2);
     }
 
+    #[test]
+    fn charge_matches_per_group_formula() {
+        let seq = ProteinSeq::new(b"MKRHDECYYKDE".to_vec()).unwrap();
+        let counts = aa_counts_21(seq.as_bytes());
+        let basic = |pka: f64, ph: f64| 1.0 / (1.0 + 10f64.powf(ph - pka));
+        let acidic = |pka: f64, ph: f64| -1.0 / (1.0 + 10f64.powf(pka - ph));
+        for ph in [0.0, 3.5, 7.0, 9.25, 14.0] {
+            let expected = basic(PKA_NTERM, ph)
+                + acidic(PKA_CTERM, ph)
+                + counts[idx('R')] as f64 * basic(PKA_R, ph)
+                + counts[idx('K')] as f64 * basic(PKA_K, ph)
+                + counts[idx('H')] as f64 * basic(PKA_H, ph)
+                + counts[idx('D')] as f64 * acidic(PKA_D, ph)
+                + counts[idx('E')] as f64 * acidic(PKA_E, ph)
+                + counts[idx('C')] as f64 * acidic(PKA_C, ph)
+                + counts[idx('Y')] as f64 * acidic(PKA_Y, ph);
+            assert!(
+                (seq.net_charge(ph).unwrap() - expected).abs() < 1e-12,
+                "pH {ph}"
+            );
+        }
+
+        let rc = ResidueCounts::of(&seq);
+        assert_eq!(rc.net_charge(7.0), Some(seq.net_charge(7.0).unwrap()));
+        assert_eq!(
+            rc.isoelectric_point(),
+            Some(seq.isoelectric_point().unwrap())
+        );
+        let ambiguous = ProteinSeq::new(b"ACX".to_vec()).unwrap();
+        assert_eq!(ResidueCounts::of(&ambiguous).isoelectric_point(), None);
+    }
+
     #[test]
     fn ambiguity_helpers() {
         let seq = ProteinSeq::new(b"ACBX".to_vec()).unwrap();
@@ -158,41 +158,49 @@ impl<S: SeqBytes> RecordBatch<S> {
         self.seqs.lengths()
     }
 
+    /// Which records have a non-empty sequence, or `None` when all of them
+    /// do, so the common case costs one scan of the lengths.
+    fn non_empty_mask(&self) -> Option<Vec<bool>> {
+        let seqs = self.seqs.as_slice();
+        if seqs.iter().all(|s| !s.as_bytes().is_empty()) {
+            return None;
+        }
+        Some(seqs.iter().map(|s| !s.as_bytes().is_empty()).collect())
+    }
+
     /// Return a new batch containing only records whose sequence is non-empty.
     pub fn filter_empty(&self) -> Self {
-        let mut ids = Vec::new();
-        let mut descs = Vec::new();
-        let mut seqs = Vec::new();
-        let mut features = Vec::new();
-        let mut annotations = Vec::new();
-
-        for (i, seq) in self.seqs.as_slice().iter().enumerate() {
-            if !seq.as_bytes().is_empty() {
-                ids.push(self.ids[i].clone());
-                descs.push(self.descs[i].clone());
-                seqs.push(seq.clone());
-                features.push(self.features[i].clone());
-                annotations.push(self.annotations[i].clone());
-            }
+        let Some(keep) = self.non_empty_mask() else {
+            return self.clone();
+        };
+        let kept = keep.iter().filter(|&&k| k).count();
+
+        fn select<T: Clone>(v: &[T], keep: &[bool], kept: usize) -> Vec<T> {
+            let mut out = Vec::with_capacity(kept);
+            out.extend(
+                v.iter()
+                    .zip(keep)
+                    .filter(|(_, &k)| k)
+                    .map(|(x, _)| x.clone()),
+            );
+            out
         }
 
         Self {
-            ids,
-            descs,
-            seqs: SeqBatch::new(seqs),
-            features,
-            annotations,
+            ids: select(&self.ids, &keep, kept),
+            descs: select(&self.descs, &keep, kept),
+            seqs: SeqBatch::new(select(self.seqs.as_slice(), &keep, kept)),
+            features: select(&self.features, &keep, kept),
+            annotations: select(&self.annotations, &keep, kept),
         }
     }
 
-    /// Remove records with empty sequences in place.
+    /// Remove records with empty sequences in place, without cloning the
+    /// records that are kept.
     pub fn filter_empty_in_place(&mut self) {
-        let keep: Vec<bool> = self
-            .seqs
-            .as_slice()
-            .iter()
-            .map(|s| !s.as_bytes().is_empty())
-            .collect();
+        let Some(keep) = self.non_empty_mask() else {
+            return;
+        };
 
         fn retain_by_mask<T>(v: &mut Vec<T>, keep: &[bool]) {
             let mut iter = keep.iter();
@@ -203,10 +211,7 @@ impl<S: SeqBytes> RecordBatch<S> {
         retain_by_mask(&mut self.descs, &keep);
         retain_by_mask(&mut self.features, &keep);
         retain_by_mask(&mut self.annotations, &keep);
-
-        let mut seqs = self.seqs.as_slice().to_vec();
-        retain_by_mask(&mut seqs, &keep);
-        self.seqs = SeqBatch::new(seqs);
+        self.seqs.retain_by_len(Some(1), None);
     }
 }
 
@@ -411,6 +416,33 @@ mod tests {
         assert_eq!(batch.id(1).unwrap(), "id3");
     }
 
+    #[test]
+    fn filter_empty_keeps_columns_aligned() {
+        let records: Vec<SeqRecord<DnaSeq>> = [&b""[..], b"A", b"", b"CG", b""]
+            .iter()
+            .enumerate()
+            .map(|(i, bytes)| {
+                SeqRecord::new(format!("id{i}"), DnaSeq::new(bytes.to_vec()).unwrap())
+                    .with_desc(format!("desc{i}"))
+            })
+            .collect();
+        let batch = RecordBatch::from_records(records);
+
+        let mut in_place = batch.clone();
+        in_place.filter_empty_in_place();
+        let copied = batch.filter_empty();
+        assert_eq!(in_place, copied);
+        assert_eq!(copied.ids(), &["id1".into(), "id3".into()]);
+        assert_eq!(copied.desc(1), Some(Some("desc3")));
+        assert_eq!(copied.seq(1).unwrap().as_bytes(), b"CG");
+
+        // Nothing to drop: both forms leave the batch as it was.
+        let mut unchanged = copied.clone();
+        unchanged.filter_empty_in_place();
+        assert_eq!(unchanged, copied);
+        assert_eq!(copied.filter_empty(), copied);
+    }
+
     #[test]
     fn reverse_complement_updates_features() {
         let seq = DnaSeq::new(b"ATGC".to_vec()).unwrap();
@@ -1,11 +1,10 @@
 use crate::alphabets::rna;
-use crate::error::{BioError, BioResult};
+use crate::error::BioResult;
 use crate::seq::bytes::{self, IntoNeedle, Needle};
 use crate::seq::dna::{DnaSeq, ReverseComplement};
 use crate::seq::protein::ProteinSeq;
 use crate::seq::traits::SeqBytes;
-use crate::seq::{best_frame_index, TranslationFrame};
-use std::sync::LazyLock;
+use crate::seq::{check_whole_codons, translate_codons, translate_frame_codons, TranslationFrame};
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub struct RnaSeq {
@@ -14,12 +13,7 @@ pub struct RnaSeq {
 
 impl RnaSeq {
     pub fn new(bytes: Vec<u8>) -> BioResult<Self> {
-        let alphabet = rna::iupac_alphabet();
-        for (pos, &b) in bytes.iter().enumerate() {
-            if !alphabet.symbols.contains(b as usize) {
-                return Err(BioError::InvalidChar { ch: b as char, pos });
-            }
-        }
+        rna::IUPAC.validate(&bytes)?;
         Ok(Self { bytes })
     }
 
@@ -32,6 +26,10 @@ impl RnaSeq {
         &self.bytes
     }
 
+    pub fn as_str(&self) -> &str {
+        bytes::ascii_str(self.as_bytes())
+    }
+
     pub fn gc_content(&self) -> f64 {
         if self.bytes.is_empty() {
             return 0.0;
@@ -77,59 +75,15 @@ impl RnaSeq {
 
     pub fn translate(&self) -> BioResult<ProteinSeq> {
         let bytes = self.as_bytes();
-        if bytes.len() % 3 != 0 {
-            return Err(BioError::TranslationError {
-                msg: format!(
-                    "sequence length {} is not a multiple of 3 ({} trailing bases would be lost)",
-                    bytes.len(),
-                    bytes.len() % 3
-                ),
-            });
-        }
-        Ok(translate_bytes(bytes, &BASE_INDEX))
+        check_whole_codons(bytes.len())?;
+        Ok(translate_bytes(bytes))
     }
 
     pub fn translate_frame(&self, frame: TranslationFrame) -> BioResult<ProteinSeq> {
-        match frame {
-            TranslationFrame::One => {
-                let bytes = self.as_bytes();
-                let len = bytes.len() / 3 * 3;
-                Ok(translate_bytes(&bytes[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Two => {
-                let bytes = self.as_bytes();
-                if bytes.len() < 2 {
-                    return Ok(ProteinSeq::from_bytes_unchecked(Vec::new()));
-                }
-                let slice = &bytes[1..];
-                let len = slice.len() / 3 * 3;
-                Ok(translate_bytes(&slice[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Three => {
-                let bytes = self.as_bytes();
-                if bytes.len() < 3 {
-                    return Ok(ProteinSeq::from_bytes_unchecked(Vec::new()));
-                }
-                let slice = &bytes[2..];
-                let len = slice.len() / 3 * 3;
-                Ok(translate_bytes(&slice[..len], &BASE_INDEX))
-            }
-            TranslationFrame::Auto => {
-                let bytes = self.as_bytes();
-                let mut candidates: [Vec<u8>; 3] = [Vec::new(), Vec::new(), Vec::new()];
-                for offset in 0..3 {
-                    if bytes.len() > offset {
-                        let slice = &bytes[offset..];
-                        let len = slice.len() / 3 * 3;
-                        candidates[offset] = translate_to_vec(&slice[..len], &BASE_INDEX);
-                    }
-                }
-                let idx = best_frame_index([&candidates[0], &candidates[1], &candidates[2]]);
-                Ok(ProteinSeq::from_bytes_unchecked(std::mem::take(
-                    &mut candidates[idx],
-                )))
-            }
-        }
+        Ok(ProteinSeq::from_bytes_unchecked(translate_frame_codons(
+            self.as_bytes(),
+            frame,
+        )))
     }
 
     pub fn count<'a, N>(&'a self, sub: N) -> BioResult<usize>
@@ -187,6 +141,18 @@ impl SeqBytes for RnaSeq {
     fn from_bytes(bytes: Vec<u8>) -> BioResult<Self> {
         RnaSeq::new(bytes)
     }
+
+    fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        Self::from_bytes_unchecked(bytes::slice_step(self.as_bytes(), start, stop, step))
+    }
+
+    fn concat<'a, I>(parts: I) -> Self
+    where
+        I: IntoIterator<Item = &'a Self>,
+        I::IntoIter: Clone,
+    {
+        Self::from_bytes_unchecked(bytes::concat(parts.into_iter().map(|p| p.as_bytes())))
+    }
 }
 
 impl ReverseComplement for RnaSeq {
@@ -202,42 +168,10 @@ impl<'a> IntoNeedle<'a> for &'a RnaSeq {
     }
 }
 
-fn translate_to_vec(bytes: &[u8], base_index: &[u8; 256]) -> Vec<u8> {
-    let mut out = Vec::with_capacity(bytes.len() / 3);
-    for codon in bytes.chunks_exact(3) {
-        let i1 = base_index[codon[0] as usize];
-        let i2 = base_index[codon[1] as usize];
-        let i3 = base_index[codon[2] as usize];
-        let aa = if i1 < 4 && i2 < 4 && i3 < 4 {
-            let idx = ((i1 as usize) << 4) | ((i2 as usize) << 2) | (i3 as usize);
-            CODON_TABLE[idx]
-        } else {
-            b'X'
-        };
-        out.push(aa);
-    }
-    out
+fn translate_bytes(bytes: &[u8]) -> ProteinSeq {
+    ProteinSeq::from_bytes_unchecked(translate_codons(bytes))
 }
 
-fn translate_bytes(bytes: &[u8], base_index: &[u8; 256]) -> ProteinSeq {
-    ProteinSeq::from_bytes_unchecked(translate_to_vec(bytes, base_index))
-}
-
-static BASE_INDEX: LazyLock<[u8; 256]> = LazyLock::new(|| {
-    let mut map = [255u8; 256];
-    map[b'A' as usize] = 0;
-    map[b'C' as usize] = 1;
-    map[b'G' as usize] = 2;
-    map[b'U' as usize] = 3;
-    map[b'a' as usize] = 0;
-    map[b'c' as usize] = 1;
-    map[b'g' as usize] = 2;
-    map[b'u' as usize] = 3;
-    map
-});
-
-const CODON_TABLE: [u8; 64] = *b"KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF";
-
 #[cfg(test)]
 mod tests {
     use super::*;
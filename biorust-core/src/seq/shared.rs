@@ -0,0 +1,139 @@
+use crate::seq::bytes;
+use std::fmt;
+use std::hash::{Hash, Hasher};
+use std::sync::Arc;
+
+/// Immutable bytes behind a reference-counted buffer, viewed through a
+/// `start..start + len` window.
+///
+/// Cloning and contiguous slicing share the buffer instead of copying it.
+/// Equality and hashing only look at the viewed bytes, so a view behaves
+/// exactly like the `Vec<u8>` it replaces.
+#[derive(Clone)]
+pub(crate) struct SharedBytes {
+    buf: Arc<[u8]>,
+    start: usize,
+    len: usize,
+}
+
+impl SharedBytes {
+    #[inline]
+    pub(crate) fn as_slice(&self) -> &[u8] {
+        &self.buf[self.start..self.start + self.len]
+    }
+
+    /// Python extended slice `start:stop:step`, with indices as
+    /// `slice.indices(len)` returns them. Non-empty unit-step slices are
+    /// views of the same buffer; anything else is copied.
+    pub(crate) fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        if step == 1 && start < stop {
+            debug_assert!(0 <= start && stop as usize <= self.len);
+            return Self {
+                buf: Arc::clone(&self.buf),
+                start: self.start + start as usize,
+                len: (stop - start) as usize,
+            };
+        }
+        bytes::slice_step(self.as_slice(), start, stop, step).into()
+    }
+}
+
+/// Copy `parts` into one buffer, returning a view of each part in order.
+pub(crate) fn pack<'a, I>(parts: I) -> Vec<SharedBytes>
+where
+    I: Iterator<Item = &'a [u8]> + Clone,
+{
+    let buf: Arc<[u8]> = bytes::concat(parts.clone()).into();
+    let mut start = 0;
+    parts
+        .map(|part| {
+            let view = SharedBytes {
+                buf: Arc::clone(&buf),
+                start,
+                len: part.len(),
+            };
+            start += part.len();
+            view
+        })
+        .collect()
+}
+
+impl From<Vec<u8>> for SharedBytes {
+    fn from(bytes: Vec<u8>) -> Self {
+        let len = bytes.len();
+        Self {
+            buf: bytes.into(),
+            start: 0,
+            len,
+        }
+    }
+}
+
+impl PartialEq for SharedBytes {
+    fn eq(&self, other: &Self) -> bool {
+        self.as_slice() == other.as_slice()
+    }
+}
+
+impl Eq for SharedBytes {}
+
+impl Hash for SharedBytes {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        self.as_slice().hash(state);
+    }
+}
+
+impl fmt::Debug for SharedBytes {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        self.as_slice().fmt(f)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::collections::hash_map::DefaultHasher;
+
+    fn hash_of<T: Hash + ?Sized>(value: &T) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        value.hash(&mut hasher);
+        hasher.finish()
+    }
+
+    #[test]
+    fn unit_step_slices_share_the_buffer() {
+        let whole = SharedBytes::from(b"AC-GT.N".to_vec());
+        let view = whole.slice_step(1, 5, 1);
+        assert_eq!(view.as_slice(), b"C-GT");
+        assert!(Arc::ptr_eq(&whole.buf, &view.buf));
+
+        let nested = view.slice_step(1, 3, 1);
+        assert_eq!(nested.as_slice(), b"-G");
+        assert!(Arc::ptr_eq(&whole.buf, &nested.buf));
+
+        assert_eq!(whole.slice_step(5, 0, -2).as_slice(), b".GC");
+        assert_eq!(whole.slice_step(3, 3, 1).as_slice(), b"");
+    }
+
+    #[test]
+    fn pack_returns_views_of_one_buffer() {
+        let rows: [&[u8]; 3] = [b"AC-G", b"", b"TT.A"];
+        let packed = pack(rows.iter().copied());
+        assert_eq!(packed.len(), 3);
+        for (view, row) in packed.iter().zip(rows) {
+            assert_eq!(view.as_slice(), row);
+            assert!(Arc::ptr_eq(&view.buf, &packed[0].buf));
+        }
+        assert_eq!(&*packed[0].buf, b"AC-GTT.A");
+    }
+
+    #[test]
+    fn views_compare_and_hash_by_content() {
+        let view = SharedBytes::from(b"xxACGTxx".to_vec()).slice_step(2, 6, 1);
+        let owned = SharedBytes::from(b"ACGT".to_vec());
+        assert_eq!(view, owned);
+        assert_eq!(hash_of(&view), hash_of(&owned));
+        assert_eq!(hash_of(&view), hash_of(&b"ACGT".to_vec()));
+        assert_eq!(format!("{view:?}"), format!("{:?}", b"ACGT"));
+    }
+}
@@ -1,4 +1,5 @@
 use crate::error::BioResult;
+use crate::seq::bytes;
 
 pub trait SeqBytes: Clone + Sized + Send + Sync {
     fn as_bytes(&self) -> &[u8];
@@ -11,4 +12,26 @@ pub trait SeqBytes: Clone + Sized + Send + Sync {
     fn is_empty(&self) -> bool {
         self.as_bytes().is_empty()
     }
+
+    /// Python extended slice `start:stop:step`, indices as returned by
+    /// `slice.indices(len)`. A subsequence of a valid sequence is valid, so
+    /// implementors can skip re-validation; the default goes through
+    /// `from_bytes`.
+    fn slice_step(&self, start: isize, stop: isize, step: isize) -> Self {
+        Self::from_bytes(bytes::slice_step(self.as_bytes(), start, stop, step))
+            .expect("a subsequence of a valid sequence is valid")
+    }
+
+    /// Concatenate `parts` with a single allocation. Joining valid sequences
+    /// gives a valid one, so implementors can skip re-validation; the default
+    /// goes through `from_bytes`.
+    fn concat<'a, I>(parts: I) -> Self
+    where
+        Self: 'a,
+        I: IntoIterator<Item = &'a Self>,
+        I::IntoIter: Clone,
+    {
+        Self::from_bytes(bytes::concat(parts.into_iter().map(|p| p.as_bytes())))
+            .expect("a concatenation of valid sequences is valid")
+    }
 }
@@ -3,14 +3,16 @@
 use pyo3::exceptions::{PyIndexError, PyOverflowError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyList, PySlice};
+use std::sync::OnceLock;
 
 use crate::dna::DNA;
-use crate::protein::Protein;
+use crate::protein::{self, Protein};
 use crate::rna::RNA;
 use crate::utils;
+use biorust_core::par;
 use biorust_core::seq::batch::SeqBatch;
 use biorust_core::seq::dna::DnaSeq;
-use biorust_core::seq::protein::ProteinSeq;
+use biorust_core::seq::protein::{ProteinSeq, ResidueCounts};
 use biorust_core::seq::rna::RnaSeq;
 
 #[allow(clippy::upper_case_acronyms)]
@@ -23,6 +25,9 @@ pub struct DNABatch {
 #[pyclass]
 pub struct ProteinBatch {
     pub(crate) inner: SeqBatch<ProteinSeq>,
+    /// Residue histograms shared by the composition metrics; filled on first
+    /// use and dropped by every mutation.
+    residue_counts: OnceLock<Vec<ResidueCounts>>,
 }
 
 #[allow(clippy::upper_case_acronyms)]
@@ -36,7 +41,7 @@ fn collect_dna_seqs(obj: &Bound<'_, PyAny>) -> PyResult<Vec<DnaSeq>> {
         return Ok(batch.inner.as_slice().to_vec());
     }
 
-    let mut out = Vec::new();
+    let mut out = Vec::with_capacity(obj.len().unwrap_or(0));
     for item in obj.iter()? {
         let item = item?;
         let dna = item
@@ -52,7 +57,7 @@ fn collect_rna_seqs(obj: &Bound<'_, PyAny>) -> PyResult<Vec<RnaSeq>> {
         return Ok(batch.inner.as_slice().to_vec());
     }
 
-    let mut out = Vec::new();
+    let mut out = Vec::with_capacity(obj.len().unwrap_or(0));
     for item in obj.iter()? {
         let item = item?;
         let rna = item
@@ -68,7 +73,7 @@ fn collect_protein_seqs(obj: &Bound<'_, PyAny>) -> PyResult<Vec<ProteinSeq>> {
         return Ok(batch.inner.as_slice().to_vec());
     }
 
-    let mut out = Vec::new();
+    let mut out = Vec::with_capacity(obj.len().unwrap_or(0));
     for item in obj.iter()? {
         let item = item?;
         let protein = item
@@ -128,51 +133,6 @@ fn collect_take_indices(obj: &Bound<'_, PyAny>, len: usize) -> PyResult<Vec<usiz
     Ok(out)
 }
 
-fn protein_counts_to_pairs(counts: &[u32; 256]) -> Vec<(String, u32)> {
-    counts
-        .iter()
-        .enumerate()
-        .filter_map(|(b, &count)| {
-            if count == 0 {
-                None
-            } else {
-                Some(((b as u8 as char).to_string(), count))
-            }
-        })
-        .collect()
-}
-
-fn protein_freq_to_pairs(freq: &[f64; 256]) -> Vec<(String, f64)> {
-    freq.iter()
-        .enumerate()
-        .filter_map(|(b, &val)| {
-            if val == 0.0 {
-                None
-            } else {
-                Some(((b as u8 as char).to_string(), val))
-            }
-        })
-        .collect()
-}
-
-fn protein_counts_20_to_pairs(counts: &[u32; 20]) -> Vec<(String, u32)> {
-    let letters = b"ARNDCEQGHILKMFPSTWYV";
-    letters
-        .iter()
-        .enumerate()
-        .map(|(i, &b)| ((b as char).to_string(), counts[i]))
-        .collect()
-}
-
-fn protein_freq_20_to_pairs(freq: &[f64; 20]) -> Vec<(String, f64)> {
-    let letters = b"ARNDCEQGHILKMFPSTWYV";
-    letters
-        .iter()
-        .enumerate()
-        .map(|(i, &b)| ((b as char).to_string(), freq[i]))
-        .collect()
-}
-
 #[pymethods]
 impl DNABatch {
     #[new]
@@ -231,9 +191,11 @@ impl DNABatch {
         .to_object(py))
     }
 
-    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
-        let list = self.to_list(py)?;
-        list.call_method0("__iter__")
+    fn __iter__(slf: PyRef<'_, Self>) -> DNABatchIterator {
+        DNABatchIterator {
+            batch: slf.into(),
+            index: 0,
+        }
     }
 
     fn to_list<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
@@ -279,11 +241,11 @@ impl DNABatch {
         max_len: Option<usize>,
         inplace: bool,
     ) -> PyResult<PyObject> {
-        let filtered = self.inner.filter_by_len(min_len, max_len);
         if inplace {
-            self.inner = filtered;
+            self.inner.retain_by_len(min_len, max_len);
             return Ok(py.None());
         }
+        let filtered = self.inner.filter_by_len(min_len, max_len);
         let out = DNABatch { inner: filtered };
         Ok(Py::new(py, out)?.to_object(py))
     }
@@ -321,7 +283,7 @@ impl DNABatch {
             }
         }
         .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Py::new(py, ProteinBatch { inner })?.to_object(py))
+        Ok(Py::new(py, ProteinBatch::from(inner))?.to_object(py))
     }
 
     fn count(&self, needle: &Bound<'_, PyAny>) -> PyResult<Vec<usize>> {
@@ -390,27 +352,32 @@ impl DNABatch {
             return Ok(());
         }
         let n = n as usize;
-        let orig: Vec<DnaSeq> = slf.inner.as_slice().to_vec();
-        let total = orig
+        slf.inner
             .len()
             .checked_mul(n)
             .ok_or_else(|| PyOverflowError::new_err("repeat count would overflow"))?;
-        slf.inner.clear();
-        slf.inner.reserve(total);
-        for _ in 0..n {
-            slf.inner.extend(orig.iter().cloned());
-        }
+        slf.inner.repeat_in_place(n);
         Ok(())
     }
 
-    #[pyo3(signature = (inplace=false))]
-    fn reverse_complements(&mut self, py: Python<'_>, inplace: bool) -> PyResult<PyObject> {
+    #[pyo3(signature = (inplace=false, threads=None))]
+    fn reverse_complements(
+        &mut self,
+        py: Python<'_>,
+        inplace: bool,
+        threads: Option<usize>,
+    ) -> PyResult<PyObject> {
         if inplace {
-            py.allow_threads(|| self.inner.reverse_complements_in_place());
+            py.allow_threads(|| {
+                par::with_threads(threads, || self.inner.reverse_complements_in_place())
+            })
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
             return Ok(py.None());
         }
 
-        let inner = py.allow_threads(|| self.inner.reverse_complements());
+        let inner = py
+            .allow_threads(|| par::with_threads(threads, || self.inner.reverse_complements()))
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
         Ok(Py::new(py, DNABatch { inner })?.to_object(py))
     }
 }
@@ -473,9 +440,11 @@ impl RNABatch {
         .to_object(py))
     }
 
-    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
-        let list = self.to_list(py)?;
-        list.call_method0("__iter__")
+    fn __iter__(slf: PyRef<'_, Self>) -> RNABatchIterator {
+        RNABatchIterator {
+            batch: slf.into(),
+            index: 0,
+        }
     }
 
     fn to_list<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
@@ -521,11 +490,11 @@ impl RNABatch {
         max_len: Option<usize>,
         inplace: bool,
     ) -> PyResult<PyObject> {
-        let filtered = self.inner.filter_by_len(min_len, max_len);
         if inplace {
-            self.inner = filtered;
+            self.inner.retain_by_len(min_len, max_len);
             return Ok(py.None());
         }
+        let filtered = self.inner.filter_by_len(min_len, max_len);
         let out = RNABatch { inner: filtered };
         Ok(Py::new(py, out)?.to_object(py))
     }
@@ -563,7 +532,7 @@ impl RNABatch {
             }
         }
         .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Py::new(py, ProteinBatch { inner })?.to_object(py))
+        Ok(Py::new(py, ProteinBatch::from(inner))?.to_object(py))
     }
 
     fn append(&mut self, seq: &Bound<'_, PyAny>) -> PyResult<()> {
@@ -614,16 +583,11 @@ impl RNABatch {
             return Ok(());
         }
         let n = n as usize;
-        let orig: Vec<RnaSeq> = slf.inner.as_slice().to_vec();
-        let total = orig
+        slf.inner
             .len()
             .checked_mul(n)
             .ok_or_else(|| PyOverflowError::new_err("repeat count would overflow"))?;
-        slf.inner.clear();
-        slf.inner.reserve(total);
-        for _ in 0..n {
-            slf.inner.extend(orig.iter().cloned());
-        }
+        slf.inner.repeat_in_place(n);
         Ok(())
     }
 
@@ -639,13 +603,36 @@ impl RNABatch {
     }
 }
 
+impl From<SeqBatch<ProteinSeq>> for ProteinBatch {
+    fn from(inner: SeqBatch<ProteinSeq>) -> Self {
+        Self {
+            inner,
+            residue_counts: OnceLock::new(),
+        }
+    }
+}
+
+impl ProteinBatch {
+    /// Mutable access to the sequences; invalidates the cached counts.
+    fn inner_mut(&mut self) -> &mut SeqBatch<ProteinSeq> {
+        self.residue_counts.take();
+        &mut self.inner
+    }
+
+    fn residue_counts(&self, py: Python<'_>) -> &[ResidueCounts] {
+        if let Some(cached) = self.residue_counts.get() {
+            return cached;
+        }
+        let computed = py.allow_threads(|| self.inner.residue_counts());
+        self.residue_counts.get_or_init(|| computed)
+    }
+}
+
 #[pymethods]
 impl ProteinBatch {
     #[new]
     fn new(seqs: &Bound<'_, PyAny>) -> PyResult<Self> {
-        Ok(Self {
-            inner: SeqBatch::new(collect_protein_seqs(seqs)?),
-        })
+        Ok(Self::from(SeqBatch::new(collect_protein_seqs(seqs)?)))
     }
 
     fn __len__(&self) -> usize {
@@ -672,9 +659,7 @@ impl ProteinBatch {
                 }
             }
 
-            let batch = ProteinBatch {
-                inner: SeqBatch::new(out),
-            };
+            let batch = ProteinBatch::from(SeqBatch::new(out));
             return Ok(Py::new(py, batch)?.to_object(py));
         }
 
@@ -688,24 +673,20 @@ impl ProteinBatch {
             return Err(PyIndexError::new_err("index out of range"));
         }
 
-        Ok(Py::new(
-            py,
-            Protein {
-                inner: self.inner[i as usize].clone(),
-            },
-        )?
-        .to_object(py))
+        Ok(Py::new(py, Protein::from(self.inner[i as usize].clone()))?.to_object(py))
     }
 
-    fn __iter__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
-        let list = self.to_list(py)?;
-        list.call_method0("__iter__")
+    fn __iter__(slf: PyRef<'_, Self>) -> ProteinBatchIterator {
+        ProteinBatchIterator {
+            batch: slf.into(),
+            index: 0,
+        }
     }
 
     fn to_list<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyList>> {
         let mut items = Vec::with_capacity(self.inner.len());
         for seq in self.inner.as_slice() {
-            items.push(Py::new(py, Protein { inner: seq.clone() })?);
+            items.push(Py::new(py, Protein::from(seq.clone()))?);
         }
         Ok(PyList::new_bound(py, items))
     }
@@ -715,17 +696,13 @@ impl ProteinBatch {
     }
 
     fn copy(&self) -> Self {
-        Self {
-            inner: self.inner.clone(),
-        }
+        Self::from(self.inner.clone())
     }
 
     #[pyo3(signature = (start=None, stop=None, step=1))]
     fn slice(&self, start: Option<isize>, stop: Option<isize>, step: isize) -> PyResult<Self> {
         let (start, stop, step) = normalize_slice(self.inner.len(), start, stop, step)?;
-        Ok(Self {
-            inner: self.inner.slice(start, stop, step),
-        })
+        Ok(Self::from(self.inner.slice(start, stop, step)))
     }
 
     fn take(&self, idxs: &Bound<'_, PyAny>) -> PyResult<Self> {
@@ -734,7 +711,7 @@ impl ProteinBatch {
             .inner
             .take(&idxs)
             .map_err(|err| PyIndexError::new_err(err.to_string()))?;
-        Ok(Self { inner: out })
+        Ok(Self::from(out))
     }
 
     #[pyo3(signature = (min_len=None, max_len=None, inplace=false))]
@@ -745,12 +722,12 @@ impl ProteinBatch {
         max_len: Option<usize>,
         inplace: bool,
     ) -> PyResult<PyObject> {
-        let filtered = self.inner.filter_by_len(min_len, max_len);
         if inplace {
-            self.inner = filtered;
+            self.inner_mut().retain_by_len(min_len, max_len);
             return Ok(py.None());
         }
-        let out = ProteinBatch { inner: filtered };
+        let filtered = self.inner.filter_by_len(min_len, max_len);
+        let out = ProteinBatch::from(filtered);
         Ok(Py::new(py, out)?.to_object(py))
     }
 
@@ -759,41 +736,53 @@ impl ProteinBatch {
             .inner
             .concat_all()
             .map_err(|err| PyValueError::new_err(err.to_string()))?;
-        Ok(Py::new(py, Protein { inner: seq })?.to_object(py))
+        Ok(Py::new(py, Protein::from(seq))?.to_object(py))
     }
 
     #[pyo3(signature = (inplace=false))]
     fn reverse(&mut self, py: Python<'_>, inplace: bool) -> PyResult<PyObject> {
         if inplace {
-            py.allow_threads(|| self.inner.reverse_in_place());
+            let inner = self.inner_mut();
+            py.allow_threads(|| inner.reverse_in_place());
             return Ok(py.None());
         }
         let inner = py.allow_threads(|| self.inner.reverse());
-        Ok(Py::new(py, ProteinBatch { inner })?.to_object(py))
+        Ok(Py::new(py, ProteinBatch::from(inner))?.to_object(py))
     }
 
-    fn counts(&self, py: Python<'_>) -> Vec<Vec<(String, u32)>> {
-        let raw = py.allow_threads(|| self.inner.counts());
-        raw.iter().map(protein_counts_to_pairs).collect()
+    fn counts(&self, py: Python<'_>) -> Vec<Vec<(char, u32)>> {
+        self.residue_counts(py)
+            .iter()
+            .map(protein::residue_count_pairs)
+            .collect()
     }
 
-    fn frequencies(&self, py: Python<'_>) -> Vec<Vec<(String, f64)>> {
-        let raw = py.allow_threads(|| self.inner.frequencies());
-        raw.iter().map(protein_freq_to_pairs).collect()
+    fn frequencies(&self, py: Python<'_>) -> Vec<Vec<(char, f64)>> {
+        self.residue_counts(py)
+            .iter()
+            .map(protein::residue_freq_pairs)
+            .collect()
     }
 
-    fn aa_counts_20(&self, py: Python<'_>) -> Vec<Vec<(String, u32)>> {
-        let raw = py.allow_threads(|| self.inner.aa_counts_20());
-        raw.iter().map(protein_counts_20_to_pairs).collect()
+    fn aa_counts_20(&self, py: Python<'_>) -> Vec<Vec<(char, u32)>> {
+        self.residue_counts(py)
+            .iter()
+            .map(|rc| protein::aa20_pairs(&rc.aa_counts_20()))
+            .collect()
     }
 
-    fn aa_frequencies_20(&self, py: Python<'_>) -> Vec<Vec<(String, f64)>> {
-        let raw = py.allow_threads(|| self.inner.aa_frequencies_20());
-        raw.iter().map(protein_freq_20_to_pairs).collect()
+    fn aa_frequencies_20(&self, py: Python<'_>) -> Vec<Vec<(char, f64)>> {
+        self.residue_counts(py)
+            .iter()
+            .map(|rc| protein::aa20_pairs(&rc.aa_frequencies_20()))
+            .collect()
     }
 
     fn shannon_entropy(&self, py: Python<'_>) -> Vec<f64> {
-        py.allow_threads(|| self.inner.shannon_entropy())
+        self.residue_counts(py)
+            .iter()
+            .map(ResidueCounts::shannon_entropy)
+            .collect()
     }
 
     fn molecular_weight(&self, py: Python<'_>) -> PyResult<Vec<f64>> {
@@ -812,13 +801,30 @@ impl ProteinBatch {
     }
 
     fn net_charge(&self, py: Python<'_>, ph: f64) -> PyResult<Vec<f64>> {
-        py.allow_threads(|| self.inner.net_charge(ph))
-            .map_err(|err| PyValueError::new_err(err.to_string()))
+        let counts = self.residue_counts(py);
+        py.allow_threads(|| {
+            self.inner
+                .iter()
+                .zip(counts)
+                .map(|(seq, rc)| rc.net_charge(ph).map_or_else(|| seq.net_charge(ph), Ok))
+                .collect::<Result<Vec<_>, _>>()
+        })
+        .map_err(|err| PyValueError::new_err(err.to_string()))
     }
 
     fn isoelectric_point(&self, py: Python<'_>) -> PyResult<Vec<f64>> {
-        py.allow_threads(|| self.inner.isoelectric_point())
-            .map_err(|err| PyValueError::new_err(err.to_string()))
+        let counts = self.residue_counts(py);
+        py.allow_threads(|| {
+            self.inner
+                .iter()
+                .zip(counts)
+                .map(|(seq, rc)| {
+                    rc.isoelectric_point()
+                        .map_or_else(|| seq.isoelectric_point(), Ok)
+                })
+                .collect::<Result<Vec<_>, _>>()
+        })
+        .map_err(|err| PyValueError::new_err(err.to_string()))
     }
 
     fn has_ambiguous(&self, py: Python<'_>) -> Vec<bool> {
@@ -851,18 +857,18 @@ impl ProteinBatch {
         let protein = seq
             .extract::<PyRef<'_, Protein>>()
             .map_err(|_| PyTypeError::new_err("ProteinBatch expects Protein objects only"))?;
-        self.inner.push(protein.inner.clone());
+        self.inner_mut().push(protein.inner.clone());
         Ok(())
     }
 
     fn extend(&mut self, seqs: &Bound<'_, PyAny>) -> PyResult<()> {
         let out = collect_protein_seqs(seqs)?;
-        self.inner.extend(out);
+        self.inner_mut().extend(out);
         Ok(())
     }
 
     fn clear(&mut self) {
-        self.inner.clear();
+        self.inner_mut().clear();
     }
 
     fn reserve(&mut self, additional: usize) {
@@ -870,48 +876,82 @@ impl ProteinBatch {
     }
 
     fn pop(&mut self, py: Python<'_>) -> PyResult<PyObject> {
-        match self.inner.pop() {
-            Some(seq) => Ok(Py::new(py, Protein { inner: seq })?.to_object(py)),
+        match self.inner_mut().pop() {
+            Some(seq) => Ok(Py::new(py, Protein::from(seq))?.to_object(py)),
             None => Err(PyIndexError::new_err("pop from empty batch")),
         }
     }
 
     fn truncate(&mut self, len: usize) {
-        self.inner.truncate(len);
+        self.inner_mut().truncate(len);
     }
 
     fn __iadd__(mut slf: PyRefMut<'_, Self>, other: &Bound<'_, PyAny>) -> PyResult<()> {
         let out = collect_protein_seqs(other)?;
-        slf.inner.extend(out);
+        slf.inner_mut().extend(out);
         Ok(())
     }
 
     fn __imul__(mut slf: PyRefMut<'_, Self>, n: isize) -> PyResult<()> {
         if n <= 0 {
-            slf.inner.clear();
+            slf.inner_mut().clear();
             return Ok(());
         }
         if n == 1 {
             return Ok(());
         }
         let n = n as usize;
-        let orig: Vec<ProteinSeq> = slf.inner.as_slice().to_vec();
-        let total = orig
+        slf.inner
             .len()
             .checked_mul(n)
             .ok_or_else(|| PyOverflowError::new_err("repeat count would overflow"))?;
-        slf.inner.clear();
-        slf.inner.reserve(total);
-        for _ in 0..n {
-            slf.inner.extend(orig.iter().cloned());
-        }
+        slf.inner_mut().repeat_in_place(n);
         Ok(())
     }
 }
 
+/// Lazy iterator over a batch class: each element is wrapped only when it is
+/// reached, instead of building the whole list up front.
+///
+/// The batch is borrowed per step with `try_borrow`, so stepping while
+/// another thread holds it for an in-place update (which keeps a `PyRefMut`
+/// across `allow_threads`) raises a borrow error instead of panicking.
+macro_rules! batch_iterator {
+    ($name:ident, $batch:ty, $item:ty, $wrap:expr) => {
+        #[pyclass]
+        pub struct $name {
+            batch: Py<$batch>,
+            index: usize,
+        }
+
+        #[pymethods]
+        impl $name {
+            fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+                slf
+            }
+
+            fn __next__(&mut self, py: Python<'_>) -> PyResult<Option<$item>> {
+                let batch = self.batch.try_borrow(py)?;
+                let Some(seq) = batch.inner.as_slice().get(self.index) else {
+                    return Ok(None);
+                };
+                self.index += 1;
+                Ok(Some(($wrap)(seq.clone())))
+            }
+        }
+    };
+}
+
+batch_iterator!(DNABatchIterator, DNABatch, DNA, |inner| DNA { inner });
+batch_iterator!(RNABatchIterator, RNABatch, RNA, |inner| RNA { inner });
+batch_iterator!(ProteinBatchIterator, ProteinBatch, Protein, Protein::from);
+
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<DNABatch>()?;
     m.add_class::<RNABatch>()?;
     m.add_class::<ProteinBatch>()?;
+    m.add_class::<DNABatchIterator>()?;
+    m.add_class::<RNABatchIterator>()?;
+    m.add_class::<ProteinBatchIterator>()?;
     Ok(())
 }
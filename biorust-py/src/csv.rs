@@ -11,8 +11,11 @@ use crate::rna_record_batch::RNARecordBatch;
 use biorust_core::error::BioError;
 use biorust_core::io::csv as core_csv;
 use biorust_core::io::csv::ColumnSel;
-use biorust_core::io::detect::{detect_seq_type, SeqType};
+use biorust_core::io::detect::SeqType;
 use biorust_core::io::OnError;
+use biorust_core::seq::dna::DnaSeq;
+use biorust_core::seq::protein::ProteinSeq;
+use biorust_core::seq::rna::RnaSeq;
 
 #[pyfunction]
 #[pyo3(signature = (path, *, id_col, seq_col, desc_col=None, alphabet="auto", on_error="raise"))]
@@ -34,10 +37,10 @@ fn read_csv(
 
     let on_error = parse_on_error(on_error)?;
     let alpha = match alphabet.to_ascii_lowercase().as_str() {
-        "auto" => detect_csv_type(path, &seq_col_sel)?,
-        "dna" => SeqType::Dna,
-        "rna" => SeqType::Rna,
-        "protein" => SeqType::Protein,
+        "auto" => None,
+        "dna" => Some(SeqType::Dna),
+        "rna" => Some(SeqType::Rna),
+        "protein" => Some(SeqType::Protein),
         _ => {
             return Err(PyValueError::new_err(
                 "alphabet must be 'auto', 'dna', 'rna', or 'protein'",
@@ -45,12 +48,27 @@ fn read_csv(
         }
     };
 
-    let path = path.to_owned();
+    // Read the file once; detection and parsing both work on this buffer.
+    let data = py
+        .allow_threads(|| std::fs::read(path))
+        .map_err(|e| PyIOError::new_err(e.to_string()))?;
+    let alpha = match alpha {
+        Some(alpha) => alpha,
+        None => core_csv::detect_csv_type(&data, path, &seq_col_sel).map_err(map_bio_err)?,
+    };
+
     match alpha {
         SeqType::Dna => {
             let report = py
                 .allow_threads(|| {
-                    core_csv::read_csv_dna(&path, id_col, seq_col_sel, desc_col, on_error)
+                    core_csv::read_csv_from_bytes::<DnaSeq>(
+                        &data,
+                        path,
+                        id_col,
+                        seq_col_sel,
+                        desc_col,
+                        on_error,
+                    )
                 })
                 .map_err(map_bio_err)?;
             let skipped = report
@@ -67,7 +85,14 @@ fn read_csv(
         SeqType::Rna => {
             let report = py
                 .allow_threads(|| {
-                    core_csv::read_csv_rna(&path, id_col, seq_col_sel, desc_col, on_error)
+                    core_csv::read_csv_from_bytes::<RnaSeq>(
+                        &data,
+                        path,
+                        id_col,
+                        seq_col_sel,
+                        desc_col,
+                        on_error,
+                    )
                 })
                 .map_err(map_bio_err)?;
             let skipped = report
@@ -84,7 +109,14 @@ fn read_csv(
         SeqType::Protein => {
             let report = py
                 .allow_threads(|| {
-                    core_csv::read_csv_protein(&path, id_col, seq_col_sel, desc_col, on_error)
+                    core_csv::read_csv_from_bytes::<ProteinSeq>(
+                        &data,
+                        path,
+                        id_col,
+                        seq_col_sel,
+                        desc_col,
+                        on_error,
+                    )
                 })
                 .map_err(map_bio_err)?;
             let skipped = report
@@ -101,43 +133,6 @@ fn read_csv(
     }
 }
 
-/// Peek at the first ~100 rows of the seq column to detect the alphabet.
-fn detect_csv_type(path: &str, seq_col: &ColumnSel) -> PyResult<SeqType> {
-    let mut rdr = csv::ReaderBuilder::new()
-        .flexible(true)
-        .from_path(path)
-        .map_err(|e| PyIOError::new_err(e.to_string()))?;
-
-    let headers = rdr
-        .headers()
-        .map_err(|e| PyIOError::new_err(e.to_string()))?;
-    if headers.is_empty() {
-        return Err(PyValueError::new_err("CSV file is empty"));
-    }
-
-    let seq_idx = match seq_col {
-        ColumnSel::Name(name) => headers
-            .iter()
-            .position(|h| h.trim() == name)
-            .ok_or_else(|| PyValueError::new_err(format!("column '{name}' not found")))?,
-        ColumnSel::Index(idx) => *idx,
-    };
-
-    let mut sample = Vec::new();
-    for result in rdr.records().take(100) {
-        let record = result.map_err(|e| PyIOError::new_err(e.to_string()))?;
-        if let Some(field) = record.get(seq_idx) {
-            for b in field.bytes() {
-                if !b.is_ascii_whitespace() {
-                    sample.push(b);
-                }
-            }
-        }
-    }
-
-    Ok(detect_seq_type(&sample))
-}
-
 #[pyfunction]
 fn csv_columns(path: &str) -> PyResult<Vec<String>> {
     core_csv::csv_columns(path).map_err(map_bio_err)
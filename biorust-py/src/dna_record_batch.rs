@@ -9,6 +9,7 @@ use crate::dna_record::DNARecord;
 use crate::protein_record_batch::ProteinRecordBatch;
 use crate::report::SkippedRecord;
 use crate::utils;
+use biorust_core::par;
 use biorust_core::seq::batch::SeqBatch;
 use biorust_core::seq::dna::DnaSeq;
 use biorust_core::seq::record::SeqRecord;
@@ -136,6 +137,15 @@ impl DNARecordBatch {
         self.inner.ids().iter().map(|s| s.to_string()).collect()
     }
 
+    fn to_id_seq_pairs(&self) -> Vec<(String, String)> {
+        self.inner
+            .ids()
+            .iter()
+            .zip(self.inner.seqs().as_slice())
+            .map(|(id, seq)| (id.to_string(), seq.as_str().to_owned()))
+            .collect()
+    }
+
     #[getter]
     fn skipped(&self) -> Vec<SkippedRecord> {
         self.skipped.clone()
@@ -159,8 +169,11 @@ impl DNARecordBatch {
     #[pyo3(signature = (frame=None))]
     fn translate(&self, py: Python<'_>, frame: Option<&Bound<'_, PyAny>>) -> PyResult<PyObject> {
         let inner = match frame {
-            None => self.inner.translate(),
-            Some(f) => self.inner.translate_frame(utils::parse_frame(f)?),
+            None => py.allow_threads(|| self.inner.translate()),
+            Some(f) => {
+                let frame = utils::parse_frame(f)?;
+                py.allow_threads(|| self.inner.translate_frame(frame))
+            }
         }
         .map_err(|e| PyValueError::new_err(e.to_string()))?;
         let out = ProteinRecordBatch {
@@ -184,15 +197,26 @@ impl DNARecordBatch {
         Ok(Py::new(py, out)?.to_object(py))
     }
 
-    #[pyo3(signature = (inplace=false))]
-    fn reverse_complements(&mut self, py: Python<'_>, inplace: bool) -> PyResult<PyObject> {
+    #[pyo3(signature = (inplace=false, threads=None))]
+    fn reverse_complements(
+        &mut self,
+        py: Python<'_>,
+        inplace: bool,
+        threads: Option<usize>,
+    ) -> PyResult<PyObject> {
         if inplace {
-            self.inner.reverse_complements_in_place();
+            py.allow_threads(|| {
+                par::with_threads(threads, || self.inner.reverse_complements_in_place())
+            })
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
             return Ok(py.None());
         }
 
+        let inner = py
+            .allow_threads(|| par::with_threads(threads, || self.inner.reverse_complements()))
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
         let out = DNARecordBatch {
-            inner: self.inner.reverse_complements(),
+            inner,
             skipped: Vec::new(),
         };
         Ok(Py::new(py, out)?.to_object(py))
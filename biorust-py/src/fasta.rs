@@ -11,23 +11,21 @@ use crate::protein_record_batch::ProteinRecordBatch;
 use crate::rna_record::RNARecord;
 use crate::rna_record_batch::RNARecordBatch;
 use biorust_core::error::BioError;
-use biorust_core::io::detect::{detect_seq_type, SeqType};
+use biorust_core::io::detect::SeqType;
 use biorust_core::io::fasta;
 use biorust_core::seq::dna::DnaSeq;
 use biorust_core::seq::protein::ProteinSeq;
 use biorust_core::seq::record::SeqRecord;
 use biorust_core::seq::rna::RnaSeq;
-use std::fs::File;
-use std::io::{BufRead, BufReader};
 
 #[pyfunction]
 #[pyo3(signature = (path, *, alphabet="auto"))]
 fn read_fasta(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject> {
     let alpha = match alphabet.to_ascii_lowercase().as_str() {
-        "auto" => detect_fasta_type(path)?,
-        "dna" => SeqType::Dna,
-        "rna" => SeqType::Rna,
-        "protein" => SeqType::Protein,
+        "auto" => None,
+        "dna" => Some(SeqType::Dna),
+        "rna" => Some(SeqType::Rna),
+        "protein" => Some(SeqType::Protein),
         _ => {
             return Err(PyValueError::new_err(
                 "alphabet must be 'auto', 'dna', 'rna', or 'protein'",
@@ -35,11 +33,16 @@ fn read_fasta(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
     };
 
-    let path = path.to_owned();
+    // Read the file once; detection and parsing both work on this buffer.
+    let data = py
+        .allow_threads(|| std::fs::read(path))
+        .map_err(|e| PyIOError::new_err(e.to_string()))?;
+    let alpha = alpha.unwrap_or_else(|| fasta::detect_fasta_type(&data));
+
     match alpha {
         SeqType::Dna => {
             let batch = py
-                .allow_threads(|| fasta::read_fasta_batch_from_path::<DnaSeq>(&path))
+                .allow_threads(|| fasta::read_fasta_batch_from_bytes::<DnaSeq>(&data))
                 .map_err(map_bio_err)?;
             let out = DNARecordBatch {
                 inner: batch,
@@ -49,7 +52,7 @@ fn read_fasta(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
         SeqType::Rna => {
             let batch = py
-                .allow_threads(|| fasta::read_fasta_batch_from_path::<RnaSeq>(&path))
+                .allow_threads(|| fasta::read_fasta_batch_from_bytes::<RnaSeq>(&data))
                 .map_err(map_bio_err)?;
             let out = RNARecordBatch {
                 inner: batch,
@@ -59,7 +62,7 @@ fn read_fasta(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
         SeqType::Protein => {
             let batch = py
-                .allow_threads(|| fasta::read_fasta_batch_from_path::<ProteinSeq>(&path))
+                .allow_threads(|| fasta::read_fasta_batch_from_bytes::<ProteinSeq>(&data))
                 .map_err(map_bio_err)?;
             let out = ProteinRecordBatch {
                 inner: batch,
@@ -70,37 +73,6 @@ fn read_fasta(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
     }
 }
 
-/// Peek at the first FASTA record's sequence bytes to detect the alphabet.
-fn detect_fasta_type(path: &str) -> PyResult<SeqType> {
-    let file = File::open(path).map_err(|e| PyIOError::new_err(e.to_string()))?;
-    let reader = BufReader::new(file);
-    let mut seq_bytes = Vec::new();
-    let mut in_seq = false;
-
-    for line in reader.lines() {
-        let line = line.map_err(|e| PyIOError::new_err(e.to_string()))?;
-        if line.starts_with('>') {
-            if in_seq {
-                break; // done with first record
-            }
-            in_seq = true;
-            continue;
-        }
-        if in_seq {
-            for b in line.bytes() {
-                if !b.is_ascii_whitespace() {
-                    seq_bytes.push(b);
-                }
-            }
-            if seq_bytes.len() >= 1000 {
-                break;
-            }
-        }
-    }
-
-    Ok(detect_seq_type(&seq_bytes))
-}
-
 #[pyfunction]
 #[pyo3(signature = (path, records, *, line_width=60))]
 fn write_fasta(path: &str, records: &Bound<'_, PyAny>, line_width: usize) -> PyResult<()> {
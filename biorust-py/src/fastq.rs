@@ -11,23 +11,21 @@ use crate::protein_record_batch::ProteinRecordBatch;
 use crate::rna_record::RNARecord;
 use crate::rna_record_batch::RNARecordBatch;
 use biorust_core::error::BioError;
-use biorust_core::io::detect::{detect_seq_type, SeqType};
+use biorust_core::io::detect::SeqType;
 use biorust_core::io::fastq as core_fastq;
 use biorust_core::seq::dna::DnaSeq;
 use biorust_core::seq::protein::ProteinSeq;
 use biorust_core::seq::record::SeqRecord;
 use biorust_core::seq::rna::RnaSeq;
-use std::fs::File;
-use std::io::{BufRead, BufReader};
 
 #[pyfunction]
 #[pyo3(signature = (path, *, alphabet="auto"))]
 fn read_fastq(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject> {
     let alpha = match alphabet.to_ascii_lowercase().as_str() {
-        "auto" => detect_fastq_type(path)?,
-        "dna" => SeqType::Dna,
-        "rna" => SeqType::Rna,
-        "protein" => SeqType::Protein,
+        "auto" => None,
+        "dna" => Some(SeqType::Dna),
+        "rna" => Some(SeqType::Rna),
+        "protein" => Some(SeqType::Protein),
         _ => {
             return Err(PyValueError::new_err(
                 "alphabet must be 'auto', 'dna', 'rna', or 'protein'",
@@ -35,11 +33,19 @@ fn read_fastq(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
     };
 
-    let path = path.to_owned();
+    // Detection only looks at the start of the file; parsing then streams
+    // the whole file without holding a second copy of it.
+    let alpha = match alpha {
+        Some(alpha) => alpha,
+        None => py
+            .allow_threads(|| core_fastq::detect_fastq_type_from_path(path))
+            .map_err(map_bio_err)?,
+    };
+
     match alpha {
         SeqType::Dna => {
             let batch = py
-                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<DnaSeq>(&path))
+                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<DnaSeq>(path))
                 .map_err(map_bio_err)?;
             let out = DNARecordBatch {
                 inner: batch,
@@ -49,7 +55,7 @@ fn read_fastq(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
         SeqType::Rna => {
             let batch = py
-                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<RnaSeq>(&path))
+                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<RnaSeq>(path))
                 .map_err(map_bio_err)?;
             let out = RNARecordBatch {
                 inner: batch,
@@ -59,7 +65,7 @@ fn read_fastq(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
         }
         SeqType::Protein => {
             let batch = py
-                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<ProteinSeq>(&path))
+                .allow_threads(|| core_fastq::read_fastq_batch_from_path::<ProteinSeq>(path))
                 .map_err(map_bio_err)?;
             let out = ProteinRecordBatch {
                 inner: batch,
@@ -70,44 +76,6 @@ fn read_fastq(py: Python<'_>, path: &str, alphabet: &str) -> PyResult<PyObject>
     }
 }
 
-/// Peek at the first FASTQ record's sequence bytes to detect the alphabet.
-fn detect_fastq_type(path: &str) -> PyResult<SeqType> {
-    let file = File::open(path).map_err(|e| PyIOError::new_err(e.to_string()))?;
-    let mut lines = BufReader::new(file).lines();
-
-    loop {
-        let line = match lines.next() {
-            Some(Ok(line)) => line,
-            Some(Err(err)) => return Err(PyIOError::new_err(err.to_string())),
-            None => return Ok(SeqType::Dna),
-        };
-
-        if line.trim().is_empty() {
-            continue;
-        }
-        if !line.starts_with('@') {
-            return Err(PyValueError::new_err(
-                "invalid FASTQ: expected header line starting with '@'",
-            ));
-        }
-
-        let seq_line = match lines.next() {
-            Some(Ok(line)) => line,
-            Some(Err(err)) => return Err(PyIOError::new_err(err.to_string())),
-            None => {
-                return Err(PyValueError::new_err(
-                    "invalid FASTQ: missing sequence line",
-                ))
-            }
-        };
-        let sample = seq_line
-            .bytes()
-            .filter(|b| !b.is_ascii_whitespace())
-            .collect::<Vec<u8>>();
-        return Ok(detect_seq_type(&sample));
-    }
-}
-
 #[pyfunction]
 #[pyo3(signature = (path, records, *, quality_char="I"))]
 fn write_fastq(path: &str, records: &Bound<'_, PyAny>, quality_char: &str) -> PyResult<()> {
@@ -1,10 +1,13 @@
 use pyo3::basic::CompareOp;
+use pyo3::ffi;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyModule, PyString};
 
 use crate::dna::DNA;
 use crate::seq_shared;
+use crate::utils;
 use biorust_core::seq::gapped_dna::GappedDnaSeq;
+use std::os::raw::c_int;
 
 #[allow(clippy::upper_case_acronyms)]
 #[pyclass(frozen)]
@@ -17,15 +20,9 @@ pub struct GappedDNA {
 impl GappedDNA {
     #[new]
     fn new(seq: &Bound<'_, PyAny>) -> PyResult<Self> {
-        let bytes: Vec<u8> = if let Ok(s) = seq.downcast::<PyString>() {
-            s.to_str()?.as_bytes().to_vec()
-        } else {
-            seq.extract::<Vec<u8>>().map_err(|_| {
-                pyo3::exceptions::PyValueError::new_err(
-                    "GappedDNA() expects str or bytes-like input",
-                )
-            })?
-        };
+        let bytes = utils::extract_seq_bytes(seq)?.ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err("GappedDNA() expects str or bytes-like input")
+        })?;
 
         let inner = GappedDnaSeq::new(bytes)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
@@ -67,12 +64,22 @@ impl GappedDNA {
         seq_shared::seq_to_bytes(py, self.as_bytes())
     }
 
-    fn __str__(&self) -> PyResult<String> {
-        seq_shared::seq_str(self.as_bytes())
+    /// Read-only buffer over the sequence, so `memoryview(seq)` and buffer
+    /// consumers such as `hashlib` read it without a copy.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        seq_shared::fill_readonly_buffer(slf.as_any(), slf.get().as_bytes(), view, flags)
+    }
+
+    fn __str__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        Ok(seq_shared::seq_pystr(py, self.inner.as_str()))
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        Ok(seq_shared::seq_repr(self.as_bytes(), "GappedDNA"))
+        Ok(seq_shared::seq_repr(self.inner.as_str(), "GappedDNA"))
     }
 
     fn __hash__(&self) -> u64 {
@@ -83,17 +90,26 @@ impl GappedDNA {
     }
 
     fn __getitem__<'py>(&self, py: Python<'py>, index: &Bound<'py, PyAny>) -> PyResult<PyObject> {
-        let make = |out: Vec<u8>| -> PyResult<PyObject> {
-            let inner = GappedDnaSeq::new(out)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+        seq_shared::seq_getitem(&self.inner, index, |inner| {
             Ok(Py::new(py, GappedDNA { inner })?.to_object(py))
-        };
-
-        seq_shared::seq_getitem(self.as_bytes(), index, make)
+        })
     }
 }
 
+/// Build many `GappedDNA` values in one call (used to assemble MSA output).
+#[pyfunction]
+fn gapped_dna_batch(seqs: Vec<String>) -> PyResult<Vec<GappedDNA>> {
+    seqs.into_iter()
+        .map(|seq| {
+            GappedDnaSeq::new(seq.into_bytes())
+                .map(|inner| GappedDNA { inner })
+                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+        })
+        .collect()
+}
+
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<GappedDNA>()?;
+    m.add_function(wrap_pyfunction!(gapped_dna_batch, m)?)?;
     Ok(())
 }
@@ -1,10 +1,13 @@
 use pyo3::basic::CompareOp;
+use pyo3::ffi;
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyModule, PyString};
 
 use crate::protein::Protein;
 use crate::seq_shared;
+use crate::utils;
 use biorust_core::seq::gapped_protein::GappedProteinSeq;
+use std::os::raw::c_int;
 
 #[pyclass(frozen)]
 #[derive(Clone)]
@@ -16,15 +19,11 @@ pub struct GappedProtein {
 impl GappedProtein {
     #[new]
     fn new(seq: &Bound<'_, PyAny>) -> PyResult<Self> {
-        let bytes: Vec<u8> = if let Ok(s) = seq.downcast::<PyString>() {
-            s.to_str()?.as_bytes().to_vec()
-        } else {
-            seq.extract::<Vec<u8>>().map_err(|_| {
-                pyo3::exceptions::PyValueError::new_err(
-                    "GappedProtein() expects str or bytes-like input",
-                )
-            })?
-        };
+        let bytes = utils::extract_seq_bytes(seq)?.ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err(
+                "GappedProtein() expects str or bytes-like input",
+            )
+        })?;
 
         let inner = GappedProteinSeq::new(bytes)
             .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
@@ -32,9 +31,7 @@ impl GappedProtein {
     }
 
     fn ungapped(&self) -> Protein {
-        Protein {
-            inner: self.inner.ungapped(),
-        }
+        Protein::from(self.inner.ungapped())
     }
 
     #[inline]
@@ -66,12 +63,22 @@ impl GappedProtein {
         seq_shared::seq_to_bytes(py, self.as_bytes())
     }
 
-    fn __str__(&self) -> PyResult<String> {
-        seq_shared::seq_str(self.as_bytes())
+    /// Read-only buffer over the sequence, so `memoryview(seq)` and buffer
+    /// consumers such as `hashlib` read it without a copy.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        seq_shared::fill_readonly_buffer(slf.as_any(), slf.get().as_bytes(), view, flags)
+    }
+
+    fn __str__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        Ok(seq_shared::seq_pystr(py, self.inner.as_str()))
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        Ok(seq_shared::seq_repr(self.as_bytes(), "GappedProtein"))
+        Ok(seq_shared::seq_repr(self.inner.as_str(), "GappedProtein"))
     }
 
     fn __hash__(&self) -> u64 {
@@ -82,17 +89,26 @@ impl GappedProtein {
     }
 
     fn __getitem__<'py>(&self, py: Python<'py>, index: &Bound<'py, PyAny>) -> PyResult<PyObject> {
-        let make = |out: Vec<u8>| -> PyResult<PyObject> {
-            let inner = GappedProteinSeq::new(out)
-                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
+        seq_shared::seq_getitem(&self.inner, index, |inner| {
             Ok(Py::new(py, GappedProtein { inner })?.to_object(py))
-        };
-
-        seq_shared::seq_getitem(self.as_bytes(), index, make)
+        })
     }
 }
 
+/// Build many `GappedProtein` values in one call (used to assemble MSA output).
+#[pyfunction]
+fn gapped_protein_batch(seqs: Vec<String>) -> PyResult<Vec<GappedProtein>> {
+    seqs.into_iter()
+        .map(|seq| {
+            GappedProteinSeq::new(seq.into_bytes())
+                .map(|inner| GappedProtein { inner })
+                .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))
+        })
+        .collect()
+}
+
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<GappedProtein>()?;
+    m.add_function(wrap_pyfunction!(gapped_protein_batch, m)?)?;
     Ok(())
 }
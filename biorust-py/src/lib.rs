@@ -25,6 +25,8 @@ mod utils;
 
 #[pymodule]
 fn _native(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
+    biorust_core::par::init_global_pool_from_env()
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
     dna::register(m)?;
     dna_record::register(m)?;
     dna_record_batch::register(m)?;
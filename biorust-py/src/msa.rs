@@ -4,13 +4,19 @@ use pyo3::types::{PyList, PyModule, PySlice, PyTuple};
 
 use crate::gapped_dna::GappedDNA;
 use crate::gapped_protein::GappedProtein;
+use biorust_core::seq::bytes;
 use biorust_core::seq::gapped_dna::GappedDnaSeq;
 use biorust_core::seq::gapped_protein::GappedProteinSeq;
 use biorust_core::seq::traits::SeqBytes;
 
-#[inline]
-fn is_gap(b: u8) -> bool {
-    b == b'-' || b == b'.'
+/// `*` under each column holding one non-gap symbol (ignoring case) in
+/// every row, ` ` elsewhere. A one-row alignment is `*` throughout.
+fn conservation_line<S: SeqBytes>(seqs: &[S]) -> String {
+    let rows: Vec<&[u8]> = seqs.iter().map(|s| s.as_bytes()).collect();
+    bytes::conserved_columns(&rows)
+        .into_iter()
+        .map(|conserved| if conserved { '*' } else { ' ' })
+        .collect()
 }
 
 #[allow(clippy::upper_case_acronyms)]
@@ -74,6 +80,8 @@ impl AlignmentDNA {
             }
         }
 
+        // Rows live back to back in one buffer; the sequences are views of it.
+        let seqs = GappedDnaSeq::pack_rows(&seqs);
         Ok(Self { ids, seqs, width })
     }
 
@@ -153,14 +161,7 @@ impl AlignmentDNA {
 
     /// Return all aligned sequences as a list of strings.
     fn aligned_strings(&self) -> Vec<String> {
-        self.seqs
-            .iter()
-            .map(|s| {
-                std::str::from_utf8(s.as_bytes())
-                    .unwrap_or("<bytes>")
-                    .to_string()
-            })
-            .collect()
+        self.seqs.iter().map(|s| s.as_str().to_owned()).collect()
     }
 
     /// Build a Clustal-style alignment diagram.
@@ -175,20 +176,12 @@ impl AlignmentDNA {
         let mut lines = Vec::with_capacity(self.ids.len() + 1);
 
         for (id, seq) in self.ids.iter().zip(&self.seqs) {
-            let s = std::str::from_utf8(seq.as_bytes()).unwrap_or("<bytes>");
-            lines.push(format!("{:>pad$}  {}", id, s, pad = pad));
+            lines.push(format!("{:>pad$}  {}", id, seq.as_str(), pad = pad));
         }
 
         // Conservation line: '*' if all bases in column are identical
         // (case-insensitive), ' ' otherwise.
-        let mut conservation = String::with_capacity(self.width);
-        for col in 0..self.width {
-            let first = self.seqs[0].as_bytes()[col].to_ascii_uppercase();
-            let conserved = self.seqs[1..]
-                .iter()
-                .all(|s| s.as_bytes()[col].to_ascii_uppercase() == first && !is_gap(first));
-            conservation.push(if conserved { '*' } else { ' ' });
-        }
+        let conservation = conservation_line(&self.seqs);
         lines.push(format!("{:>pad$}  {}", "", conservation, pad = pad));
 
         lines.join("\n")
@@ -265,6 +258,8 @@ impl AlignmentProtein {
             }
         }
 
+        // Rows live back to back in one buffer; the sequences are views of it.
+        let seqs = GappedProteinSeq::pack_rows(&seqs);
         Ok(Self { ids, seqs, width })
     }
 
@@ -343,14 +338,7 @@ impl AlignmentProtein {
     }
 
     fn aligned_strings(&self) -> Vec<String> {
-        self.seqs
-            .iter()
-            .map(|s| {
-                std::str::from_utf8(s.as_bytes())
-                    .unwrap_or("<bytes>")
-                    .to_string()
-            })
-            .collect()
+        self.seqs.iter().map(|s| s.as_str().to_owned()).collect()
     }
 
     fn alignment_diagram(&self) -> String {
@@ -361,18 +349,10 @@ impl AlignmentProtein {
         let mut lines = Vec::with_capacity(self.ids.len() + 1);
 
         for (id, seq) in self.ids.iter().zip(&self.seqs) {
-            let s = std::str::from_utf8(seq.as_bytes()).unwrap_or("<bytes>");
-            lines.push(format!("{:>pad$}  {}", id, s, pad = pad));
+            lines.push(format!("{:>pad$}  {}", id, seq.as_str(), pad = pad));
         }
 
-        let mut conservation = String::with_capacity(self.width);
-        for col in 0..self.width {
-            let first = self.seqs[0].as_bytes()[col].to_ascii_uppercase();
-            let conserved = self.seqs[1..]
-                .iter()
-                .all(|s| s.as_bytes()[col].to_ascii_uppercase() == first && !is_gap(first));
-            conservation.push(if conserved { '*' } else { ' ' });
-        }
+        let conservation = conservation_line(&self.seqs);
         lines.push(format!("{:>pad$}  {}", "", conservation, pad = pad));
 
         lines.join("\n")
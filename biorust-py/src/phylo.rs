@@ -36,13 +36,17 @@ impl PyDistanceMatrix {
     }
 
     fn to_list(&self) -> Vec<f64> {
-        self.inner.data().to_vec()
+        self.inner.data()
     }
 
     fn to_list_of_lists(&self) -> Vec<Vec<f64>> {
         let n = self.inner.n();
         (0..n)
-            .map(|i| (0..n).map(|j| self.inner.get(i, j)).collect())
+            .map(|i| {
+                let mut row = Vec::with_capacity(n);
+                self.inner.extend_row(i, &mut row);
+                row
+            })
             .collect()
     }
 
@@ -2,33 +2,55 @@
 
 use pyo3::basic::CompareOp;
 use pyo3::exceptions::{PyOverflowError, PyValueError};
+use pyo3::ffi;
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyModule, PyString, PyTuple};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyModule, PyString};
+use std::os::raw::c_int;
+use std::sync::OnceLock;
 
 use crate::seq_shared;
 use crate::utils::{self, PyProteinNeedle};
-use biorust_core::seq::protein::ProteinSeq;
+use biorust_core::seq::protein::{ProteinSeq, ResidueCounts};
+use biorust_core::seq::traits::SeqBytes;
 
 #[allow(clippy::upper_case_acronyms)]
 #[pyclass(frozen)]
 #[derive(Clone)]
 pub struct Protein {
     pub(crate) inner: ProteinSeq,
+    /// Residue histogram behind every composition method, counted on first
+    /// use. Boxed so proteins that never ask stay small.
+    residue_counts: OnceLock<Box<ResidueCounts>>,
 }
 
+impl Protein {
+    fn residue_counts(&self) -> &ResidueCounts {
+        self.residue_counts
+            .get_or_init(|| Box::new(ResidueCounts::of(&self.inner)))
+    }
+}
+
+impl From<ProteinSeq> for Protein {
+    fn from(inner: ProteinSeq) -> Self {
+        Self {
+            inner,
+            residue_counts: OnceLock::new(),
+        }
+    }
+}
+
+static RESIDUES: seq_shared::ResidueCache<Protein> = [const { GILOnceCell::new() }; 256];
+
 #[pymethods]
 impl Protein {
     #[new]
     fn new(seq: &Bound<'_, PyAny>) -> PyResult<Self> {
-        let bytes: Vec<u8> = if let Ok(s) = seq.downcast::<PyString>() {
-            s.to_str()?.as_bytes().to_vec()
-        } else {
-            seq.extract::<Vec<u8>>()
-                .map_err(|_| PyValueError::new_err("Protein() expects str or bytes-like input"))?
-        };
+        let bytes = utils::extract_seq_bytes(seq)?
+            .ok_or_else(|| PyValueError::new_err("Protein() expects str or bytes-like input"))?;
 
         let inner = ProteinSeq::new(bytes).map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner })
+        Ok(Self::from(inner))
     }
 
     #[inline]
@@ -60,12 +82,22 @@ impl Protein {
         seq_shared::seq_to_bytes(py, self.as_bytes())
     }
 
-    fn __str__(&self) -> PyResult<String> {
-        seq_shared::seq_str(self.as_bytes())
+    /// Read-only buffer over the sequence, so `memoryview(seq)` and buffer
+    /// consumers such as `hashlib` read it without a copy.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        seq_shared::fill_readonly_buffer(slf.as_any(), slf.get().as_bytes(), view, flags)
+    }
+
+    fn __str__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        Ok(seq_shared::seq_pystr(py, self.inner.as_str()))
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        Ok(seq_shared::seq_repr(self.as_bytes(), "Protein"))
+        Ok(seq_shared::seq_repr(self.inner.as_str(), "Protein"))
     }
 
     fn __hash__(&self) -> u64 {
@@ -84,22 +116,18 @@ impl Protein {
     }
 
     fn __getitem__<'py>(&self, py: Python<'py>, index: &Bound<'py, PyAny>) -> PyResult<PyObject> {
-        let make = |out: Vec<u8>| -> PyResult<PyObject> {
-            let inner = ProteinSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Ok(Py::new(py, Protein { inner })?.to_object(py))
-        };
-
-        seq_shared::seq_getitem(self.as_bytes(), index, make)
+        seq_shared::seq_getitem(&self.inner, index, |inner| {
+            seq_shared::seq_object(py, &RESIDUES, inner, Protein::from)
+        })
     }
 
     fn __add__(&self, other: PyRef<'_, Protein>) -> PyResult<Self> {
-        let inner = concat_protein_bytes(self.as_bytes(), other.as_bytes())?;
-        Ok(Self { inner })
+        Ok(Self::from(ProteinSeq::concat([&self.inner, &other.inner])))
     }
 
     fn __mul__(&self, num: isize) -> PyResult<Self> {
-        let inner = repeat_protein_bytes(self.as_bytes(), num)?;
-        Ok(Self { inner })
+        let inner = repeat_protein(&self.inner, num)?;
+        Ok(Self::from(inner))
     }
 
     fn __rmul__(&self, num: isize) -> PyResult<Self> {
@@ -150,23 +178,13 @@ impl Protein {
         end: Option<isize>,
     ) -> PyResult<bool> {
         let window = seq_shared::startswith_window(self.as_bytes(), start, end);
-        let matches = |needle: PyProteinNeedle<'_>| -> bool {
-            let needle = protein_needle_bytes(&needle);
-            seq_shared::needle_starts_with(window, needle)
-        };
-
-        if let Ok(tuple) = prefix.downcast::<PyTuple>() {
-            for item in tuple.iter() {
-                let needle = utils::extract_protein_needle(&item)?;
-                if matches(needle) {
-                    return Ok(true);
-                }
-            }
-            return Ok(false);
-        }
-
-        let needle = utils::extract_protein_needle(prefix)?;
-        Ok(matches(needle))
+        seq_shared::affix_matches(window, prefix, false, |item| {
+            let needle = utils::extract_protein_needle(item)?;
+            Ok(seq_shared::needle_starts_with(
+                window,
+                protein_needle_bytes(&needle),
+            ))
+        })
     }
 
     #[pyo3(signature = (suffix, start=None, end=None))]
@@ -177,23 +195,13 @@ impl Protein {
         end: Option<isize>,
     ) -> PyResult<bool> {
         let window = seq_shared::startswith_window(self.as_bytes(), start, end);
-        let matches = |needle: PyProteinNeedle<'_>| -> bool {
-            let needle = protein_needle_bytes(&needle);
-            seq_shared::needle_ends_with(window, needle)
-        };
-
-        if let Ok(tuple) = suffix.downcast::<PyTuple>() {
-            for item in tuple.iter() {
-                let needle = utils::extract_protein_needle(&item)?;
-                if matches(needle) {
-                    return Ok(true);
-                }
-            }
-            return Ok(false);
-        }
-
-        let needle = utils::extract_protein_needle(suffix)?;
-        Ok(matches(needle))
+        seq_shared::affix_matches(window, suffix, true, |item| {
+            let needle = utils::extract_protein_needle(item)?;
+            Ok(seq_shared::needle_ends_with(
+                window,
+                protein_needle_bytes(&needle),
+            ))
+        })
     }
 
     #[pyo3(signature = (sep=None, maxsplit=-1))]
@@ -214,7 +222,7 @@ impl Protein {
 
         seq_shared::list_from_parts(parts, |part| {
             let inner = ProteinSeq::new(part).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Py::new(py, Protein { inner })
+            Py::new(py, Protein::from(inner))
         })
     }
 
@@ -236,7 +244,7 @@ impl Protein {
 
         seq_shared::list_from_parts(parts, |part| {
             let inner = ProteinSeq::new(part).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Py::new(py, Protein { inner })
+            Py::new(py, Protein::from(inner))
         })
     }
 
@@ -251,7 +259,7 @@ impl Protein {
         let (start, end) = seq_shared::trim_range(bytes, needle, true, true)?;
         let inner = ProteinSeq::new(bytes[start..end].to_vec())
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner })
+        Ok(Self::from(inner))
     }
 
     #[pyo3(signature = (chars=None))]
@@ -265,7 +273,7 @@ impl Protein {
         let (start, end) = seq_shared::trim_range(bytes, needle, true, false)?;
         let inner = ProteinSeq::new(bytes[start..end].to_vec())
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner })
+        Ok(Self::from(inner))
     }
 
     #[pyo3(signature = (chars=None))]
@@ -279,13 +287,13 @@ impl Protein {
         let (start, end) = seq_shared::trim_range(bytes, needle, false, true)?;
         let inner = ProteinSeq::new(bytes[start..end].to_vec())
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner })
+        Ok(Self::from(inner))
     }
 
     fn upper(&self) -> PyResult<Self> {
         let make = |out: Vec<u8>| -> PyResult<Self> {
             let inner = ProteinSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Ok(Self { inner })
+            Ok(Self::from(inner))
         };
         seq_shared::seq_upper(self.as_bytes(), make)
     }
@@ -293,7 +301,7 @@ impl Protein {
     fn lower(&self) -> PyResult<Self> {
         let make = |out: Vec<u8>| -> PyResult<Self> {
             let inner = ProteinSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Ok(Self { inner })
+            Ok(Self::from(inner))
         };
         seq_shared::seq_lower(self.as_bytes(), make)
     }
@@ -387,62 +395,27 @@ impl Protein {
     }
 
     fn reverse(&self) -> Self {
-        Self {
-            inner: self.inner.reverse(),
-        }
+        Self::from(self.inner.reverse())
+    }
+
+    fn counts(&self) -> Vec<(char, u32)> {
+        residue_count_pairs(self.residue_counts())
+    }
+
+    fn frequencies(&self) -> Vec<(char, f64)> {
+        residue_freq_pairs(self.residue_counts())
+    }
+
+    fn aa_counts_20(&self) -> Vec<(char, u32)> {
+        aa20_pairs(&self.residue_counts().aa_counts_20())
     }
 
-    fn counts(&self) -> Vec<(String, u32)> {
-        let counts = self.inner.counts();
-        counts
-            .iter()
-            .enumerate()
-            .filter_map(|(b, &count)| {
-                if count == 0 {
-                    None
-                } else {
-                    Some(((b as u8 as char).to_string(), count))
-                }
-            })
-            .collect()
-    }
-
-    fn frequencies(&self) -> Vec<(String, f64)> {
-        let freq = self.inner.frequencies();
-        freq.iter()
-            .enumerate()
-            .filter_map(|(b, &val)| {
-                if val == 0.0 {
-                    None
-                } else {
-                    Some(((b as u8 as char).to_string(), val))
-                }
-            })
-            .collect()
-    }
-
-    fn aa_counts_20(&self) -> Vec<(String, u32)> {
-        let counts = self.inner.aa_counts_20();
-        let letters = b"ARNDCEQGHILKMFPSTWYV";
-        letters
-            .iter()
-            .enumerate()
-            .map(|(i, &b)| ((b as char).to_string(), counts[i]))
-            .collect()
-    }
-
-    fn aa_frequencies_20(&self) -> Vec<(String, f64)> {
-        let freq = self.inner.aa_frequencies_20();
-        let letters = b"ARNDCEQGHILKMFPSTWYV";
-        letters
-            .iter()
-            .enumerate()
-            .map(|(i, &b)| ((b as char).to_string(), freq[i]))
-            .collect()
+    fn aa_frequencies_20(&self) -> Vec<(char, f64)> {
+        aa20_pairs(&self.residue_counts().aa_frequencies_20())
     }
 
     fn shannon_entropy(&self) -> f64 {
-        self.inner.shannon_entropy()
+        self.residue_counts().shannon_entropy()
     }
 
     fn molecular_weight(&self) -> PyResult<f64> {
@@ -515,6 +488,31 @@ impl ProteinIterator {
     }
 }
 
+/// Non-zero residue counts as `(residue, count)`, sorted by residue. Python
+/// converts each `char` to a one-letter `str` directly, with no `String`.
+pub(crate) fn residue_count_pairs(counts: &ResidueCounts) -> Vec<(char, u32)> {
+    counts.iter().map(|(b, c)| (b as char, c)).collect()
+}
+
+pub(crate) fn residue_freq_pairs(counts: &ResidueCounts) -> Vec<(char, f64)> {
+    let denom = counts.len() as f64;
+    counts
+        .iter()
+        .map(|(b, c)| (b as char, c as f64 / denom))
+        .collect()
+}
+
+/// Pair each of the 20 standard amino acids with its entry in `values`.
+pub(crate) fn aa20_pairs<T: Copy>(values: &[T; 20]) -> Vec<(char, T)> {
+    AA20_LETTERS
+        .iter()
+        .zip(values)
+        .map(|(&b, &v)| (b as char, v))
+        .collect()
+}
+
+const AA20_LETTERS: &[u8; 20] = b"ARNDCEQGHILKMFPSTWYV";
+
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Protein>()?;
     m.add_class::<ProteinIterator>()?;
@@ -529,26 +527,11 @@ fn protein_needle_bytes<'a>(needle: &'a PyProteinNeedle<'a>) -> seq_shared::Need
     }
 }
 
-fn concat_protein_bytes(left: &[u8], right: &[u8]) -> PyResult<ProteinSeq> {
-    let mut out = Vec::with_capacity(left.len() + right.len());
-    out.extend_from_slice(left);
-    out.extend_from_slice(right);
-    ProteinSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))
-}
-
-fn repeat_protein_bytes(bytes: &[u8], n: isize) -> PyResult<ProteinSeq> {
-    if n <= 0 || bytes.is_empty() {
-        return ProteinSeq::new(Vec::new()).map_err(|e| PyValueError::new_err(e.to_string()));
-    }
-
-    let n = n as usize;
-    let total = bytes
+fn repeat_protein(seq: &ProteinSeq, n: isize) -> PyResult<ProteinSeq> {
+    let n = n.max(0) as usize;
+    seq.as_bytes()
         .len()
         .checked_mul(n)
         .ok_or_else(|| PyOverflowError::new_err("repeat count causes overflow"))?;
-    let mut out = Vec::with_capacity(total);
-    for _ in 0..n {
-        out.extend_from_slice(bytes);
-    }
-    ProteinSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))
+    Ok(ProteinSeq::concat(std::iter::repeat_n(seq, n)))
 }
@@ -50,9 +50,7 @@ impl ProteinRecord {
 
     #[getter]
     fn seq(&self) -> Protein {
-        Protein {
-            inner: self.inner.seq.clone(),
-        }
+        Protein::from(self.inner.seq.clone())
     }
 
     #[getter]
@@ -66,7 +64,7 @@ impl ProteinRecord {
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        let seq_repr = seq_shared::seq_repr(self.inner.seq.as_bytes(), "Protein");
+        let seq_repr = seq_shared::seq_repr(self.inner.seq.as_str(), "Protein");
         let desc = match self.inner.desc.as_deref() {
             Some(desc) => format!("{desc:?}"),
             None => "None".to_string(),
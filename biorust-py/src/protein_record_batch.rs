@@ -133,6 +133,15 @@ impl ProteinRecordBatch {
         self.inner.ids().iter().map(|s| s.to_string()).collect()
     }
 
+    fn to_id_seq_pairs(&self) -> Vec<(String, String)> {
+        self.inner
+            .ids()
+            .iter()
+            .zip(self.inner.seqs().as_slice())
+            .map(|(id, seq)| (id.to_string(), seq.as_str().to_owned()))
+            .collect()
+    }
+
     #[getter]
     fn skipped(&self) -> Vec<SkippedRecord> {
         self.skipped.clone()
@@ -148,9 +157,7 @@ impl ProteinRecordBatch {
 
     fn seqs(&self) -> ProteinBatch {
         let seqs: Vec<ProteinSeq> = self.inner.seqs().as_slice().to_vec();
-        ProteinBatch {
-            inner: SeqBatch::new(seqs),
-        }
+        ProteinBatch::from(SeqBatch::new(seqs))
     }
 
     #[pyo3(signature = (inplace=false))]
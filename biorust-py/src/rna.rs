@@ -2,14 +2,18 @@
 
 use pyo3::basic::CompareOp;
 use pyo3::exceptions::{PyOverflowError, PyValueError};
+use pyo3::ffi;
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyModule, PyString, PyTuple};
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyModule, PyString};
 
 use crate::dna::DNA;
 use crate::protein::Protein;
 use crate::seq_shared;
 use crate::utils::{self, PyRnaNeedle};
 use biorust_core::seq::rna::RnaSeq;
+use biorust_core::seq::traits::SeqBytes;
+use std::os::raw::c_int;
 
 #[allow(clippy::upper_case_acronyms)]
 #[pyclass(frozen)]
@@ -18,16 +22,14 @@ pub struct RNA {
     pub(crate) inner: RnaSeq,
 }
 
+static RESIDUES: seq_shared::ResidueCache<RNA> = [const { GILOnceCell::new() }; 256];
+
 #[pymethods]
 impl RNA {
     #[new]
     fn new(seq: &Bound<'_, PyAny>) -> PyResult<Self> {
-        let bytes: Vec<u8> = if let Ok(s) = seq.downcast::<PyString>() {
-            s.to_str()?.as_bytes().to_vec()
-        } else {
-            seq.extract::<Vec<u8>>()
-                .map_err(|_| PyValueError::new_err("RNA() expects str or bytes-like input"))?
-        };
+        let bytes = utils::extract_seq_bytes(seq)?
+            .ok_or_else(|| PyValueError::new_err("RNA() expects str or bytes-like input"))?;
 
         let inner = RnaSeq::new(bytes).map_err(|e| PyValueError::new_err(e.to_string()))?;
         Ok(Self { inner })
@@ -62,7 +64,7 @@ impl RNA {
             Some(f) => self.inner.translate_frame(utils::parse_frame(f)?),
         }
         .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Protein { inner })
+        Ok(Protein::from(inner))
     }
 
     #[inline]
@@ -94,12 +96,22 @@ impl RNA {
         seq_shared::seq_to_bytes(py, self.as_bytes())
     }
 
-    fn __str__(&self) -> PyResult<String> {
-        seq_shared::seq_str(self.as_bytes())
+    /// Read-only buffer over the sequence, so `memoryview(seq)` and buffer
+    /// consumers such as `hashlib` read it without a copy.
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        seq_shared::fill_readonly_buffer(slf.as_any(), slf.get().as_bytes(), view, flags)
+    }
+
+    fn __str__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyString>> {
+        Ok(seq_shared::seq_pystr(py, self.inner.as_str()))
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        Ok(seq_shared::seq_repr(self.as_bytes(), "RNA"))
+        Ok(seq_shared::seq_repr(self.inner.as_str(), "RNA"))
     }
 
     fn __hash__(&self) -> u64 {
@@ -118,21 +130,19 @@ impl RNA {
     }
 
     fn __getitem__<'py>(&self, py: Python<'py>, index: &Bound<'py, PyAny>) -> PyResult<PyObject> {
-        let make = |out: Vec<u8>| -> PyResult<PyObject> {
-            let inner = RnaSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))?;
-            Ok(Py::new(py, RNA { inner })?.to_object(py))
-        };
-
-        seq_shared::seq_getitem(self.as_bytes(), index, make)
+        seq_shared::seq_getitem(&self.inner, index, |inner| {
+            seq_shared::seq_object(py, &RESIDUES, inner, |inner| RNA { inner })
+        })
     }
 
     fn __add__(&self, other: PyRef<'_, RNA>) -> PyResult<Self> {
-        let inner = concat_rna_bytes(self.as_bytes(), other.as_bytes())?;
-        Ok(Self { inner })
+        Ok(Self {
+            inner: RnaSeq::concat([&self.inner, &other.inner]),
+        })
     }
 
     fn __mul__(&self, num: isize) -> PyResult<Self> {
-        let inner = repeat_rna_bytes(self.as_bytes(), num)?;
+        let inner = repeat_rna(&self.inner, num)?;
         Ok(Self { inner })
     }
 
@@ -184,23 +194,13 @@ impl RNA {
         end: Option<isize>,
     ) -> PyResult<bool> {
         let window = seq_shared::startswith_window(self.as_bytes(), start, end);
-        let matches = |needle: PyRnaNeedle<'_>| -> bool {
-            let needle = rna_needle_bytes(&needle);
-            seq_shared::needle_starts_with(window, needle)
-        };
-
-        if let Ok(tuple) = prefix.downcast::<PyTuple>() {
-            for item in tuple.iter() {
-                let needle = utils::extract_rna_needle(&item)?;
-                if matches(needle) {
-                    return Ok(true);
-                }
-            }
-            return Ok(false);
-        }
-
-        let needle = utils::extract_rna_needle(prefix)?;
-        Ok(matches(needle))
+        seq_shared::affix_matches(window, prefix, false, |item| {
+            let needle = utils::extract_rna_needle(item)?;
+            Ok(seq_shared::needle_starts_with(
+                window,
+                rna_needle_bytes(&needle),
+            ))
+        })
     }
 
     #[pyo3(signature = (suffix, start=None, end=None))]
@@ -211,23 +211,13 @@ impl RNA {
         end: Option<isize>,
     ) -> PyResult<bool> {
         let window = seq_shared::startswith_window(self.as_bytes(), start, end);
-        let matches = |needle: PyRnaNeedle<'_>| -> bool {
-            let needle = rna_needle_bytes(&needle);
-            seq_shared::needle_ends_with(window, needle)
-        };
-
-        if let Ok(tuple) = suffix.downcast::<PyTuple>() {
-            for item in tuple.iter() {
-                let needle = utils::extract_rna_needle(&item)?;
-                if matches(needle) {
-                    return Ok(true);
-                }
-            }
-            return Ok(false);
-        }
-
-        let needle = utils::extract_rna_needle(suffix)?;
-        Ok(matches(needle))
+        seq_shared::affix_matches(window, suffix, true, |item| {
+            let needle = utils::extract_rna_needle(item)?;
+            Ok(seq_shared::needle_ends_with(
+                window,
+                rna_needle_bytes(&needle),
+            ))
+        })
     }
 
     #[pyo3(signature = (sep=None, maxsplit=-1))]
@@ -460,26 +450,11 @@ fn rna_needle_bytes<'a>(needle: &'a PyRnaNeedle<'a>) -> seq_shared::NeedleBytes<
     }
 }
 
-fn concat_rna_bytes(left: &[u8], right: &[u8]) -> PyResult<RnaSeq> {
-    let mut out = Vec::with_capacity(left.len() + right.len());
-    out.extend_from_slice(left);
-    out.extend_from_slice(right);
-    RnaSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))
-}
-
-fn repeat_rna_bytes(bytes: &[u8], n: isize) -> PyResult<RnaSeq> {
-    if n <= 0 || bytes.is_empty() {
-        return RnaSeq::new(Vec::new()).map_err(|e| PyValueError::new_err(e.to_string()));
-    }
-
-    let n = n as usize;
-    let total = bytes
+fn repeat_rna(seq: &RnaSeq, n: isize) -> PyResult<RnaSeq> {
+    let n = n.max(0) as usize;
+    seq.as_bytes()
         .len()
         .checked_mul(n)
         .ok_or_else(|| PyOverflowError::new_err("repeat count causes overflow"))?;
-    let mut out = Vec::with_capacity(total);
-    for _ in 0..n {
-        out.extend_from_slice(bytes);
-    }
-    RnaSeq::new(out).map_err(|e| PyValueError::new_err(e.to_string()))
+    Ok(RnaSeq::concat(std::iter::repeat_n(seq, n)))
 }
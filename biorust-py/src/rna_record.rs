@@ -67,7 +67,7 @@ impl RNARecord {
     }
 
     fn __repr__(&self) -> PyResult<String> {
-        let seq_repr = seq_shared::seq_repr(self.inner.seq.as_bytes(), "RNA");
+        let seq_repr = seq_shared::seq_repr(self.inner.seq.as_str(), "RNA");
         let desc = match self.inner.desc.as_deref() {
             Some(desc) => format!("{desc:?}"),
             None => "None".to_string(),
@@ -159,8 +159,11 @@ impl RNARecordBatch {
     #[pyo3(signature = (frame=None))]
     fn translate(&self, py: Python<'_>, frame: Option<&Bound<'_, PyAny>>) -> PyResult<PyObject> {
         let inner = match frame {
-            None => self.inner.translate(),
-            Some(f) => self.inner.translate_frame(utils::parse_frame(f)?),
+            None => py.allow_threads(|| self.inner.translate()),
+            Some(f) => {
+                let frame = utils::parse_frame(f)?;
+                py.allow_threads(|| self.inner.translate_frame(frame))
+            }
         }
         .map_err(|e| PyValueError::new_err(e.to_string()))?;
         let out = ProteinRecordBatch {
@@ -1,64 +1,120 @@
 use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
+use pyo3::ffi;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyBytes, PySlice};
+use pyo3::pyclass_init::PyClassInitializer;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyAny, PyBytes, PySlice, PyString, PyTuple};
 use pyo3::PyClass;
+use std::os::raw::{c_int, c_void};
 
 use crate::utils::normalize_range;
+use biorust_core::seq::traits::SeqBytes;
+
+/// Fill `view` with a read-only buffer over `bytes`, kept alive by `owner`.
+/// Backs `__getbuffer__` on the sequence classes: they are frozen, so the
+/// bytes never move or change while a `memoryview` of them is open.
+///
+/// # Safety
+///
+/// `view` must be the pointer handed to `__getbuffer__`, and `bytes` must be
+/// owned by `owner`.
+pub unsafe fn fill_readonly_buffer(
+    owner: &Bound<'_, PyAny>,
+    bytes: &[u8],
+    view: *mut ffi::Py_buffer,
+    flags: c_int,
+) -> PyResult<()> {
+    let ret = ffi::PyBuffer_FillInfo(
+        view,
+        owner.as_ptr(),
+        bytes.as_ptr() as *mut c_void,
+        bytes.len() as ffi::Py_ssize_t,
+        1,
+        flags,
+    );
+    if ret == -1 {
+        return Err(PyErr::fetch(owner.py()));
+    }
+    Ok(())
+}
 
 pub fn seq_to_bytes<'py>(py: Python<'py>, bytes: &[u8]) -> Bound<'py, PyBytes> {
     PyBytes::new_bound(py, bytes)
 }
 
-pub fn seq_str(bytes: &[u8]) -> PyResult<String> {
-    std::str::from_utf8(bytes)
-        .map(|s| s.to_string())
-        .map_err(|e| PyValueError::new_err(e.to_string()))
+/// `str(seq)`, copied straight into a Python string with no intermediate
+/// Rust `String`.
+pub fn seq_pystr<'py>(py: Python<'py>, seq: &str) -> Bound<'py, PyString> {
+    PyString::new_bound(py, seq)
 }
 
-pub fn seq_repr(bytes: &[u8], name: &str) -> String {
-    let s = std::str::from_utf8(bytes).unwrap_or("<bytes>");
-    format!("{name}({s:?})")
+pub fn seq_repr(s: &str, name: &str) -> String {
+    // Sequence alphabets never need escaping, so quote directly into a buffer
+    // of the final size; anything else goes through `{:?}`.
+    if !s
+        .bytes()
+        .all(|b| b.is_ascii_graphic() && b != b'"' && b != b'\\')
+    {
+        return format!("{name}({s:?})");
+    }
+    let mut out = String::with_capacity(name.len() + s.len() + 4);
+    out.push_str(name);
+    out.push_str("(\"");
+    out.push_str(s);
+    out.push_str("\")");
+    out
 }
 
-pub fn seq_getitem<F>(bytes: &[u8], index: &Bound<'_, PyAny>, make: F) -> PyResult<PyObject>
+pub fn seq_getitem<S, F>(seq: &S, index: &Bound<'_, PyAny>, make: F) -> PyResult<PyObject>
 where
-    F: Fn(Vec<u8>) -> PyResult<PyObject>,
+    S: SeqBytes,
+    F: Fn(S) -> PyResult<PyObject>,
 {
     if let Ok(slice) = index.downcast::<PySlice>() {
-        let idx = slice.indices(bytes.len() as isize)?;
-        let (start, stop, step) = (idx.start, idx.stop, idx.step);
-
-        let mut out = Vec::new();
-
-        if step > 0 {
-            let mut i = start;
-            while i < stop {
-                out.push(bytes[i as usize]);
-                i += step;
-            }
-        } else {
-            let mut i = start;
-            while i > stop {
-                out.push(bytes[i as usize]);
-                i += step;
-            }
-        }
-
-        return make(out);
+        let idx = slice.indices(seq.len() as isize)?;
+        return make(seq.slice_step(idx.start, idx.stop, idx.step));
     }
 
     let index: isize = index
         .extract()
         .map_err(|_| PyTypeError::new_err("index must be int or slice"))?;
 
-    let n = bytes.len() as isize;
+    let n = seq.len() as isize;
     let i = if index < 0 { index + n } else { index };
 
     if i < 0 || i >= n {
         return Err(PyIndexError::new_err("index out of range"));
     }
 
-    make(vec![bytes[i as usize]])
+    make(seq.slice_step(i, i + 1, 1))
+}
+
+/// One lazily created object per residue byte, for [`seq_object`].
+pub type ResidueCache<T> = [GILOnceCell<Py<T>>; 256];
+
+/// Wrap `inner` as a Python object. The sequence classes are frozen, so
+/// single-residue results (`s[i]`, one-wide slices) are interned per byte in
+/// `cache` rather than allocated afresh each time.
+pub fn seq_object<S, T, F>(
+    py: Python<'_>,
+    cache: &ResidueCache<T>,
+    inner: S,
+    wrap: F,
+) -> PyResult<PyObject>
+where
+    S: SeqBytes,
+    T: PyClass + Into<PyClassInitializer<T>>,
+    F: FnOnce(S) -> T,
+{
+    let single = match *inner.as_bytes() {
+        [b] => Some(b),
+        _ => None,
+    };
+    if let Some(b) = single {
+        let obj = cache[b as usize].get_or_try_init(py, || Py::new(py, wrap(inner)))?;
+        return Ok(obj.to_object(py));
+    }
+    Ok(Py::new(py, wrap(inner))?.to_object(py))
 }
 
 pub enum NeedleBytes<'a> {
@@ -96,6 +152,49 @@ pub fn needle_ends_with(window: &[u8], needle: NeedleBytes<'_>) -> bool {
     }
 }
 
+/// `str.startswith`/`str.endswith` matching of `window` against one needle
+/// or a tuple of alternatives, stopping at the first hit.
+///
+/// `str` and `bytes` needles are compared in place against the Python
+/// object's buffer; anything else (sequence objects, ints, other buffers)
+/// goes through `extract`, which tests a single item.
+pub fn affix_matches<F>(
+    window: &[u8],
+    affix: &Bound<'_, PyAny>,
+    at_end: bool,
+    extract: F,
+) -> PyResult<bool>
+where
+    F: Fn(&Bound<'_, PyAny>) -> PyResult<bool>,
+{
+    let test = |needle: NeedleBytes<'_>| {
+        if at_end {
+            needle_ends_with(window, needle)
+        } else {
+            needle_starts_with(window, needle)
+        }
+    };
+    let matches = |item: &Bound<'_, PyAny>| -> PyResult<bool> {
+        if let Ok(s) = item.downcast::<PyString>() {
+            return Ok(test(NeedleBytes::Bytes(s.to_str()?.as_bytes())));
+        }
+        if let Ok(b) = item.downcast::<PyBytes>() {
+            return Ok(test(NeedleBytes::Bytes(b.as_bytes())));
+        }
+        extract(item)
+    };
+
+    if let Ok(tuple) = affix.downcast::<PyTuple>() {
+        for item in tuple.iter() {
+            if matches(&item)? {
+                return Ok(true);
+            }
+        }
+        return Ok(false);
+    }
+    matches(affix)
+}
+
 pub fn split_on_whitespace(hay: &[u8], maxsplit: isize) -> Vec<Vec<u8>> {
     let len = hay.len();
     let maxsplit = if maxsplit < 0 {
@@ -1,22 +1,35 @@
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::PyString;
+use pyo3::types::{PyByteArray, PyBytes, PyString};
 
 use crate::dna::DNA;
 use crate::protein::Protein;
 use crate::rna::RNA;
 
+/// Bytes of a `str` or bytes-like `obj`, or `None` if it is neither.
+///
+/// `str`, `bytes` and `bytearray` are copied straight out of their buffers;
+/// only other inputs go through pyo3's item-by-item `Vec<u8>` extraction.
+pub fn extract_seq_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Option<Vec<u8>>> {
+    if let Ok(s) = obj.downcast::<PyString>() {
+        return Ok(Some(s.to_str()?.as_bytes().to_vec()));
+    }
+    if let Ok(b) = obj.downcast::<PyBytes>() {
+        return Ok(Some(b.as_bytes().to_vec()));
+    }
+    if let Ok(b) = obj.downcast::<PyByteArray>() {
+        return Ok(Some(b.to_vec()));
+    }
+    Ok(obj.extract::<Vec<u8>>().ok())
+}
+
 pub fn extract_dna_bytes<'py>(obj: &Bound<'py, PyAny>) -> PyResult<Vec<u8>> {
     if let Ok(dna) = obj.extract::<PyRef<'py, DNA>>() {
         return Ok(dna.as_bytes().to_vec());
     }
 
-    if let Ok(s) = obj.downcast::<PyString>() {
-        return Ok(s.to_str()?.as_bytes().to_vec());
-    }
-
-    obj.extract::<Vec<u8>>()
-        .map_err(|_| PyTypeError::new_err("expected DNA, str, or bytes-like object"))
+    extract_seq_bytes(obj)?
+        .ok_or_else(|| PyTypeError::new_err("expected DNA, str, or bytes-like object"))
 }
 
 pub enum PyDnaNeedle<'a> {
@@ -35,7 +35,7 @@ from ._native import (
     build_tree,
 )
 from ._clustalo import msa_clustalo
-from ._msa import msa
+from ._msa import msa, msa_many
 
 __all__ = [
     "DNA",
@@ -74,4 +74,5 @@ __all__ = [
     "build_tree",
     "msa_clustalo",
     "msa",
+    "msa_many",
 ]
@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import importlib.resources
+import multiprocessing.util
 import os
 import platform
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
 
+from ._native import (
+    AlignmentDNA,
+    AlignmentProtein,
+    DNARecord,
+    DNARecordBatch,
+    ProteinRecord,
+    ProteinRecordBatch,
+    gapped_dna_batch,
+    gapped_protein_batch,
+)
+
+# clustalo arguments that msa_clustalo sets itself and extra_args may not override.
+_FORBIDDEN_FLAGS = frozenset({"-i", "-o", "--force"})
+_FORBIDDEN_PREFIXES = (
+    "--outfmt",
+    "--seqtype",
+    "--threads",
+    "--in",
+    "--out",
+    "--infile",
+    "--outfile",
+)
+
 
 def find_clustalo() -> Path:
     """Locate the clustalo binary.
@@ -19,9 +46,44 @@ def find_clustalo() -> Path:
     1. ``BIORUST_CLUSTALO_PATH`` env var (explicit path)
     2. Bundled platform binary under ``biorust/_bin/<platform>/clustalo``
     3. System PATH via ``shutil.which("clustalo")``
+
+    The result is cached per ``BIORUST_CLUSTALO_PATH`` value; call
+    ``_invalidate_clustalo_cache()`` to force a fresh probe.
     """
+    return _locate_clustalo(os.environ.get("BIORUST_CLUSTALO_PATH"))
+
+
+def _invalidate_clustalo_cache() -> None:
+    """Drop the cached clustalo location so the next lookup re-probes."""
+    _locate_clustalo.cache_clear()
+    _bundled_clustalo.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _bundled_clustalo() -> Path | None:
+    """Return the clustalo binary shipped in the wheel for this platform, if any."""
+    plat = None
+    if sys.platform == "darwin" and platform.machine() in ("arm64", "aarch64"):
+        plat = "darwin-arm64"
+    elif sys.platform.startswith("linux") and platform.machine() == "x86_64":
+        plat = "linux-x86_64"
+
+    if plat is None:
+        return None
+
+    ref = importlib.resources.files("biorust") / "_bin" / plat / "clustalo"
+    path = Path(str(ref))
+    if not path.exists():
+        return None
+    # wheels can drop the exec bit; only touch the inode when they did
+    if path.stat().st_mode & 0o777 != 0o755:
+        os.chmod(path, 0o755)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _locate_clustalo(env: str | None) -> Path:
     # 1. Env var override
-    env = os.environ.get("BIORUST_CLUSTALO_PATH")
     if env is not None:
         p = Path(env)
         if not p.exists():
@@ -35,18 +97,9 @@ def find_clustalo() -> Path:
         return p
 
     # 2. Bundled binary
-    plat = None
-    if sys.platform == "darwin" and platform.machine() in ("arm64", "aarch64"):
-        plat = "darwin-arm64"
-    elif sys.platform.startswith("linux") and platform.machine() == "x86_64":
-        plat = "linux-x86_64"
-
-    if plat is not None:
-        ref = importlib.resources.files("biorust") / "_bin" / plat / "clustalo"
-        path = Path(str(ref))
-        if path.exists():
-            os.chmod(path, 0o755)
-            return path
+    bundled = _bundled_clustalo()
+    if bundled is not None:
+        return bundled
 
     # 3. System PATH
     which = shutil.which("clustalo")
@@ -62,85 +115,130 @@ def find_clustalo() -> Path:
     )
 
 
-def _normalize_records(records):
-    """Convert input to ``(pairs, seq_type)`` where *seq_type* is ``"dna"`` or ``"protein"``."""
-    from biorust import (
-        DNARecord,
-        DNARecordBatch,
-        ProteinRecord,
-        ProteinRecordBatch,
+def _batch_pairs(batch):
+    """Extract ``(id, seq)`` pairs from a record batch in one native call."""
+    to_pairs = getattr(batch, "to_id_seq_pairs", None)
+    if to_pairs is not None:
+        return to_pairs()
+    # extension modules built before to_id_seq_pairs existed
+    return [(batch[i].id, str(batch[i].seq)) for i in range(len(batch))]
+
+
+@functools.singledispatch
+def _normalize(records):
+    raise TypeError(
+        f"msa_clustalo() expects RecordBatch or list[Record], "
+        f"got {type(records).__name__}"
     )
 
-    if isinstance(records, (str, bytes)):
-        raise TypeError(
-            "msa_clustalo() expects a RecordBatch or list[Record], not str or bytes"
-        )
 
-    if isinstance(records, DNARecordBatch):
-        pairs = [(records[i].id, str(records[i].seq)) for i in range(len(records))]
-        return pairs, "dna"
+@_normalize.register(str)
+@_normalize.register(bytes)
+def _(records):
+    raise TypeError(
+        "msa_clustalo() expects a RecordBatch or list[Record], not str or bytes"
+    )
+
 
-    if isinstance(records, ProteinRecordBatch):
-        pairs = [(records[i].id, str(records[i].seq)) for i in range(len(records))]
-        return pairs, "protein"
+@_normalize.register(DNARecordBatch)
+def _(records):
+    return _batch_pairs(records), "dna"
 
-    if isinstance(records, list):
-        if not records:
-            raise ValueError("MSA requires at least 2 sequences")
-        first = records[0]
-        if isinstance(first, DNARecord):
-            out = []
-            for r in records:
-                if not isinstance(r, DNARecord):
-                    raise TypeError(
-                        f"expected DNARecord in list, got {type(r).__name__}"
-                    )
-                out.append((r.id, str(r.seq)))
-            return out, "dna"
-        if isinstance(first, ProteinRecord):
-            out = []
-            for r in records:
-                if not isinstance(r, ProteinRecord):
-                    raise TypeError(
-                        f"expected ProteinRecord in list, got {type(r).__name__}"
-                    )
-                out.append((r.id, str(r.seq)))
-            return out, "protein"
+
+@_normalize.register(ProteinRecordBatch)
+def _(records):
+    return _batch_pairs(records), "protein"
+
+
+@_normalize.register(list)
+def _(records):
+    if not records:
+        raise ValueError("MSA requires at least 2 sequences")
+    first = records[0]
+    if isinstance(first, DNARecord):
+        record_type, seq_type = DNARecord, "dna"
+    elif isinstance(first, ProteinRecord):
+        record_type, seq_type = ProteinRecord, "protein"
+    else:
         raise TypeError(
             f"expected DNARecord or ProteinRecord in list, got {type(first).__name__}"
         )
 
-    raise TypeError(
-        f"msa_clustalo() expects RecordBatch or list[Record], "
-        f"got {type(records).__name__}"
-    )
+    out = []
+    for r in records:
+        if not isinstance(r, record_type):
+            raise TypeError(
+                f"expected {record_type.__name__} in list, got {type(r).__name__}"
+            )
+        out.append((r.id, str(r.seq)))
+    return out, seq_type
 
 
-def _parse_fasta(text: str) -> list[tuple[str, str]]:
-    """Parse simple FASTA text into (id, seq) pairs."""
+def _normalize_records(records):
+    """Convert input to ``(pairs, seq_type)`` where *seq_type* is ``"dna"`` or ``"protein"``."""
+    return _normalize(records)
+
+
+def _parse_fasta(data: bytes, aligned: bool = False) -> list[tuple[str, str]]:
+    """Parse simple FASTA bytes into (id, seq) pairs.
+
+    With ``aligned=True`` the first record fixes the width: later bodies are
+    copied into a preallocated buffer of that size and a record of any other
+    length raises ``RuntimeError``.
+    """
     records = []
     current_id = None
-    parts: list[str] = []
+    width = None
+    buf = bytearray()
+    off = 0
 
-    for line in text.splitlines():
+    def flush():
+        if width is not None and off != width:
+            raise RuntimeError(
+                f"clustalo output has inconsistent lengths: "
+                f"'{current_id}' has {off}, expected {width}"
+            )
+        records.append((current_id, buf.decode("ascii")))
+
+    for line in data.split(b"\n"):
         line = line.strip()
         if not line:
             continue
-        if line.startswith(">"):
+        if line.startswith(b">"):
             if current_id is not None:
-                records.append((current_id, "".join(parts)))
-            current_id = line[1:].split()[0]
-            parts = []
+                flush()
+                if aligned and width is None:
+                    width = len(buf)
+            current_id = line[1:].split(None, 1)[0].decode()
+            buf = bytearray() if width is None else bytearray(width)
+            off = 0
+        elif width is None:
+            buf += line
+            off += len(line)
         else:
-            parts.append(line)
+            end = off + len(line)
+            if end <= width:
+                buf[off:end] = line
+            off = end
 
     if current_id is not None:
-        records.append((current_id, "".join(parts)))
+        flush()
 
     return records
 
 
+def _format_fasta(pairs) -> bytes:
+    """Render ``(id, seq)`` pairs as one FASTA buffer."""
+    parts = []
+    for seq_id, seq in pairs:
+        parts += (">", seq_id, "\n", seq, "\n")
+    # str.join sizes the result once; encoding it is a single copy
+    return "".join(parts).encode()
+
+
 def _validate_extra_args(extra_args):
+    if extra_args is None:
+        return
     if isinstance(extra_args, (str, bytes)):
         raise TypeError("extra_args must be a list of strings, not str or bytes")
     if not isinstance(extra_args, (list, tuple)):
@@ -148,28 +246,188 @@ def _validate_extra_args(extra_args):
             f"extra_args must be a list of strings, got {type(extra_args).__name__}"
         )
 
-    forbidden_flags = {"-i", "-o", "--force"}
-    forbidden_prefixes = (
-        "--outfmt",
-        "--seqtype",
-        "--threads",
-        "--in",
-        "--out",
-        "--infile",
-        "--outfile",
-    )
-
     for arg in extra_args:
         if not isinstance(arg, str):
             raise TypeError(
                 f"extra_args must be a list of strings, got {type(arg).__name__}"
             )
-        if arg in forbidden_flags or arg.startswith(forbidden_prefixes):
+        if arg in _FORBIDDEN_FLAGS or arg.startswith(_FORBIDDEN_PREFIXES):
             raise ValueError(
                 f"extra_args cannot override required clustalo args: {arg!r}"
             )
 
 
+# Whether the resolved clustalo accepts ``-i -``/``-o -``; ``None`` until probed.
+_stdin_supported: bool | None = None
+
+
+def _validate_msa() -> bool:
+    """Whether to check clustalo output widths while parsing.
+
+    Off by default: clustalo's FASTA output is always rectangular and the
+    alignment constructors reject ragged input anyway. Set
+    ``BIORUST_VALIDATE_MSA=1`` to get a per-record error message when
+    debugging a misbehaving binary.
+    """
+    return os.environ.get("BIORUST_VALIDATE_MSA") == "1"
+
+
+def _clustalo_cmd(clustalo, in_path, out_path, seq_type, threads, extra_args):
+    cmd = [
+        str(clustalo),
+        "-i",
+        in_path,
+        "-o",
+        out_path,
+        "--outfmt=fasta",
+        "--force",
+    ]
+
+    if seq_type == "protein":
+        cmd.append("--seqtype=Protein")
+
+    if threads is not None:
+        cmd.append(f"--threads={threads}")
+
+    if extra_args:
+        cmd.extend(extra_args)
+
+    return cmd
+
+
+def _clustalo_error(cmd, returncode, stderr: bytes):
+    # stderr stays raw bytes on the happy path; decode only what is reported
+    if stderr:
+        stderr = stderr[:8192].decode("utf-8", errors="replace")
+    else:
+        stderr = "(no stderr)"
+    return RuntimeError(
+        f"clustalo failed (exit code {returncode})\n"
+        f"command: {' '.join(cmd)}\n"
+        f"stderr: {stderr}"
+    )
+
+
+# Per-thread scratch directory for the tempfile fallback.
+_SCRATCH = threading.local()
+
+
+def _scratch_dir() -> str:
+    """Return this thread's scratch directory, creating it on first use.
+
+    The directory is reused across calls. In a worker of
+    ``msa_clustalo_many`` it is recorded in that call's scope and removed
+    when the call's pool shuts down; in any other thread it lives until
+    interpreter exit.
+    """
+    pid = os.getpid()
+    # a forked child inherits the parent's thread-local; don't share its dir
+    if getattr(_SCRATCH, "pid", None) != pid:
+        path = tempfile.mkdtemp(prefix="biorust-clustalo-")
+        scope = getattr(_SCRATCH, "scope", None)
+        if scope is not None:
+            scope.append(path)
+        else:
+            multiprocessing.util.Finalize(
+                None,
+                shutil.rmtree,
+                args=(path,),
+                kwargs={"ignore_errors": True},
+                exitpriority=0,
+            )
+        _SCRATCH.dir = path
+        _SCRATCH.pid = pid
+    return _SCRATCH.dir
+
+
+def _enter_scratch_scope(scope: list) -> None:
+    """Executor initializer: this worker's scratch directory goes in ``scope``."""
+    _SCRATCH.scope = scope
+
+
+def _run_clustalo_files(clustalo, data, seq_type, threads, extra_args):
+    """Tempfile fallback for clustalo builds that cannot read stdin."""
+    scratch = _scratch_dir()
+    in_path = os.path.join(scratch, "input.fasta")
+    out_path = os.path.join(scratch, "output.fasta")
+
+    with open(in_path, "wb") as f:
+        f.write(data)
+
+    cmd = _clustalo_cmd(clustalo, in_path, out_path, seq_type, threads, extra_args)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    if result.returncode != 0:
+        raise _clustalo_error(cmd, result.returncode, result.stderr)
+
+    with open(out_path, "rb") as f:
+        return f.read()
+
+
+def _run_clustalo(pairs, seq_type, threads, extra_args):
+    """Align ``(id, seq)`` pairs with clustalo and return aligned ``(id, seq)`` pairs.
+
+    The input is streamed over stdin and the alignment read back from stdout.
+    If the first stdin run fails, the tempfile path is tried; when that
+    succeeds, later calls go straight to tempfiles.
+    """
+    global _stdin_supported
+
+    clustalo = find_clustalo()
+    _validate_extra_args(extra_args)
+
+    data = _format_fasta(pairs)
+
+    if _stdin_supported is not False:
+        cmd = _clustalo_cmd(clustalo, "-", "-", seq_type, threads, extra_args)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        out, err = proc.communicate(data)
+
+        if proc.returncode == 0:
+            _stdin_supported = True
+            return _parse_fasta(out, aligned=_validate_msa())
+
+        if _stdin_supported:
+            raise _clustalo_error(cmd, proc.returncode, err)
+
+    output = _run_clustalo_files(clustalo, data, seq_type, threads, extra_args)
+    _stdin_supported = False
+    return _parse_fasta(output, aligned=_validate_msa())
+
+
+def _build_alignment(aligned, seq_type):
+    """Check clustalo output and wrap it in an ``AlignmentDNA``/``AlignmentProtein``."""
+    # widths are checked by the alignment constructors (and by _parse_fasta
+    # when BIORUST_VALIDATE_MSA=1)
+    if not aligned:
+        raise RuntimeError("clustalo produced no output sequences")
+
+    ids = [seq_id for seq_id, _ in aligned]
+    seqs = [seq for _, seq in aligned]
+
+    if seq_type == "protein":
+        return AlignmentProtein(list(zip(ids, gapped_protein_batch(seqs))))
+
+    return AlignmentDNA(list(zip(ids, gapped_dna_batch(seqs))))
+
+
+def _default_threads() -> int | None:
+    """Thread count to use when the caller passes ``threads=None``.
+
+    The bundled binary is assumed to be built with OpenMP and is given one
+    thread per CPU; nothing here checks that. User-provided binaries keep
+    clustalo's own default.
+    """
+    if find_clustalo() == _bundled_clustalo():
+        return os.cpu_count()
+    return None
+
+
 def msa_clustalo(records, *, threads=None, extra_args=None):
     """Run Clustal Omega multiple sequence alignment.
 
@@ -178,7 +436,8 @@ def msa_clustalo(records, *, threads=None, extra_args=None):
     records : DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]
         Input sequences to align.
     threads : int, optional
-        Number of threads for clustalo.
+        Number of threads for clustalo. Defaults to ``os.cpu_count()`` with
+        the bundled binary and to clustalo's own default otherwise.
     extra_args : list[str], optional
         Additional command-line arguments for clustalo.
 
@@ -187,77 +446,80 @@ def msa_clustalo(records, *, threads=None, extra_args=None):
     AlignmentDNA | AlignmentProtein
         Aligned (gapped) sequences.
     """
-    from biorust import (
-        AlignmentDNA,
-        AlignmentProtein,
-        GappedDNA,
-        GappedProtein,
-    )
-
     pairs, seq_type = _normalize_records(records)
 
     if len(pairs) < 2:
         raise ValueError("MSA requires at least 2 sequences")
 
-    clustalo = find_clustalo()
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        in_path = os.path.join(tmpdir, "input.fasta")
-        out_path = os.path.join(tmpdir, "output.fasta")
-
-        with open(in_path, "w") as f:
-            for seq_id, seq in pairs:
-                f.write(f">{seq_id}\n{seq}\n")
+    if threads is None:
+        threads = _default_threads()
 
-        cmd = [
-            str(clustalo),
-            "-i",
-            in_path,
-            "-o",
-            out_path,
-            "--outfmt=fasta",
-            "--force",
-        ]
+    aligned = _run_clustalo(pairs, seq_type, threads, extra_args)
+    return _build_alignment(aligned, seq_type)
 
-        if seq_type == "protein":
-            cmd.append("--seqtype=Protein")
 
-        if threads is not None:
-            cmd.append(f"--threads={threads}")
+def msa_clustalo_many(batches, *, jobs=0, threads=None, extra_args=None):
+    """Align many independent record batches with concurrent clustalo runs.
 
-        if extra_args:
-            _validate_extra_args(extra_args)
-            cmd.extend(extra_args)
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            stderr = result.stderr[:8192] if result.stderr else "(no stderr)"
-            raise RuntimeError(
-                f"clustalo failed (exit code {result.returncode})\n"
-                f"command: {' '.join(cmd)}\n"
-                f"stderr: {stderr}"
-            )
+    Each run is its own clustalo subprocess, so the workers only feed it
+    FASTA and wait on its output. Threads do that without starting and
+    importing a Python interpreter per worker or pickling the records;
+    each keeps its own scratch directory for the tempfile fallback.
 
-        with open(out_path) as f:
-            output_text = f.read()
-
-    aligned = _parse_fasta(output_text)
-
-    if not aligned:
-        raise RuntimeError("clustalo produced no output sequences")
+    Parameters
+    ----------
+    batches : Iterable[DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]]
+        Input batches, each aligned independently.
+    jobs : int
+        Number of clustalo runs in flight. ``0`` uses ``os.cpu_count()``;
+        ``1`` runs serially in the calling thread.
+    threads : int, optional
+        Number of threads for each clustalo run.
+    extra_args : list[str], optional
+        Additional command-line arguments for clustalo.
 
-    width = len(aligned[0][1])
-    for seq_id, seq in aligned:
-        if len(seq) != width:
-            raise RuntimeError(
-                f"clustalo output has inconsistent lengths: "
-                f"'{seq_id}' has {len(seq)}, expected {width}"
-            )
+    Returns
+    -------
+    list[AlignmentDNA | AlignmentProtein]
+        One alignment per input batch, in input order.
+    """
+    if jobs < 0:
+        raise ValueError(f"jobs must be >= 0, got {jobs}")
 
-    if seq_type == "protein":
-        tuples = [(seq_id, GappedProtein(seq)) for seq_id, seq in aligned]
-        return AlignmentProtein(tuples)
+    normalized = [_normalize_records(records) for records in batches]
+    for pairs, _ in normalized:
+        if len(pairs) < 2:
+            raise ValueError("MSA requires at least 2 sequences")
 
-    tuples = [(seq_id, GappedDNA(seq)) for seq_id, seq in aligned]
-    return AlignmentDNA(tuples)
+    _validate_extra_args(extra_args)
+
+    if not normalized:
+        return []
+
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(normalized))
+    seq_types = [seq_type for _, seq_type in normalized]
+
+    run = functools.partial(_run_clustalo, threads=threads, extra_args=extra_args)
+    if jobs == 1:
+        results = [run(pairs, seq_type) for pairs, seq_type in normalized]
+    else:
+        scratch = []
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=jobs,
+                initializer=_enter_scratch_scope,
+                initargs=(scratch,),
+            ) as executor:
+                results = list(
+                    executor.map(run, [pairs for pairs, _ in normalized], seq_types)
+                )
+        finally:
+            # the workers have exited; their tempfile-fallback dirs go with them
+            for path in scratch:
+                shutil.rmtree(path, ignore_errors=True)
+
+    return [
+        _build_alignment(aligned, seq_type)
+        for aligned, seq_type in zip(results, seq_types)
+    ]
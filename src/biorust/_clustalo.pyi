@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from pathlib import Path
 
 from ._native import (
@@ -21,3 +23,12 @@ def msa_clustalo(
     threads: int | None = None,
     extra_args: list[str] | None = None,
 ) -> AlignmentDNA | AlignmentProtein: ...
+def msa_clustalo_many(
+    batches: Iterable[
+        DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]
+    ],
+    *,
+    jobs: int = 0,
+    threads: int | None = None,
+    extra_args: list[str] | None = None,
+) -> list[AlignmentDNA | AlignmentProtein]: ...
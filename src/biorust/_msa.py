@@ -2,16 +2,58 @@
 
 from __future__ import annotations
 
+from ._clustalo import _normalize_records, msa_clustalo, msa_clustalo_many
+from ._native import (
+    DNA,
+    AlignmentDNA,
+    AlignmentProtein,
+    Protein,
+    Scoring,
+    align_global,
+    gapped_dna_batch,
+    gapped_protein_batch,
+)
 
-def msa(records, *, algorithm="clustalo", **kwargs):
+# msa_clustalo kwargs the pairwise shortcut can safely ignore
+_PAIRWISE_KWARGS = frozenset({"threads", "extra_args"})
+
+
+def _use_pairwise(records, kwargs) -> bool:
+    if kwargs.get("extra_args") or not _PAIRWISE_KWARGS.issuperset(kwargs):
+        return False
+    return hasattr(records, "__len__") and len(records) == 2
+
+
+def _msa_pairwise(pairs, seq_type):
+    """Align two sequences with global Needleman-Wunsch (free end gaps)."""
+    (a_id, a), (b_id, b) = pairs
+    seq_cls = Protein if seq_type == "protein" else DNA
+    # EMBOSS needle defaults on EDNAFULL/BLOSUM62
+    scoring = Scoring(gap_open=-10.0, gap_extend=-0.5, end_gap=False)
+    res = align_global(seq_cls(a), seq_cls(b), scoring, traceback=True)
+    aligned = list(res.aligned_strings())
+
+    if seq_type == "protein":
+        return AlignmentProtein(list(zip((a_id, b_id), gapped_protein_batch(aligned))))
+    return AlignmentDNA(list(zip((a_id, b_id), gapped_dna_batch(aligned))))
+
+
+def msa(records, *, algorithm="clustalo", force_algorithm=False, **kwargs):
     """Run multiple sequence alignment.
 
+    Exactly two input sequences are aligned in-process with ``align_global``
+    instead of starting clustalo, unless ``extra_args`` is given or
+    ``force_algorithm`` is set.
+
     Parameters
     ----------
     records : DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]
         Input sequences to align.
     algorithm : str
         Alignment algorithm (default: ``"clustalo"``).
+    force_algorithm : bool
+        Always run *algorithm*, even for two sequences (e.g. when output must
+        match clustalo exactly).
     **kwargs
         Forwarded to the algorithm-specific function.
 
@@ -21,8 +63,34 @@ def msa(records, *, algorithm="clustalo", **kwargs):
         Aligned (gapped) sequences.
     """
     if algorithm == "clustalo":
-        from biorust._clustalo import msa_clustalo
+        if not force_algorithm and _use_pairwise(records, kwargs):
+            return _msa_pairwise(*_normalize_records(records))
 
         return msa_clustalo(records, **kwargs)
 
     raise ValueError(f"unknown algorithm {algorithm!r}, supported: 'clustalo'")
+
+
+def msa_many(batches, *, algorithm="clustalo", jobs=0, **kwargs):
+    """Run many independent multiple sequence alignments in parallel.
+
+    Parameters
+    ----------
+    batches : Iterable[DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]]
+        Input batches, each aligned independently.
+    algorithm : str
+        Alignment algorithm (default: ``"clustalo"``).
+    jobs : int
+        Number of alignments run concurrently (default: ``0``, one per CPU).
+    **kwargs
+        Forwarded to the algorithm-specific function.
+
+    Returns
+    -------
+    list[AlignmentDNA | AlignmentProtein]
+        One alignment per input batch, in input order.
+    """
+    if algorithm == "clustalo":
+        return msa_clustalo_many(batches, jobs=jobs, **kwargs)
+
+    raise ValueError(f"unknown algorithm {algorithm!r}, supported: 'clustalo'")
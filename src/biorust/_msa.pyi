@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from ._native import (
     AlignmentDNA,
     AlignmentProtein,
@@ -16,5 +18,15 @@ def msa(
     | list[ProteinRecord],
     *,
     algorithm: str = "clustalo",
+    force_algorithm: bool = False,
     **kwargs,
 ) -> AlignmentDNA | AlignmentProtein: ...
+def msa_many(
+    batches: Iterable[
+        DNARecordBatch | list[DNARecord] | ProteinRecordBatch | list[ProteinRecord]
+    ],
+    *,
+    algorithm: str = "clustalo",
+    jobs: int = 0,
+    **kwargs,
+) -> list[AlignmentDNA | AlignmentProtein]: ...
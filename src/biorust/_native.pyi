@@ -155,6 +155,7 @@ class DNA:
     def to_bytes(self) -> bytes: ...
     def __len__(self) -> int: ...
     def __bytes__(self) -> bytes: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
     def __str__(self) -> str: ...
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
@@ -367,6 +368,7 @@ class RNA:
     def to_bytes(self) -> bytes: ...
     def __len__(self) -> int: ...
     def __bytes__(self) -> bytes: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
     def __str__(self) -> str: ...
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
@@ -518,6 +520,7 @@ class DNARecordBatch:
     def __getitem__(self, other: slice) -> "DNARecordBatch": ...
     def __getitem__(self, other): ...
     def ids(self) -> list[str]: ...
+    def to_id_seq_pairs(self) -> list[tuple[str, str]]: ...
     def descriptions(self) -> list[str | None]: ...
     def seqs(self) -> "DNABatch": ...
     @property
@@ -532,10 +535,12 @@ class DNARecordBatch:
     def filter_empty(self, inplace: Literal[True]) -> None: ...
     @overload
     def reverse_complements(
-        self, inplace: Literal[False] = ...
+        self, inplace: Literal[False] = ..., threads: int | None = ...
     ) -> "DNARecordBatch": ...
     @overload
-    def reverse_complements(self, inplace: Literal[True]) -> None: ...
+    def reverse_complements(
+        self, inplace: Literal[True], threads: int | None = ...
+    ) -> None: ...
 
 class RNARecord:
     def __init__(
@@ -618,6 +623,7 @@ class ProteinRecordBatch:
     def __getitem__(self, other: slice) -> "ProteinRecordBatch": ...
     def __getitem__(self, other): ...
     def ids(self) -> list[str]: ...
+    def to_id_seq_pairs(self) -> list[tuple[str, str]]: ...
     def descriptions(self) -> list[str | None]: ...
     def seqs(self) -> "ProteinBatch": ...
     @property
@@ -638,6 +644,10 @@ class SkippedRecord:
     def message(self) -> str: ...
     def __repr__(self) -> str: ...
 
+class DNABatchIterator:
+    def __iter__(self) -> DNABatchIterator: ...
+    def __next__(self) -> DNA: ...
+
 class DNABatch:
     """Batch of DNA sequences for efficient processing.
 
@@ -657,7 +667,7 @@ class DNABatch:
     @overload
     def __getitem__(self, other: DNABatch) -> "DNABatch": ...
     def __getitem__(self, other): ...
-    def __iter__(self): ...
+    def __iter__(self) -> DNABatchIterator: ...
     def to_list(self) -> list[DNA]: ...
     def lengths(self) -> list[int]: ...
     def copy(self) -> "DNABatch": ...
@@ -700,9 +710,17 @@ class DNABatch:
     def __iadd__(self, other: Iterable[DNA] | "DNABatch") -> "DNABatch": ...
     def __imul__(self, n: int) -> "DNABatch": ...
     @overload
-    def reverse_complements(self, inplace: Literal[False] = ...) -> "DNABatch": ...
+    def reverse_complements(
+        self, inplace: Literal[False] = ..., threads: int | None = ...
+    ) -> "DNABatch": ...
     @overload
-    def reverse_complements(self, inplace: Literal[True]) -> None: ...
+    def reverse_complements(
+        self, inplace: Literal[True], threads: int | None = ...
+    ) -> None: ...
+
+class RNABatchIterator:
+    def __iter__(self) -> RNABatchIterator: ...
+    def __next__(self) -> RNA: ...
 
 class RNABatch:
     def __init__(self, seqs: Iterable[RNA]) -> None: ...
@@ -712,7 +730,7 @@ class RNABatch:
     @overload
     def __getitem__(self, other: slice) -> "RNABatch": ...
     def __getitem__(self, other): ...
-    def __iter__(self): ...
+    def __iter__(self) -> RNABatchIterator: ...
     def to_list(self) -> list[RNA]: ...
     def lengths(self) -> list[int]: ...
     def copy(self) -> "RNABatch": ...
@@ -778,6 +796,7 @@ class Protein:
     def to_bytes(self) -> bytes: ...
     def __len__(self) -> int: ...
     def __bytes__(self) -> bytes: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
     def __str__(self) -> str: ...
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
@@ -997,6 +1016,10 @@ class Protein:
         end: int | None = ...,
     ) -> bool: ...
 
+class ProteinBatchIterator:
+    def __iter__(self) -> ProteinBatchIterator: ...
+    def __next__(self) -> Protein: ...
+
 class ProteinBatch:
     def __init__(self, seqs: Iterable[Protein]) -> None: ...
     def __len__(self) -> int: ...
@@ -1005,7 +1028,7 @@ class ProteinBatch:
     @overload
     def __getitem__(self, other: slice) -> "ProteinBatch": ...
     def __getitem__(self, other): ...
-    def __iter__(self): ...
+    def __iter__(self) -> ProteinBatchIterator: ...
     def to_list(self) -> list[Protein]: ...
     def lengths(self) -> list[int]: ...
     def copy(self) -> "ProteinBatch": ...
@@ -1258,6 +1281,7 @@ class GappedDNA:
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
     def __bytes__(self) -> bytes: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
     def __lt__(self, other: object) -> bool: ...
@@ -1281,6 +1305,7 @@ class GappedProtein:
     def __repr__(self) -> str: ...
     def __hash__(self) -> int: ...
     def __bytes__(self) -> bytes: ...
+    def __buffer__(self, flags: int, /) -> memoryview: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
     def __lt__(self, other: object) -> bool: ...
@@ -1293,6 +1318,9 @@ class GappedProtein:
     def __getitem__(self, other: slice) -> "GappedProtein": ...
     def __getitem__(self, other): ...
 
+def gapped_dna_batch(seqs: list[str]) -> list[GappedDNA]: ...
+def gapped_protein_batch(seqs: list[str]) -> list[GappedProtein]: ...
+
 class AlignmentDNA:
     """Multiple sequence alignment of DNA sequences."""
 
@@ -13,6 +13,13 @@ def test_dna_batch_index_and_list():
     assert [str(s) for s in batch.to_list()] == ["AC", "GT"]
     assert [str(s) for s in list(batch)] == ["AC", "GT"]
 
+    it = iter(batch)
+    assert iter(it) is it
+    assert str(next(it)) == "AC"
+    assert [str(s) for s in it] == ["GT"]
+    assert list(it) == []
+    assert [str(s) for s in ProteinBatch([Protein("MK")])] == ["MK"]
+
     sub = batch[0:2]
     assert isinstance(sub, DNABatch)
     assert [str(s) for s in sub.to_list()] == ["AC", "GT"]
@@ -31,6 +38,18 @@ def test_dna_batch_reverse_complements_inplace():
     assert [str(s) for s in batch.to_list()] == ["GCAT", "CGTT"]
 
 
+def test_dna_batch_reverse_complements_threads():
+    batch = DNABatch([DNA("ATGC"), DNA("AACG"), DNA("ACGTACGTN")])
+    out = batch.reverse_complements(threads=2)
+    assert [str(s) for s in out.to_list()] == ["GCAT", "CGTT", "NACGTACGT"]
+
+    batch.reverse_complements(inplace=True, threads=1)
+    assert [str(s) for s in batch.to_list()] == ["GCAT", "CGTT", "NACGTACGT"]
+
+    with pytest.raises(ValueError, match="thread count"):
+        batch.reverse_complements(threads=0)
+
+
 def test_dna_batch_mutations():
     batch = DNABatch([DNA("A"), DNA("C")])
 
@@ -110,3 +110,29 @@ def test_protein_batch_biology_metrics():
     amb = ProteinBatch([Protein("AX"), Protein("AC")])
     assert amb.has_ambiguous() == [True, False]
     assert amb.unknown_positions() == [[1], []]
+
+
+def test_protein_batch_counts_follow_mutation():
+    batch = ProteinBatch([Protein("AAC")])
+    assert batch.counts() == [[("A", 2), ("C", 1)]]
+    assert batch.shannon_entropy()[0] > 0.0
+
+    batch.append(Protein("WW"))
+    assert batch.counts() == [[("A", 2), ("C", 1)], [("W", 2)]]
+    assert batch.aa_frequencies_20()[1][17] == ("W", 1.0)
+    assert batch.shannon_entropy()[1] == 0.0
+
+    batch.truncate(1)
+    assert batch.counts() == [[("A", 2), ("C", 1)]]
+    batch.clear()
+    assert batch.counts() == []
+
+
+def test_protein_batch_charge_matches_single():
+    seqs = [Protein("MKRHDECYY"), Protein("AC"), Protein("")]
+    batch = ProteinBatch(seqs)
+    assert batch.net_charge(7.0) == [s.net_charge(7.0) for s in seqs]
+    assert batch.isoelectric_point() == [s.isoelectric_point() for s in seqs]
+
+    with pytest.raises(ValueError):
+        ProteinBatch([Protein("AC"), Protein("AX")]).isoelectric_point()
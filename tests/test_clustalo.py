@@ -30,6 +30,92 @@ def test_locator_env_override(tmp_path, monkeypatch):
     assert result == fake
 
 
+def test_locator_cache_invalidate(tmp_path, monkeypatch):
+    from biorust._clustalo import _invalidate_clustalo_cache, find_clustalo
+
+    fake = tmp_path / "clustalo"
+    fake.write_text("#!/bin/sh\n")
+    fake.chmod(0o755)
+
+    monkeypatch.setenv("BIORUST_CLUSTALO_PATH", str(fake))
+    assert find_clustalo() == fake
+
+    # cached: still returned after the file disappears
+    fake.unlink()
+    assert find_clustalo() == fake
+
+    _invalidate_clustalo_cache()
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        find_clustalo()
+
+
+def _fake_clustalo(tmp_path, monkeypatch, script):
+    import biorust._clustalo as clustalo
+
+    fake = tmp_path / "clustalo"
+    fake.write_text(script)
+    fake.chmod(0o755)
+    monkeypatch.setenv("BIORUST_CLUSTALO_PATH", str(fake))
+    monkeypatch.setattr(clustalo, "_stdin_supported", None)
+    return clustalo
+
+
+def test_run_clustalo_stdin(tmp_path, monkeypatch):
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, "#!/bin/sh\ncat\n")
+
+    pairs = [("a", "AC-GT"), ("b", "ACGGT")]
+    assert clustalo._run_clustalo(pairs, "dna", None, None) == pairs
+    assert clustalo._stdin_supported is True
+
+
+def test_default_threads_bundled(tmp_path, monkeypatch):
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, "#!/bin/sh\ncat\n")
+
+    monkeypatch.setattr(clustalo, "_bundled_clustalo", lambda: None)
+    assert clustalo._default_threads() is None
+
+    monkeypatch.setattr(clustalo, "_bundled_clustalo", lambda: tmp_path / "clustalo")
+    assert clustalo._default_threads() == os.cpu_count()
+
+
+def test_run_clustalo_validate_env(tmp_path, monkeypatch):
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, "#!/bin/sh\ncat\n")
+
+    pairs = [("a", "AC-GT"), ("b", "ACG")]
+    monkeypatch.delenv("BIORUST_VALIDATE_MSA", raising=False)
+    assert clustalo._run_clustalo(pairs, "dna", None, None) == pairs
+
+    monkeypatch.setenv("BIORUST_VALIDATE_MSA", "1")
+    with pytest.raises(RuntimeError, match="'b' has 3, expected 5"):
+        clustalo._run_clustalo(pairs, "dna", None, None)
+
+
+def test_run_clustalo_tempfile_fallback(tmp_path, monkeypatch):
+    # rejects "-i -", otherwise copies input to output
+    script = '#!/bin/sh\nif [ "$2" = "-" ]; then exit 1; fi\ncp "$2" "$4"\n'
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, script)
+
+    pairs = [("a", "AC-GT"), ("b", "ACGGT")]
+    assert clustalo._run_clustalo(pairs, "dna", None, None) == pairs
+    assert clustalo._stdin_supported is False
+    assert clustalo._run_clustalo(pairs, "dna", None, None) == pairs
+
+    # the fallback reuses one scratch directory per thread
+    scratch = clustalo._scratch_dir()
+    assert scratch == clustalo._scratch_dir()
+    assert os.path.exists(os.path.join(scratch, "output.fasta"))
+
+
+def test_run_clustalo_failure_reports_stderr(tmp_path, monkeypatch):
+    script = "#!/bin/sh\necho progress\necho 'bad input' >&2\nexit 3\n"
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, script)
+    monkeypatch.setattr(clustalo, "_stdin_supported", True)
+
+    with pytest.raises(RuntimeError, match="exit code 3") as excinfo:
+        clustalo._run_clustalo([("a", "AC"), ("b", "AG")], "dna", None, None)
+    assert "bad input" in str(excinfo.value)
+
+
 @skip_unless_external
 def test_msa_smoke():
     from biorust import DNA, DNARecord, DNARecordBatch, msa_clustalo
@@ -125,6 +211,111 @@ def test_msa_generic_dispatch_protein():
     assert len(aln) == 2
 
 
+def test_msa_pair_uses_global_alignment(tmp_path, monkeypatch):
+    from biorust import DNA, DNARecord, DNARecordBatch, AlignmentDNA, msa
+
+    # any clustalo call would fail
+    monkeypatch.setenv("BIORUST_CLUSTALO_PATH", str(tmp_path / "missing"))
+    records = DNARecordBatch(
+        [DNARecord("a", DNA("ACGTACGT")), DNARecord("b", DNA("ACGACGT"))]
+    )
+
+    aln = msa(records)
+    assert isinstance(aln, AlignmentDNA)
+    assert aln.ids() == ["a", "b"]
+    assert [str(s.ungapped()) for s in aln.seqs()] == ["ACGTACGT", "ACGACGT"]
+    assert aln.width == 8
+
+    with pytest.raises(FileNotFoundError):
+        msa(records, force_algorithm=True)
+
+    with pytest.raises(FileNotFoundError):
+        msa(records, extra_args=["--iter=2"])
+
+
+def test_msa_pair_protein(tmp_path, monkeypatch):
+    from biorust import Protein, ProteinRecord, AlignmentProtein, msa
+
+    monkeypatch.setenv("BIORUST_CLUSTALO_PATH", str(tmp_path / "missing"))
+    records = [
+        ProteinRecord("a", Protein("MKTAYIAKQRQISFVKSH")),
+        ProteinRecord("b", Protein("MKTAYIAKQR")),
+    ]
+
+    aln = msa(records)
+    assert isinstance(aln, AlignmentProtein)
+    assert str(aln.seqs()[1].ungapped()) == "MKTAYIAKQR"
+    assert aln.width == 18
+
+
+@skip_unless_external
+def test_msa_many():
+    from biorust import DNA, DNARecord, AlignmentDNA, msa_many
+
+    batches = [
+        [DNARecord("a", DNA("ACGTACGT")), DNARecord("b", DNA("ACGT"))],
+        [DNARecord("c", DNA("GGGTTT")), DNARecord("d", DNA("GGTTT"))],
+    ]
+
+    alns = msa_many(batches, jobs=2)
+    assert len(alns) == 2
+    assert all(isinstance(aln, AlignmentDNA) for aln in alns)
+    assert set(alns[0].ids()) == {"a", "b"}
+    assert set(alns[1].ids()) == {"c", "d"}
+
+
+def test_msa_many_fake_clustalo(tmp_path, monkeypatch):
+    from biorust import DNA, DNARecord, AlignmentDNA
+
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, "#!/bin/sh\ncat\n")
+    batches = [
+        [DNARecord("a", DNA("ACGT")), DNARecord("b", DNA("AGGT"))],
+        [DNARecord("c", DNA("GG")), DNARecord("d", DNA("TT"))],
+        [DNARecord("e", DNA("A")), DNARecord("f", DNA("C"))],
+    ]
+
+    alns = clustalo.msa_clustalo_many(batches, jobs=2)
+    assert all(isinstance(aln, AlignmentDNA) for aln in alns)
+    assert [aln.ids() for aln in alns] == [["a", "b"], ["c", "d"], ["e", "f"]]
+    assert [aln.width for aln in alns] == [4, 2, 1]
+
+
+def test_msa_many_tempfile_fallback_cleans_scratch(tmp_path, monkeypatch):
+    import glob
+    import tempfile
+
+    from biorust import DNA, DNARecord
+
+    script = '#!/bin/sh\nif [ "$2" = "-" ]; then exit 1; fi\ncp "$2" "$4"\n'
+    clustalo = _fake_clustalo(tmp_path, monkeypatch, script)
+    monkeypatch.setattr(clustalo, "_stdin_supported", False)
+    pattern = os.path.join(tempfile.gettempdir(), "biorust-clustalo-*")
+    before = set(glob.glob(pattern))
+
+    batches = [
+        [DNARecord("a", DNA("ACGT")), DNARecord("b", DNA("AGGT"))],
+        [DNARecord("c", DNA("GG")), DNARecord("d", DNA("TT"))],
+        [DNARecord("e", DNA("A")), DNARecord("f", DNA("C"))],
+    ]
+    for _ in range(2):
+        alns = clustalo.msa_clustalo_many(batches, jobs=2)
+        assert [aln.ids() for aln in alns] == [["a", "b"], ["c", "d"], ["e", "f"]]
+
+    assert set(glob.glob(pattern)) == before
+
+
+def test_msa_many_empty_and_errors():
+    from biorust._msa import msa_many
+
+    assert msa_many([]) == []
+
+    with pytest.raises(ValueError, match="unknown algorithm"):
+        msa_many([], algorithm="bogus")
+
+    with pytest.raises(ValueError, match="jobs"):
+        msa_many([], jobs=-1)
+
+
 def test_msa_unknown_algorithm():
     from biorust._msa import msa
 
@@ -141,6 +332,46 @@ def test_msa_bad_input():
     with pytest.raises(TypeError, match="not str"):
         _normalize_records(b"ACGT")
 
+    with pytest.raises(TypeError, match="got tuple"):
+        _normalize_records(("a", "ACGT"))
+
+    with pytest.raises(TypeError, match="in list, got int"):
+        _normalize_records([1, 2])
+
+
+def test_parse_fasta_bytes():
+    from biorust._clustalo import _parse_fasta
+
+    data = b">a desc\r\nAC-G\r\nT\r\n\n>b\nACGGT\n"
+    assert _parse_fasta(data) == [("a", "AC-GT"), ("b", "ACGGT")]
+    assert _parse_fasta(b"") == []
+
+
+def test_parse_fasta_aligned():
+    from biorust._clustalo import _parse_fasta
+
+    data = b">a\nAC-\nGT\n>b\nACG\nGT\n>c\nA\nC\nGGT\n"
+    assert _parse_fasta(data, aligned=True) == [
+        ("a", "AC-GT"),
+        ("b", "ACGGT"),
+        ("c", "ACGGT"),
+    ]
+
+    with pytest.raises(RuntimeError, match="'b' has 6, expected 5"):
+        _parse_fasta(b">a\nAC-GT\n>b\nACGGTT\n", aligned=True)
+
+    with pytest.raises(RuntimeError, match="'b' has 4, expected 5"):
+        _parse_fasta(b">a\nAC-GT\n>b\nACG\nT\n>c\nACGGT\n", aligned=True)
+
+
+def test_format_fasta():
+    from biorust._clustalo import _format_fasta, _parse_fasta
+
+    pairs = [("a", "ACGT"), ("b", "GG")]
+    assert _format_fasta(pairs) == b">a\nACGT\n>b\nGG\n"
+    assert _parse_fasta(_format_fasta(pairs)) == pairs
+    assert _format_fasta([]) == b""
+
 
 def test_extra_args_validation():
     from biorust._clustalo import _validate_extra_args
@@ -158,3 +389,5 @@ def test_extra_args_validation():
         _validate_extra_args(["-i"])
 
     _validate_extra_args(["--full"])
+    _validate_extra_args(None)
+    _validate_extra_args([])
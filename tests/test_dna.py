@@ -1,3 +1,5 @@
+import hashlib
+
 import pytest
 
 from biorust import DNA, complement
@@ -43,6 +45,26 @@ def test_construction_and_basic_ops():
     assert str(2 * seq3) == "ATCATCGATCGATCATCGATCG"
 
 
+def test_str_and_repr():
+    seq = DNA("ACgtN")
+    assert str(seq) == "ACgtN"
+    assert repr(seq) == 'DNA("ACgtN")'
+    assert str(DNA("")) == ""
+    assert repr(DNA("")) == 'DNA("")'
+
+
+def test_buffer_is_read_only_view():
+    seq = DNA("ACgtN")
+    view = memoryview(seq)
+    assert view.readonly
+    assert view.tobytes() == b"ACgtN" == bytes(seq)
+    assert len(view) == len(seq)
+    with pytest.raises(TypeError):
+        view[0] = ord("T")
+    assert hashlib.md5(seq).digest() == hashlib.md5(b"ACgtN").digest()
+    assert memoryview(DNA("")).tobytes() == b""
+
+
 def test_strict_operators():
     with pytest.raises(TypeError):
         DNA("AC") + "TT"
@@ -92,6 +114,17 @@ def test_contains():
     assert "" in s
 
 
+def test_single_residue_results_are_shared():
+    s = DNA("ACGTA")
+
+    assert s[0] is s[4]
+    assert s[0] is s[-1:]
+    assert s[0] is DNA("TTA")[2]
+    assert s[1] is not s[0]
+    assert str(s[3]) == "T"
+    assert str(s[0:2]) == "AC"
+
+
 def test_startswith_endswith():
     s = DNA("ACGTACGT")
 
@@ -113,6 +146,22 @@ def test_startswith_endswith():
     assert s.endswith("AC", 0, 4) is False
 
 
+def test_startswith_endswith_mixed_tuple():
+    s = DNA("ACGTACGT")
+
+    assert s.startswith((b"TT", DNA("GG"), 65))
+    assert s.startswith(("TT", b"AC"))
+    assert s.startswith((b"CG", "GT"), 1) is False
+    assert s.endswith((84, "AA"))
+    assert s.endswith((DNA("CC"), b"CGT"))
+    assert s.startswith(()) is False
+
+    # Alternatives are checked in order, so a bad item after a hit is never seen.
+    assert s.startswith(("AC", 1.5))
+    with pytest.raises(TypeError):
+        s.startswith(("TT", 1.5))
+
+
 def test_split_rsplit():
     s = DNA("ACGTACGT")
 
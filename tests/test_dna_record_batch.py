@@ -13,6 +13,15 @@ def test_dna_record_batch_basic():
     assert [str(s) for s in batch.seqs().to_list()] == ["ATGC", "AACG"]
 
 
+def test_dna_record_batch_to_id_seq_pairs():
+    r1 = DNARecord("id1", DNA("ATGC"), "desc1")
+    r2 = DNARecord("id2", DNA("AACG"), None)
+    batch = DNARecordBatch([r1, r2])
+
+    assert batch.to_id_seq_pairs() == [("id1", "ATGC"), ("id2", "AACG")]
+    assert DNARecordBatch([]).to_id_seq_pairs() == []
+
+
 def test_dna_record_batch_slice_alignment():
     r1 = DNARecord("id1", DNA("ATGC"), "desc1")
     r2 = DNARecord("id2", DNA("AACG"), None)
@@ -8,6 +8,15 @@ def test_construction_from_str():
     assert len(seq) == 7
 
 
+def test_construction_from_bytes_like():
+    for data in (b"AC-GT.N", bytearray(b"AC-GT.N"), list(b"AC-GT.N")):
+        assert GappedDNA(data) == GappedDNA("AC-GT.N")
+    with pytest.raises(ValueError, match="invalid character"):
+        GappedDNA(b"AC#GT")
+    with pytest.raises(ValueError, match="expects str or bytes-like"):
+        GappedDNA(3.5)
+
+
 def test_invalid_char_rejected():
     with pytest.raises(ValueError, match="invalid character"):
         GappedDNA("AC#GT")
@@ -78,3 +87,12 @@ def test_index_out_of_range():
         seq[10]
     with pytest.raises(IndexError):
         seq[-6]
+
+
+def test_gapped_dna_batch():
+    from biorust._native import gapped_dna_batch
+
+    seqs = gapped_dna_batch(["AC-GT", "A.CGT", ""])
+    assert seqs == [GappedDNA("AC-GT"), GappedDNA("A.CGT"), GappedDNA("")]
+    with pytest.raises(ValueError, match="invalid character"):
+        gapped_dna_batch(["ACGT", "AC#GT"])
@@ -78,3 +78,12 @@ def test_index_out_of_range():
         seq[10]
     with pytest.raises(IndexError):
         seq[-6]
+
+
+def test_gapped_protein_batch():
+    from biorust._native import gapped_protein_batch
+
+    seqs = gapped_protein_batch(["AC-DE", "A.CDE"])
+    assert seqs == [GappedProtein("AC-DE"), GappedProtein("A.CDE")]
+    with pytest.raises(ValueError, match="invalid character"):
+        gapped_protein_batch(["ACDE", "AC#DE"])
@@ -63,6 +63,23 @@ class TestDistanceMatrixDNA:
         with pytest.raises(ValueError, match="unknown DNA distance model"):
             distance_matrix(aln, model="invalid")
 
+    def test_long_alignment_matches_python_reference(self):
+        # long enough to cross the native kernels' 16/32-site blocks
+        rows = [
+            "".join("ACGTacgtN-."[(i * 3 + r * (i % 5 == r)) % 11] for i in range(101))
+            for r in range(4)
+        ]
+        dm = distance_matrix(make_dna_alignment(list(zip("abcd", rows))))
+        for i in range(4):
+            for j in range(i + 1, 4):
+                sites = [
+                    (x.upper(), y.upper())
+                    for x, y in zip(rows[i], rows[j])
+                    if x.upper() in "ACGT" and y.upper() in "ACGT"
+                ]
+                diffs = sum(x != y for x, y in sites)
+                assert dm.get(i, j) == pytest.approx(diffs / len(sites))
+
 
 class TestDistanceMatrixProtein:
     def test_pdistance(self):
@@ -225,6 +242,11 @@ class TestAlignmentDiagram:
         cons = cons_line[-aln.width :]
         assert cons == "* *"
 
+    def test_single_row_all_conserved(self):
+        aln = AlignmentDNA([("a", GappedDNA("A-C."))])
+        cons = aln.alignment_diagram().splitlines()[-1][-aln.width :]
+        assert cons == "****"
+
     def test_empty_slice(self):
         aln = AlignmentDNA([("a", GappedDNA("ACGT")), ("b", GappedDNA("ACGT"))])
         empty = aln[:0]
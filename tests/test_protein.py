@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from biorust import Protein
@@ -29,6 +31,7 @@ def test_protein_basic_ops():
     last = seq1[-1]
     assert isinstance(last, Protein)
     assert str(last) == "D"
+    assert Protein("DAD")[0] is last
 
     # multiplication
     assert str(seq1 * 2) == "ACDACD"
@@ -41,6 +44,14 @@ def test_protein_basic_ops():
         "EF" + seq1
 
 
+def test_protein_buffer_is_read_only_view():
+    seq = Protein("MKV*")
+    view = memoryview(seq)
+    assert view.readonly
+    assert view.tobytes() == b"MKV*" == bytes(seq)
+    assert bytearray(seq) == bytearray(b"MKV*")
+
+
 def test_protein_count_contains_find():
     seq = Protein("AAAAA")
 
@@ -116,6 +127,18 @@ def test_protein_properties():
     assert charge_pi == pytest.approx(0.0, abs=1e-2)
 
 
+def test_protein_composition_repeats_and_slices():
+    seq = Protein("MKKLAaX")
+    for _ in range(2):
+        assert dict(seq.counts()) == {"M": 1, "K": 2, "L": 1, "A": 1, "a": 1, "X": 1}
+        assert dict(seq.aa_counts_20())["A"] == 2
+        assert dict(seq.frequencies())["K"] == pytest.approx(2 / 7)
+        entropy = -(5 * (1 / 7) * math.log2(1 / 7) + (2 / 7) * math.log2(2 / 7))
+        assert seq.shannon_entropy() == pytest.approx(entropy)
+    assert dict(seq[1:3].counts()) == {"K": 2}
+    assert dict((seq + seq).aa_counts_20())["K"] == 4
+
+
 def test_protein_ambiguity_helpers():
     seq = Protein("ACBX")
     assert seq.has_ambiguous() is True